@@ -0,0 +1,92 @@
+'''
+Run the benchmark suite, optionally storing or comparing to a baseline.
+
+Run from the repository root with e.g.::
+
+    python -m benchmarks
+    python -m benchmarks --filter lookup
+    python -m benchmarks --compare benchmarks/baseline.json
+    python -m benchmarks --save benchmarks/baseline.json
+
+Times are the best of several repeats, in seconds per call.
+Absolute numbers depend on the machine, so a stored baseline
+is only meaningful when compared on the same machine.
+'''
+from argparse import ArgumentParser
+import json
+import platform
+import sys
+import timeit
+
+from .suite import CASES
+
+
+def measure(setup, repeat=5, min_time=0.2):
+    '''Best time per call of the callable returned by setup'''
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    # autorange stops at 0.2 s, scale in case another min_time was requested
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:7.2f} {unit:>2}'
+    return f'{seconds / 1e-9:7.2f} ns'
+
+
+def main(args=None):
+    parser = ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n\n')[1])
+    parser.add_argument('-k', '--filter', help='Only run cases whose name contains this string')
+    parser.add_argument('--save', help='Store the results as json in this file')
+    parser.add_argument('--compare', help='Compare to the results stored in this file')
+    parser.add_argument(
+        '--tolerance', type=float, default=0.25,
+        help='Relative slowdown compared to the baseline reported as regression',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(args)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+
+    results = {}
+    regressions = []
+    width = max(len(name) for name in CASES)
+    for name, setup in CASES.items():
+        if args.filter and args.filter not in name:
+            continue
+
+        result = results[name] = measure(setup, repeat=args.repeat)
+        line = f'{name:<{width}}  {format_time(result)}'
+
+        if name in baseline:
+            ratio = result / baseline[name]
+            line += f'  {ratio:6.2f}x baseline'
+            if ratio > 1 + args.tolerance:
+                line += '  REGRESSION'
+                regressions.append(name)
+
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results,
+            }, f, indent=2)
+            f.write('\n')
+
+    if regressions:
+        print(f'{len(regressions)} regression(s) compared to {args.compare}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
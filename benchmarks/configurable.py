@@ -0,0 +1,75 @@
+'''
+Benchmark of ``Configurable.__init__``.
+
+Compares the precompiled instantiation plan to the generic
+``setattr`` / ``Item.__set__`` / ``validate`` path used before.
+
+Run from the repository root with ``python -m benchmarks.configurable``.
+'''
+from collections.abc import Mapping
+import timeit
+
+from config import Configurable, Float, Int, String
+
+
+class Flat(Configurable):
+    a = Int(1)
+    b = Int(2)
+    c = Float(3.0)
+    d = Float(4.0)
+    e = String('e')
+    f = String('f')
+    g = Int(7)
+    h = Float(8.0)
+
+
+def generic_init(self, config=None, **kwargs):
+    '''The generic __init__, validating every item on every construction'''
+    already_set = set()
+
+    for k, v in kwargs.items():
+        if k in self.__config__:
+            setattr(self, k, v)
+            already_set.add(k)
+        else:
+            raise TypeError(f'__init__ got an unexpected keyword argument {k}')
+
+    if config is not None:
+        if not isinstance(config, Mapping):
+            raise TypeError(f"config must be a mapping, got {config}")
+
+        for k in set(config).difference(already_set):
+            if k not in self.__config__:
+                raise ValueError(f'Unknown config key "{k}"')
+
+            val = self.__config__[k].from_config(config[k])
+            setattr(self, k, val)
+            already_set.add(k)
+
+    for k in set(self.__config__).difference(already_set):
+        setattr(self, k, self.__config__[k].get_default())
+
+
+class FlatGeneric(Flat):
+    __init__ = generic_init
+
+
+def instances_per_second(create, number=20000):
+    return number / timeit.timeit(create, number=number)
+
+
+def main():
+    cases = {
+        'defaults': ((), {}),
+        'config': ((), {'config': {'a': 10, 'c': 1.5}}),
+        'kwargs': ((), {'a': 10, 'e': 'foo'}),
+    }
+    print(f'{"case":<10} {"generic / s":>12} {"plan / s":>12} {"speedup":>8}')
+    for name, (args, kwargs) in cases.items():
+        before = instances_per_second(lambda: FlatGeneric(*args, **kwargs))
+        after = instances_per_second(lambda: Flat(*args, **kwargs))
+        print(f'{name:<10} {before:>12.0f} {after:>12.0f} {after / before:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
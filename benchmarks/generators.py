@@ -0,0 +1,71 @@
+'''
+Generators of synthetic configurable classes and configs for the benchmarks.
+'''
+from config import Configurable, ConfigurableInstance, Float, Int, String, Lookup
+from config.items.lookup import LookupDatabase
+
+
+def make_flat_class(n_items=10, name='Flat'):
+    '''A Configurable with ``n_items`` basic items, cycling through Int, Float and String'''
+    namespace = {}
+    for i in range(n_items):
+        kind = i % 3
+        if kind == 0:
+            namespace[f'int_{i}'] = Int(i)
+        elif kind == 1:
+            namespace[f'float_{i}'] = Float(float(i))
+        else:
+            namespace[f'string_{i}'] = String(str(i))
+    return type(name, (Configurable, ), namespace)
+
+
+def make_nested_class(depth=5, n_items=5, name='Nested'):
+    '''
+    A chain of ``depth`` Configurables, each having ``n_items`` basic items
+    and the next level as ConfigurableInstance member.
+    '''
+    cls = make_flat_class(n_items, name=f'{name}{depth}')
+    for level in range(depth - 1, 0, -1):
+        namespace = dict(make_flat_class(n_items).__config__)
+        namespace['child'] = ConfigurableInstance(cls, default_config={'int_0': level})
+        cls = type(f'{name}{level}', (Configurable, ), namespace)
+    return cls
+
+
+def make_wide_class(n_children=20, n_items=10, n_subclasses=3, name='Wide'):
+    '''
+    A Configurable with ``n_children`` ConfigurableInstance members,
+    each with ``n_items`` items and ``n_subclasses`` selectable subclasses.
+
+    The subclasses are kept in ``subclasses`` of the returned class,
+    the subclass registry only holds weak references.
+    '''
+    base = make_flat_class(n_items, name=f'{name}Child')
+    subclasses = [
+        type(f'{name}Child{i}', (base, ), {'lookup': Lookup(Float(1.0), ('type', 'id'))})
+        for i in range(n_subclasses)
+    ]
+
+    namespace = {
+        f'child_{i}': ConfigurableInstance(base, default_config={'int_0': i})
+        for i in range(n_children)
+    }
+    namespace['subclasses'] = subclasses
+    return type(name, (Configurable, ), namespace)
+
+
+def make_lookup_database(n_rules, cache_size=0):
+    '''Half of the rules are per telescope type, the other half per telescope id'''
+    lookups = []
+    for i in range(n_rules // 2):
+        lookups.append(('type', f'type_{i}', float(i)))
+        lookups.append(('id', i, float(i)))
+
+    return LookupDatabase(Float(5.0), ('type', 'id'), lookups=lookups, cache_size=cache_size)
+
+
+def make_nested_dict(depth=3, width=10, value=0):
+    '''A dict with ``width`` keys per level and ``width ** depth`` leaves'''
+    if depth == 0:
+        return value
+    return {f'key_{i}': make_nested_dict(depth - 1, width, value) for i in range(width)}
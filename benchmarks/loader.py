@@ -0,0 +1,70 @@
+'''
+Benchmark of merging large multi-file configs.
+
+Compares ``ConfigLoader`` to deep copying every layer
+and merging it with ``recursive_update``.
+
+Run from the repository root with ``python -m benchmarks.loader``.
+'''
+from copy import deepcopy
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import json
+import timeit
+
+from config.dict_handling import recursive_update
+from config.loader import ConfigLoader
+
+
+def make_config(n_sections, n_keys, value=0):
+    return {
+        f'section_{i}': {f'key_{j}': value for j in range(n_keys)}
+        for i in range(n_sections)
+    }
+
+
+def write_layers(directory, n_sections=200, n_keys=200):
+    '''A large base file and smaller override files touching a few sections'''
+    paths = [Path(directory) / 'base.json']
+    paths[0].write_text(json.dumps(make_config(n_sections, n_keys)))
+
+    for layer in range(1, 4):
+        path = Path(directory) / f'layer_{layer}.json'
+        path.write_text(json.dumps(make_config(5 * layer, 10, value=layer)))
+        paths.append(path)
+
+    return paths
+
+
+def eager_merge(layers):
+    config = {}
+    for layer in layers:
+        recursive_update(config, deepcopy(layer))
+    return config
+
+
+def main(number=20):
+    with TemporaryDirectory() as directory:
+        paths = write_layers(directory)
+        loader = ConfigLoader(*paths)
+
+        first = timeit.timeit(loader.load, number=1)
+        repeated = timeit.timeit(loader.load, number=number) / number
+
+        view = timeit.timeit(
+            lambda: loader.view()['section_3']['key_7'], number=number,
+        ) / number
+
+        layers = [json.loads(path.read_text()) for path in paths]
+        eager = timeit.timeit(lambda: eager_merge(layers), number=number) / number
+
+        assert loader.load() == eager_merge(layers)
+
+    print(f'first load (parsing) : {first * 1e3:8.2f} ms')
+    print(f'ConfigLoader.load    : {repeated * 1e3:8.2f} ms')
+    print(f'ConfigLoader.view + one read: {view * 1e3:8.2f} ms')
+    print(f'deepcopy + recursive_update: {eager * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+'''
+Benchmark of ``LookupDatabase`` resolution for a growing number of rules.
+
+Run from the repository root with ``python -m benchmarks.lookup``.
+'''
+import timeit
+
+from .generators import make_lookup_database
+
+
+N_RULES = (10, 100, 1000, 10000)
+N_CALLS = 10000
+
+
+def make_database(n_rules):
+    # disable the memo, we want to measure the resolution itself
+    return make_lookup_database(n_rules, cache_size=0)
+
+
+def time_lookup(database, key, n_calls=N_CALLS):
+    '''Time per lookup in seconds'''
+    total = timeit.timeit(lambda: database[key], number=n_calls)
+    return total / n_calls
+
+
+def main():
+    print(f'{"rules":>8} {"id hit / µs":>12} {"type hit / µs":>14} {"miss / µs":>10}')
+    for n_rules in N_RULES:
+        database = make_database(n_rules)
+        last = n_rules // 2 - 1
+        id_hit = time_lookup(database, ('unknown', last))
+        type_hit = time_lookup(database, (f'type_{last}', -1))
+        miss = time_lookup(database, ('unknown', -1))
+        print(f'{n_rules:>8} {id_hit * 1e6:>12.3f} {type_hit * 1e6:>14.3f} {miss * 1e6:>10.3f}')
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+
+    # batch lookup compared to a python loop, for one event of 100 telescopes
+    database = make_database(1000)
+    types = np.array([f'type_{i % 4}' for i in range(100)])
+    tel_ids = np.arange(100)
+    loop = timeit.timeit(
+        lambda: [database[t, i] for t, i in zip(types.tolist(), tel_ids.tolist())],
+        number=1000,
+    )
+    batch = timeit.timeit(lambda: database.lookup_many(types, tel_ids), number=1000)
+    print(f'100 lookups: loop {loop * 1e3:.1f} µs, lookup_many {batch * 1e3:.1f} µs')
+
+
+if __name__ == '__main__':
+    main()
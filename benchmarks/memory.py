@@ -0,0 +1,69 @@
+'''
+Memory used by schemas, lookup databases and configurable instances,
+measured with tracemalloc.
+
+Run from the repository root with ``python -m benchmarks.memory``.
+'''
+import gc
+import tracemalloc
+
+from config import slotted
+
+from .generators import make_flat_class, make_lookup_database
+
+
+N_ITEMS = (100, 1000, 10000)
+N_RULES = (100, 1000, 10000)
+N_INSTANCES = 10000
+
+
+def allocated(func, *args):
+    '''Bytes still allocated after calling func, and its result'''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def make_items(n_items):
+    '''The items of a schema, without the class holding them'''
+    return list(make_flat_class(n_items).__config__.values())
+
+
+def make_instances(cls, n_instances):
+    return [cls() for _ in range(n_instances)]
+
+
+def main():
+    print(f'{"items":>8} {"total / kB":>11} {"per item / B":>13}')
+    for n_items in N_ITEMS:
+        size, _ = allocated(make_items, n_items)
+        print(f'{n_items:>8} {size / 1e3:>11.1f} {size / n_items:>13.1f}')
+
+    print()
+    print(f'{"rules":>8} {"total / kB":>11} {"per rule / B":>13}')
+    for n_rules in N_RULES:
+        size, _ = allocated(make_lookup_database, n_rules)
+        print(f'{n_rules:>8} {size / 1e3:>11.1f} {size / n_rules:>13.1f}')
+
+    print()
+    print(f'{N_INSTANCES} instances')
+    print(f'{"items":>8} {"dict / B":>9} {"slotted / B":>12}')
+    for n_items in (5, 20):
+        cls = make_flat_class(n_items)
+        slotted_cls = slotted(make_flat_class(n_items, name='Slotted'))
+        sizes = [
+            allocated(make_instances, c, N_INSTANCES)[0] / N_INSTANCES
+            for c in (cls, slotted_cls)
+        ]
+        print(f'{n_items:>8} {sizes[0]:>9.1f} {sizes[1]:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
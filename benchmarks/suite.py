@@ -0,0 +1,183 @@
+'''
+The benchmark cases run by ``python -m benchmarks``.
+
+Each case is a function returning the callable to time,
+registered with the `case` decorator, optionally for several parameters.
+'''
+from itertools import product
+from pathlib import Path as PathlibPath
+from tempfile import TemporaryDirectory
+
+from config import Configurable, Float, Int, List, Path, slotted
+from config.cli import build_parser
+from config.items.path import stat_cache
+from config.dict_handling import recursive_update
+
+from .generators import (
+    make_flat_class,
+    make_lookup_database,
+    make_nested_class,
+    make_nested_dict,
+    make_wide_class,
+)
+
+
+#: name -> zero argument function returning the callable to time
+CASES = {}
+
+
+def case(name, **params):
+    '''Register a benchmark case for all combinations of ``params``'''
+    def decorator(setup):
+        keys = list(params)
+        for values in product(*params.values()):
+            kwargs = dict(zip(keys, values))
+            suffix = ','.join(f'{k}={v}' for k, v in kwargs.items())
+            full_name = f'{name}[{suffix}]' if suffix else name
+            CASES[full_name] = (lambda kwargs=kwargs: setup(**kwargs))
+        return setup
+    return decorator
+
+
+@case('configurable.init_flat', n_items=[10, 100])
+def init_flat(n_items):
+    cls = make_flat_class(n_items)
+    return cls
+
+
+@case('configurable.init_flat_config', n_items=[10, 100])
+def init_flat_config(n_items):
+    cls = make_flat_class(n_items)
+    config = {k: v.get_default() for k, v in list(cls.__config__.items())[::2]}
+    return lambda: cls(config=config)
+
+
+@case('configurable.init_slotted', n_items=[10, 100])
+def init_slotted(n_items):
+    return slotted(make_flat_class(n_items, name='Slotted'))
+
+
+@case('configurable.init_nested', depth=[2, 8])
+def init_nested(depth):
+    return make_nested_class(depth)
+
+
+@case('configurable.reconfigure', n_children=[10, 100])
+def reconfigure(n_children):
+    instance = make_wide_class(n_children)()
+    values = iter(range(10**9))
+    return lambda: instance.reconfigure({'child_0': {'int_0': next(values)}})
+
+
+@case('cli.build_parser', args=['', '--help'])
+def cli_build_parser(args):
+    cls = make_wide_class(100)
+    args = args.split()
+    return lambda: build_parser(cls, args)
+
+
+@case('items.set', value=[1, 2.5])
+def items_set(value):
+    cls = type('Values', (Configurable, ), {'int': Int(0), 'float': Float(0.0)})
+    instance = cls()
+    name = 'int' if isinstance(value, int) else 'float'
+
+    def set_value():
+        setattr(instance, name, value)
+
+    return set_value
+
+
+@case('lookup.hit', n_rules=[10, 1000, 100000])
+def lookup_hit(n_rules):
+    database = make_lookup_database(n_rules)
+    key = ('unknown', n_rules // 2 - 1)
+    return lambda: database[key]
+
+
+@case('lookup.miss', n_rules=[10, 1000, 100000])
+def lookup_miss(n_rules):
+    database = make_lookup_database(n_rules)
+    key = ('unknown', -1)
+    return lambda: database[key]
+
+
+@case('lookup.memo_hit', n_rules=[1000])
+def lookup_memo_hit(n_rules):
+    database = make_lookup_database(n_rules, cache_size=1024)
+    key = ('unknown', n_rules // 2 - 1)
+    return lambda: database[key]
+
+
+@case('export.get_config', n_children=[10, 100])
+def get_config(n_children):
+    instance = make_wide_class(n_children)()
+    return instance.get_config
+
+
+@case('export.get_config_uncached', n_children=[10, 100])
+def get_config_uncached(n_children):
+    instance = make_wide_class(n_children)()
+    children = [getattr(instance, f'child_{i}') for i in range(n_children)]
+
+    def get_config():
+        # assigning an item of each child invalidates the cached configs of the whole tree,
+        # so the full export is timed, not the copy of the cached config
+        for child in children:
+            child.int_0 = 0
+        return instance.get_config()
+
+    return get_config
+
+
+@case('export.get_default_config', n_children=[10, 100])
+def get_default_config(n_children):
+    return make_wide_class(n_children).get_default_config
+
+
+@case('export.get_config_tree', n_children=[10, 100])
+def get_config_tree(n_children):
+    return make_wide_class(n_children).get_config_tree
+
+
+@case('dict.recursive_update', depth=[3, 4])
+def dict_recursive_update(depth):
+    base = make_nested_dict(depth)
+    override = make_nested_dict(depth, value=1)
+    return lambda: recursive_update(base, override, copy=True)
+
+
+@case('path.validate', exists=[None, True])
+def path_validate(exists):
+    directory = TemporaryDirectory()
+    path = PathlibPath(directory.name) / 'file.txt'
+    path.touch()
+    item = Path(exists=exists, dir_okay=False)
+
+    # keep a reference to directory, so it is removed with the callable
+    def validate(directory=directory):
+        return item.validate(path)
+
+    return validate
+
+
+@case('path.validate_stat_cache', exists=[True])
+def path_validate_stat_cache(exists):
+    directory = TemporaryDirectory()
+    path = PathlibPath(directory.name) / 'file.txt'
+    path.touch()
+    item = Path(exists=exists, dir_okay=False)
+
+    def validate(directory=directory):
+        with stat_cache():
+            for _ in range(10):
+                item.validate(path)
+
+    return validate
+
+
+@case('containers.list_float', n_values=[1000, 100000])
+def list_float(n_values):
+    item = List(Float())
+    values = [float(i) for i in range(n_values)]
+    return lambda: item.validate(values)
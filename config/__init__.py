@@ -1,4 +1,5 @@
 from .configurable import Configurable
+from .slotted import slotted
 from .item import Item
 from .exceptions import ConfigError
 from .items import (
@@ -7,6 +8,7 @@ from .items import (
     Int, Float, Path, String,
     Lookup,
     LookupDatabase,
+    List, Set, Dict,
 )
 
 
@@ -15,6 +17,7 @@ __version__ = '0.1.0a0'
 
 __all__ = [
     'Configurable',
+    'slotted',
     'Item',
     'ConfigError',
     'Object',
@@ -25,4 +28,7 @@ __all__ = [
     'String',
     'Lookup',
     'LookupDatabase',
+    'List',
+    'Set',
+    'Dict',
 ]
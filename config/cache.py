@@ -0,0 +1,206 @@
+'''
+Disk cache of fully created configurable object trees.
+
+Creating a large tree means parsing the config files, validating all values
+and instantiating all members, lookup tables and paths. `ResolvedConfigCache`
+stores the created tree as pickle, keyed by the contents of the config
+sources and the item definitions of all classes reachable from the root
+class. Later starts with unchanged sources and classes load the pickle
+instead::
+
+    cache = ResolvedConfigCache('~/.cache/myapp')
+    processor = cache.load(ImageProcessor, 'config.toml', EnvSource('MYAPP_'))
+
+The cache directory must only be writable by trusted users,
+as loading a pickle can execute arbitrary code.
+'''
+from collections.abc import Mapping
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+import warnings
+
+from .fingerprint import encode
+from .item import Item
+from .loader import ConfigLoader, FileSource, _as_source
+
+
+__all__ = [
+    'ResolvedConfigCache',
+    'schema_hash',
+]
+
+
+#: item attributes that do not define the schema, e.g. caches
+_IGNORED_SETTINGS = {'configurable', 'name', '_validator', '_default_template'}
+
+
+def _qualified_name(cls):
+    return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def _canonical(value):
+    '''
+    value in a form `config.fingerprint.encode` supports.
+
+    Items and classes are replaced by their definition, other unsupported
+    values by their repr, unless that contains a memory address.
+    '''
+    if isinstance(value, Item):
+        return _item_definition(value)
+    if isinstance(value, type):
+        return _qualified_name(value)
+    if isinstance(value, Mapping):
+        return {_canonical(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_canonical(v) for v in value)
+
+    try:
+        encode(value)
+    except TypeError:
+        text = repr(value)
+        # the default repr contains the address, which differs between processes
+        return _qualified_name(type(value)) if ' at 0x' in text else text
+    return value
+
+
+def _item_definition(item):
+    '''The class, settings and default config of item'''
+    settings = {
+        k: _canonical(v) for k, v in item.__getstate__().items()
+        if k not in _IGNORED_SETTINGS
+    }
+    return [_qualified_name(type(item)), settings, _canonical(item.get_default_config())]
+
+
+def _schema_entries(cls, seen):
+    # to avoid circular import
+    from .items import ConfigurableInstance
+
+    if cls in seen:
+        return
+    seen.add(cls)
+
+    yield encode(f'class {_qualified_name(cls)}')
+    for name, item in cls.__config__.items():
+        yield encode([name, _item_definition(item)])
+
+        if isinstance(item, ConfigurableInstance):
+            # any subclass might be selected by the config
+            subclasses = item.cls.get_nonabstract_subclasses()
+            for subclass_name in sorted(subclasses):
+                yield from _schema_entries(subclasses[subclass_name], seen)
+
+
+def schema_hash(cls):
+    '''
+    sha256 hex digest of the item definitions of ``cls`` and all classes
+    its members can be instances of.
+    '''
+    digest = hashlib.sha256()
+    for entry in _schema_entries(cls, set()):
+        digest.update(entry)
+    return digest.hexdigest()
+
+
+def _source_bytes(source):
+    '''Bytes identifying the config a source provides'''
+    if isinstance(source, FileSource):
+        try:
+            content = source.path.read_bytes()
+        except FileNotFoundError:
+            if not source.optional:
+                raise
+            content = b''
+        return str(source.path).encode() + b'\0' + content
+
+    if not isinstance(source, Mapping):
+        source = source.load()
+
+    return json.dumps(source, sort_keys=True, default=repr).encode()
+
+
+class ResolvedConfigCache:
+    '''
+    Cache of configurable instances created from config sources.
+
+    Attributes
+    ----------
+    directory: pathlib.Path
+        Where the snapshots are stored, created if needed
+    '''
+    def __init__(self, directory):
+        self.directory = pathlib.Path(directory).expanduser()
+
+    def key(self, cls, *sources):
+        '''
+        Key of the snapshot for ``cls`` created from ``sources``.
+
+        Sources are the same as for `~config.loader.ConfigLoader`,
+        files are hashed by their content and not parsed.
+        '''
+        # to avoid circular import
+        from . import __version__
+
+        digest = hashlib.sha256()
+        digest.update(f'{sys.version_info[:2]} {__version__}\n'.encode())
+        digest.update(schema_hash(cls).encode())
+        for source in sources:
+            digest.update(b'\0')
+            digest.update(_source_bytes(_as_source(source)))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return self.directory / f'{key}.pickle'
+
+    def load(self, cls, *sources):
+        '''
+        Return the instance of ``cls`` created from the merged config of sources.
+
+        Loaded from the snapshot if one exists for the current sources
+        and classes, otherwise it is created and the snapshot is written.
+        '''
+        sources = [_as_source(source) for source in sources]
+        path = self.path(self.key(cls, *sources))
+
+        try:
+            with open(path, 'rb') as f:
+                instance = pickle.load(f)
+            if type(instance) is cls:
+                return instance
+        except Exception:
+            # a missing or broken snapshot is just recreated
+            pass
+
+        instance = cls(config=ConfigLoader(*sources).load())
+        self._write(path, instance)
+        return instance
+
+    def _write(self, path, instance):
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, so that concurrent readers
+        # never see an incomplete snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(instance, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            # e.g. classes defined in a function, the instance is still usable
+            os.unlink(tmp_path)
+            warnings.warn(f'Could not cache {instance.__class__.__name__}: {e}')
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self):
+        '''Remove all snapshots'''
+        for path in self.directory.glob('*.pickle'):
+            path.unlink()
@@ -0,0 +1,260 @@
+'''
+Command line interfaces generated from the config items of a `Configurable`.
+
+Every item is exposed as ``--path.to.item`` option, the class of
+`ConfigurableInstance` members is selected with ``--path.to.member.cls``,
+e.g. for the ``ImageProcessor`` of the README::
+
+    $ myapp --cleaning.cls=BetterCleaning --cleaning.level=3.0
+
+The parser is built in two phases. First, the ``cls`` options and the
+``cls`` entries of the config files are resolved to find the classes of all members. Then, options are only added for the
+items of the selected classes and, unless ``--help`` is requested,
+only for the options actually given on the command line.
+This keeps the startup fast even for config trees with thousands of items.
+'''
+from argparse import ArgumentParser
+from collections.abc import Mapping
+import json
+import sys
+
+from .exceptions import ConfigError
+from .loader import ConfigLoader
+from .items import ConfigurableInstance, List, Lookup, Object, Path, Set
+
+
+__all__ = [
+    'build_parser',
+    'parse_config',
+]
+
+
+def _parse_value(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _is_string_item(item):
+    return isinstance(item, Path) or (isinstance(item, Object) and item.type is str)
+
+
+def _argument_kwargs(item):
+    '''Keyword arguments for ``add_argument`` of a non-configurable item'''
+    kwargs = {'metavar': type(item).__name__.upper()}
+
+    if isinstance(item, (List, Set)):
+        kwargs['nargs'] = '*'
+        kwargs['metavar'] = type(item.item).__name__.upper()
+        item = item.item
+    elif isinstance(item, Lookup):
+        # a single value is used as default of the lookup
+        kwargs['metavar'] = type(item.item).__name__.upper()
+        item = item.item
+
+    kwargs['type'] = str if _is_string_item(item) else _parse_value
+    return kwargs
+
+
+def _help(item, default):
+    text = f'{item.help} (default: {default})' if item.help else f'default: {default}'
+    # argparse uses %-formatting for help strings
+    return text.replace('%', '%%')
+
+
+def _walk(cls, selected, prefix=''):
+    '''
+    Yield (path, item, subclass) for all items reachable with the
+    classes in ``selected``, which maps paths of ConfigurableInstance
+    items to the selected class.
+
+    subclass is the class of the member for ConfigurableInstance items,
+    None for all other items.
+    '''
+    for name, item in cls.__config__.items():
+        path = prefix + name
+        if isinstance(item, ConfigurableInstance):
+            subclass = selected.get(path)
+            if subclass is None:
+                subclass = item._get_default_template()[0]
+
+            yield path, item, subclass
+            yield from _walk(subclass, selected, path + '.')
+        else:
+            yield path, item, None
+
+
+def _add_config_file_option(parser):
+    parser.add_argument(
+        '--config-file',
+        action='append',
+        default=[],
+        help='Config file in json, toml or yaml format, can be given multiple times'
+             ', later files take precedence. Options override the config files.',
+    )
+
+
+def _config_file_cls(config, path):
+    '''The ``cls`` entry at the dotted path in a loaded config, None if not given'''
+    node = config
+    for key in path.split('.'):
+        if not isinstance(node, Mapping):
+            return None
+        node = node.get(key)
+    return node.get('cls') if isinstance(node, Mapping) else None
+
+
+def _select_classes(cls, args):
+    '''
+    Resolve the ``cls`` options in args and the ``cls`` entries
+    of the config files given in args, options take precedence.
+
+    Selecting a class makes the ``cls`` options of its members available,
+    so this is repeated until no new class is selected.
+    '''
+    parser = ArgumentParser(add_help=False, allow_abbrev=False)
+    _add_config_file_option(parser)
+    config_files = parser.parse_known_args(args)[0].config_file
+    file_config = ConfigLoader(*config_files).load() if config_files else {}
+
+    selected = {}
+    while True:
+        parser = ArgumentParser(add_help=False, allow_abbrev=False)
+        items = {}
+        for path, item, subclass in _walk(cls, selected):
+            if subclass is not None:
+                items[path] = item
+                parser.add_argument(f'--{path}.cls', dest=path)
+
+        namespace, _ = parser.parse_known_args(args)
+        new_selected = {}
+        for path, name in vars(namespace).items():
+            if name is None:
+                name = _config_file_cls(file_config, path)
+            if name is None:
+                continue
+            try:
+                new_selected[path] = items[path]._resolve_cls(name)
+            except ConfigError:
+                # reported by the final parser, which has the valid choices
+                pass
+
+        if new_selected == selected:
+            return selected
+        selected = new_selected
+
+
+def _option_names(args):
+    '''Names of the long options given in args, without the leading ``--``'''
+    names = set()
+    for arg in args:
+        if arg == '--':
+            break
+        if arg.startswith('--'):
+            names.add(arg[2:].partition('=')[0])
+    return names
+
+
+def build_parser(cls, args=None, **kwargs):
+    '''
+    Build an `argparse.ArgumentParser` for the config of ``cls``.
+
+    Parameters
+    ----------
+    cls: type
+        The `Configurable` at the root of the config tree
+    args: list of str or None
+        The command line arguments, defaults to ``sys.argv[1:]``.
+        Needed to know the selected classes and to only
+        add the options that are used.
+    **kwargs
+        Passed to `argparse.ArgumentParser`
+
+    Returns
+    -------
+    parser: argparse.ArgumentParser
+        Options are stored as dotted path in the namespace,
+        options not given are not in the namespace.
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    selected = _select_classes(cls, args)
+
+    # all options are only needed for the help
+    given = _option_names(args)
+    full = 'help' in given or '-h' in args
+
+    # options are only added if given, so they cannot be abbreviated
+    kwargs.setdefault('allow_abbrev', False)
+    parser = ArgumentParser(**kwargs)
+    _add_config_file_option(parser)
+
+    groups = {'': parser.add_argument_group(f'{cls.__name__} options')}
+    for path, item, subclass in _walk(cls, selected):
+        # the group of a member is created before the ones of its items
+        prefix, _, _ = path.rpartition('.')
+
+        if subclass is not None:
+            groups[path] = parser.add_argument_group(f'{path} options ({subclass.__name__})')
+            option = f'{path}.cls'
+            if full or option in given:
+                groups[path].add_argument(
+                    f'--{option}',
+                    dest=option,
+                    default=None,
+                    choices=sorted(item.cls.get_nonabstract_subclasses()),
+                    help=_help(item, subclass.__name__),
+                )
+            continue
+
+        if full or path in given:
+            default = (item.item if isinstance(item, Lookup) else item).get_default_config()
+            groups[prefix].add_argument(
+                f'--{path}',
+                dest=path,
+                default=None,
+                help=_help(item, default),
+                **_argument_kwargs(item),
+            )
+
+    return parser
+
+
+def _nest(options):
+    '''Convert a mapping of dotted paths to values into a nested dict'''
+    config = {}
+    for path, value in options.items():
+        *keys, last = path.split('.')
+        node = config
+        for key in keys:
+            node = node.setdefault(key, {})
+        node[last] = value
+    return config
+
+
+def parse_config(cls, args=None, **kwargs):
+    '''
+    Parse the command line into a config for ``cls``.
+
+    Config files given with ``--config-file`` are merged, using
+    `~config.loader.ConfigLoader`, options given on the command line
+    take precedence.
+
+    ::
+
+        config = parse_config(ImageProcessor, ['--cleaning.level=5'])
+        processor = ImageProcessor(config=config)
+
+    See `build_parser` for the parameters.
+    '''
+    if args is None:
+        args = sys.argv[1:]
+
+    parser = build_parser(cls, args, **kwargs)
+    namespace = vars(parser.parse_args(args))
+    config_files = namespace.pop('config_file')
+
+    options = {k: v for k, v in namespace.items() if v is not None}
+    return ConfigLoader(*config_files, _nest(options)).load()
@@ -1,11 +1,183 @@
 from inspect import isabstract
+from collections import namedtuple
 from collections.abc import Mapping
+import hashlib
+from time import perf_counter
+import weakref
 
-from .item import Item
+from .item import Item, EXPORT_STATE
+from .exceptions import ConfigError
+from .fingerprint import encode
+from .frozen import is_immutable
+from . import profiling
+
+
+#: Result of `Configurable.reconfigure`, ``changed`` and ``rebuilt``
+#: are the dotted paths of the modified items, ``duration`` is in seconds
+ReconfigureReport = namedtuple('ReconfigureReport', ['changed', 'rebuilt', 'duration'])
+
+
+def _config_equal(a, b):
+    '''Compare config values, values like numpy arrays count as different'''
+    try:
+        return bool(a == b)
+    except (ValueError, TypeError):
+        return False
+
+
+def _copy_config(config):
+    '''Copy the dicts and lists of a config, other values are shared'''
+    return {
+        k: _copy_config(v) if type(v) is dict else list(v) if type(v) is list else v
+        for k, v in config.items()
+    }
+
+
+class ExportState:
+    '''
+    Cached config and fingerprint of a configurable instance.
+
+    Stored in the instance ``__dict__`` under ``config.item.EXPORT_STATE``.
+    Assigning an item invalidates the cache of the instance and,
+    through weak references, of all instances that exported it as member.
+
+    Attributes
+    ----------
+    config: dict or None
+        The cached result of ``get_config``, None if invalid
+    fingerprint: bytes or None
+        The cached sha256 digest of ``fingerprint``, None if invalid
+    version: int
+        Incremented on each invalidation, so that a config exported
+        concurrently to an invalidation is not stored
+    parents: list[weakref.ref]
+        The instances that have this instance as member
+    '''
+    __slots__ = ('config', 'fingerprint', 'version', 'parents')
+
+    def __init__(self):
+        self.config = None
+        self.fingerprint = None
+        self.version = 0
+        self.parents = []
+
+    def invalidate(self):
+        self.config = None
+        self.fingerprint = None
+        self.version += 1
+        for ref in self.parents:
+            parent = ref()
+            if parent is not None:
+                state = parent.__dict__.get(EXPORT_STATE)
+                if state is not None:
+                    state.invalidate()
+
+    def add_parent(self, parent):
+        for ref in self.parents:
+            if ref() is parent:
+                return
+
+        # drop parents that do not exist anymore
+        self.parents = [ref for ref in self.parents if ref() is not None]
+        self.parents.append(weakref.ref(parent))
+
+
+class InstantiationPlan:
+    '''
+    Precomputed steps to create an instance of a Configurable class.
+
+    Attributes
+    ----------
+    order: tuple[str]
+        Names of all config items, in definition order
+    defaults: dict
+        Validated, immutable defaults that can directly be stored
+        in the instance without going through the item
+    generic: tuple[str]
+        Names of the items that need ``item.get_default()`` and validation
+    lazy: tuple[str]
+        Names of the lazy ``ConfigurableInstance`` items, these
+        are stored as placeholders and created on first access
+    '''
+    __slots__ = ('order', 'defaults', 'generic', 'lazy')
+
+    def __init__(self, config):
+        self.order = tuple(config)
+        self.defaults = {}
+        generic = []
+        lazy = []
+
+        for name, item in config.items():
+            if getattr(item, 'lazy', False):
+                lazy.append(name)
+            elif self.has_shareable_default(item):
+                # the default or allow_none might have been changed since Object.__init__,
+                # invalid defaults raise on instantiation like other values
+                try:
+                    default = item.validate(item.default)
+                except ConfigError:
+                    generic.append(name)
+                    continue
+
+                if is_immutable(default):
+                    self.defaults[name] = default
+                else:
+                    # validation created a new mutable value, e.g. for containers
+                    generic.append(name)
+            else:
+                generic.append(name)
+
+        self.generic = tuple(generic)
+        self.lazy = tuple(lazy)
+
+    @staticmethod
+    def has_shareable_default(item):
+        '''
+        Whether the default of item is already validated and immutable,
+        so that it can be stored in all instances as is.
+        '''
+        # to avoid circular import
+        from .items import Object
+
+        item_type = type(item)
+        return (
+            isinstance(item, Object)
+            and item_type.__set__ is Item.__set__
+            and item_type.get_default is Object.get_default
+            and item._default_immutable
+        )
+
+
+def update_plans(item):
+    '''
+    Rebuild the plans of the classes using ``item``,
+    called when its default or ``allow_none`` changes.
+    '''
+    classes = [item.configurable()]
+    while classes:
+        cls = classes.pop()
+        if cls is None:
+            continue
+        classes.extend(cls.__subclasses__())
+        # classes without plan need config.slotted, they are never instantiated
+        if cls.__dict__.get('__plan__') is not None and cls.__config__.get(item.name) is item:
+            cls.__plan__ = InstantiationPlan(cls.__config__)
 
 
 class Configurable:
+    # so that subclasses decorated with ``config.slotted`` have no __dict__,
+    # other subclasses get one as usual. The slot holds the export state
+    # of slotted instances and of instances of Configurable itself.
+    __slots__ = (EXPORT_STATE, )
+
     __config__ = {}
+    __plan__ = None
+    # incremented for every new subclass, used to invalidate
+    # cached results depending on the set of existing classes
+    _generation = 0
+    # name -> class for this class and all its subclasses,
+    # weak so that dynamically created classes can be garbage collected
+    _subclass_registry = weakref.WeakValueDictionary()
 
 
     def __init_subclass__(cls):
@@ -15,6 +187,9 @@ class Configurable:
         Sets up the ``__config__`` dict as a class member
         and inherits the config items from the base classes.
         '''
+        # to avoid circular import
+        from .slotted import SlotItem
+
         # make sure each class gets it's own config dict
         cls.__config__ = {}
 
@@ -26,9 +201,46 @@ class Configurable:
 
         # but local ones override those of the base classes
         for k, v in cls.__dict__.items():
+            if isinstance(v, SlotItem):
+                v = v.item
             if isinstance(v, Item):
                 cls.__config__[k] = v
 
+        slotted_bases = any(
+            b is not Configurable and '_slot_members' in b.__dict__
+            for b in cls.__mro__[1:]
+        )
+        if slotted_bases and '__slots__' not in cls.__dict__:
+            # the __dict__ of the subclass would hide the values in the slots
+            cls.__plan__ = None
+        elif not slotted_bases and cls.__dictoffset__ == 0:
+            # __slots__ without config.slotted, there is nowhere to store the values.
+            # config.slotted creates the plan of the class it returns.
+            cls.__plan__ = None
+        else:
+            cls.__plan__ = InstantiationPlan(cls.__config__)
+
+        # register the new class with itself and all its configurable bases
+        cls._subclass_registry = weakref.WeakValueDictionary()
+        for base in cls.__mro__:
+            registry = base.__dict__.get('_subclass_registry')
+            if registry is not None:
+                registry[cls.__name__] = cls
+
+        Configurable._generation += 1
+
+    @property
+    def __dict__(self):
+        # subclasses have a real __dict__ or the view of config.slotted,
+        # for Configurable itself the view only holds the export state
+        if type(self) is not Configurable:
+            raise TypeError(
+                f'{self.__class__.__name__} has no __dict__, use config.slotted with __slots__'
+            )
+        # to avoid circular import
+        from .slotted import SlotValues
+        return SlotValues(self)
+
     def __init__(self, config=None, **kwargs):
         '''
         Initialize a new configurable instance.
@@ -39,14 +251,28 @@ class Configurable:
         All config items not specified in config or kwargs are instantiated
         from their defaults.
         '''
-        # keep track of which config items we already set
-        already_set = set()
+        profiler = profiling._active
+        if profiler is None:
+            self._configure(config, kwargs, None)
+        else:
+            # the outermost instance is the root of the item paths
+            segment = None if profiler.depth else self.__class__.__name__
+            profiler.call(segment, '__init__', self._configure, config, kwargs, profiler)
+
+    def _configure(self, config, kwargs, profiler):
+        items = self.__config__
+        plan = self.__plan__
+        if plan is None:
+            raise TypeError(
+                f'{self.__class__.__name__} declares __slots__ or is a subclass'
+                ' of a slotted class and must be decorated with config.slotted'
+            )
+        values = self.__dict__
 
         # first set / validate all attributes handed in via kwargs
         for k, v in kwargs.items():
-            if k in self.__config__:
+            if k in items:
                 setattr(self, k, v)
-                already_set.add(k)
             else:
                 raise TypeError(
                     f'__init__ got an unexpected keyword argument {k}'
@@ -57,38 +283,295 @@ class Configurable:
             if not isinstance(config, Mapping):
                 raise TypeError(f"config must be a mapping, got {config}")
 
-            for k in set(config).difference(already_set):
-                if k not in self.__config__:
+            for k, v in config.items():
+                if k in kwargs:
+                    continue
+
+                item = items.get(k)
+                if item is None:
                     raise ValueError(f'Unknown config key "{k}"')
 
-                val = self.__config__[k].from_config(config[k])
-                setattr(self, k, val)
-                already_set.add(k)
+                if k in plan.lazy:
+                    values[k] = item.defer(v)
+                elif profiler is None:
+                    setattr(self, k, item.from_config(v))
+                else:
+                    setattr(self, k, profiler.call(k, 'from_config', item.from_config, v))
 
         # set all remaining to their defaults
-        for k in set(self.__config__).difference(already_set):
-            setattr(self, k, self.__config__[k].get_default())
+        if not kwargs and not config:
+            values.update(plan.defaults)
+            for k in plan.generic:
+                setattr(self, k, self._get_default(items[k], profiler))
+            for k in plan.lazy:
+                values[k] = items[k].defer()
+            return
+
+        for k in plan.order:
+            if k in kwargs or (config and k in config):
+                continue
+
+            if k in plan.defaults:
+                values[k] = plan.defaults[k]
+            elif k in plan.lazy:
+                values[k] = items[k].defer()
+            else:
+                setattr(self, k, self._get_default(items[k], profiler))
+
+    @staticmethod
+    def _get_default(item, profiler):
+        if profiler is None:
+            return item.get_default()
+        return profiler.call(item.name, 'get_default', item.get_default)
 
     def get_config(self):
         '''
         Get the current config of an instance as dict.
+
+        The config is cached until an item of this instance or of one of
+        its members is assigned, so only changed subtrees are exported again.
+        Each call returns a new copy.
+
+        Changes of values in place, e.g. ``instance.values.append(1.0)``,
+        are not noticed and leave the cached config stale.
+        Assign the changed value again, ``instance.values = instance.values``,
+        to update it.
         '''
+        values = self.__dict__
+        state = values.get(EXPORT_STATE)
+        if state is None:
+            state = values[EXPORT_STATE] = ExportState()
+
+        config = state.config
+        if config is None:
+            version = state.version
+            config = self._export_config()
+            if state.version == version:
+                state.config = config
+
+        return _copy_config(config)
+
+    def _export_config(self):
         # to avoid circular import
         from .items import ConfigurableInstance
 
+        values = self.__dict__
         config = {}
         for k, item in self.__config__.items():
-            v = getattr(self, k)
             if isinstance(item, ConfigurableInstance):
-                config[k] = v.get_config()
-                # if the value is actually a subclass, we need include the name
-                if v.__class__ is not item.cls:
-                    config[k]['cls'] = v.__class__.__name__
+                # not getattr, which would create lazy members
+                value = values[k]
+                self._link_member(value)
+                config[k] = item.export_config(value)
             else:
-                config[k] = v
+                config[k] = item.export_config(getattr(self, k))
 
         return config
 
+    def _link_member(self, value):
+        '''Register self as parent of member value, so that its changes invalidate our caches'''
+        if isinstance(value, Configurable):
+            member_state = value.__dict__.get(EXPORT_STATE)
+            if member_state is None:
+                member_state = value.__dict__[EXPORT_STATE] = ExportState()
+            member_state.add_parent(self)
+
+    def fingerprint(self):
+        '''
+        sha256 hex digest of the class and the values of all items.
+
+        Equal for instances of the same class with equal values, independent
+        of the process, so it can be used as key of on-disk caches.
+        Values are encoded by ``item.encode_value``, members contribute
+        their own fingerprint. Like `get_config`, the digest is cached
+        per instance until an item of it or of one of its members is assigned,
+        so unchanged subtrees are not hashed again.
+        Lazy members that are not created yet are hashed from a temporary instance.
+
+        As for `get_config`, changes of values in place, e.g. appending to a
+        list, are not noticed: the cached fingerprint stays the same and would
+        give wrong hits in caches keyed by it. Assign changed values again,
+        ``instance.values = instance.values``, before using the fingerprint.
+        '''
+        return self._fingerprint_digest().hex()
+
+    def _fingerprint_digest(self):
+        values = self.__dict__
+        state = values.get(EXPORT_STATE)
+        if state is None:
+            state = values[EXPORT_STATE] = ExportState()
+
+        digest = state.fingerprint
+        if digest is None:
+            version = state.version
+            digest = self._compute_fingerprint()
+            if state.version == version:
+                state.fingerprint = digest
+
+        return digest
+
+    def _compute_fingerprint(self):
+        # to avoid circular import
+        from .items import ConfigurableInstance
+
+        cls = self.__class__
+        values = self.__dict__
+        digest = hashlib.sha256()
+        digest.update(encode(f'{cls.__module__}.{cls.__qualname__}'))
+        for k, item in self.__config__.items():
+            if isinstance(item, ConfigurableInstance):
+                value = values[k]
+                self._link_member(value)
+            else:
+                value = getattr(self, k)
+            digest.update(encode(k))
+            digest.update(item.encode_value(value))
+        return digest.digest()
+
+    def __getstate__(self):
+        # the export cache holds weak references, it is rebuilt on demand
+        state = dict(self.__dict__)
+        state.pop(EXPORT_STATE, None)
+        return state
+
+    def reconfigure(self, config):
+        '''
+        Apply config to this instance in place.
+
+        Unlike creating a new instance, only the items with values different
+        from `get_config` are set, items not in ``config`` are kept.
+        Members are only recreated if their ``cls`` changes, otherwise
+        their config is applied to them recursively.
+
+        All values are validated before anything is changed,
+        so an invalid config leaves the instance untouched.
+
+        Other threads can keep reading while the tree is reconfigured.
+        The new values of each instance are set on a copy of its ``__dict__``,
+        which then replaces the old one in a single assignment, so readers
+        of ``vars(instance)`` see either all or none of the changes of
+        that instance. Different instances of the tree are updated one
+        after the other. Concurrent calls of reconfigure on the same tree
+        are not supported.
+
+        Returns
+        -------
+        report: ReconfigureReport
+        '''
+        start = perf_counter()
+        changes = []
+        changed = []
+        rebuilt = []
+        self._collect_changes(config, '', changes, changed, rebuilt)
+
+        # stage the changes of each instance on a shadow object sharing the
+        # class, so they go through the items, then publish its dict at once
+        staged = {}
+        for instance, name, value, direct in changes:
+            entry = staged.get(id(instance))
+            if entry is None:
+                shadow = object.__new__(instance.__class__)
+                values = dict(instance.__dict__)
+                # the shadow must not share the export state, staging would
+                # invalidate it while readers still see the old values
+                state = values.get(EXPORT_STATE)
+                if EXPORT_STATE in values:
+                    values[EXPORT_STATE] = None
+                shadow.__dict__.update(values)
+                entry = staged[id(instance)] = (instance, shadow, state)
+
+            shadow = entry[1]
+            if direct:
+                shadow.__dict__[name] = value
+            else:
+                setattr(shadow, name, value)
+
+        for instance, shadow, state in staged.values():
+            values = shadow.__dict__
+            if state is not None:
+                values[EXPORT_STATE] = state
+            instance.__dict__ = values
+            # only after publishing, so that a config exported concurrently
+            # from the old values is discarded
+            if state is not None:
+                state.invalidate()
+
+        return ReconfigureReport(
+            changed=tuple(changed),
+            rebuilt=tuple(rebuilt),
+            duration=perf_counter() - start,
+        )
+
+    def _collect_changes(self, config, prefix, changes, changed, rebuilt):
+        '''
+        Validate the changes for reconfigure.
+
+        Appends (instance, name, value, direct) to changes, direct is True
+        for lazy placeholders and values already validated here, that are
+        stored without going through the item, and the paths of the modified
+        items to changed and rebuilt.
+        '''
+        # to avoid circular import
+        from .items import ConfigurableInstance
+        from .items.configurable import DeferredInstance
+        from .loader import merge
+
+        if not isinstance(config, Mapping):
+            raise TypeError(f"config must be a mapping, got {config}")
+
+        items = self.__config__
+        values = self.__dict__
+
+        for k, v in config.items():
+            item = items.get(k)
+            if item is None:
+                raise ValueError(f'Unknown config key "{prefix}{k}"')
+
+            path = prefix + k
+            if not isinstance(item, ConfigurableInstance):
+                current_config = item.export_config(getattr(self, k))
+                if _config_equal(current_config, v):
+                    continue
+                # e.g. paths, which are exported resolved
+                value = item.validate(item.from_config(v))
+                if _config_equal(current_config, item.export_config(value)):
+                    continue
+                # items with their own __set__ might do more than storing the value
+                direct = type(item).__set__ is Item.__set__
+                changes.append((self, k, value, direct))
+                changed.append(path)
+                continue
+
+            if not isinstance(v, Mapping):
+                raise TypeError(f"config must be a mapping, got {v}")
+
+            current = values[k]
+            deferred = isinstance(current, DeferredInstance)
+            cls = current.cls if deferred else current.__class__
+            new_cls = item._resolve_cls(v['cls']) if 'cls' in v else cls
+            sub_config = {key: value for key, value in v.items() if key != 'cls'}
+
+            if new_cls is not cls:
+                if deferred:
+                    value = item.defer(v)
+                else:
+                    value = item.validate(new_cls(config=sub_config))
+                changes.append((self, k, value, deferred))
+                rebuilt.append(path)
+            elif deferred:
+                # not created yet, only the placeholder is updated
+                current_config = current.get_config()
+                diff = {
+                    key: value for key, value in sub_config.items()
+                    if key not in current_config or not _config_equal(current_config[key], value)
+                }
+                if diff:
+                    value = item.defer(dict(merge(current.config, diff), cls=cls))
+                    changes.append((self, k, value, True))
+                    changed.extend(f'{path}.{key}' for key in diff)
+            else:
+                current._collect_changes(sub_config, path + '.', changes, changed, rebuilt)
+
     @classmethod
     def get_config_tree(cls):
         '''
@@ -129,30 +612,34 @@ class Configurable:
         subclasses: dict
             mapping of name to subclass
         '''
-        subclasses = {}
-        if not isabstract(cls):
-            subclasses[cls.__name__] = cls
-
-        for subcls in cls.__subclasses__():
-            subclasses.update(subcls.get_nonabstract_subclasses())
-
-        return subclasses
+        # abstractness is only known after the class has been fully created,
+        # so it is checked here and not on registration
+        return {
+            name: subcls
+            for name, subcls in cls._subclass_registry.items()
+            if not isabstract(subcls)
+        }
 
     @classmethod
     def get_nonabstract_subclass(cls, name):
         '''
-        Get all non-abstract children of this class
+        Get the non-abstract child of this class with the given name
         '''
-        subclasses = cls.get_nonabstract_subclasses()
+        subcls = cls._subclass_registry.get(name)
 
-        if name not in subclasses:
+        if subcls is None or isabstract(subcls):
             raise TypeError(
                 f'Unknown subclass {name!r} for class {cls}'
-                f', possible values are {list(subclasses)}'
+                f', possible values are {list(cls.get_nonabstract_subclasses())}'
             )
 
-        return subclasses[name]
+        return subcls
 
     def __repr__(self):
         configs = ', '.join(f'{k}={getattr(self, k)!r}' for k in self.__config__.keys())
         return f'{self.__class__.__name__}({configs})'
+
+
+Configurable.__plan__ = InstantiationPlan(Configurable.__config__)
+Configurable._slot_members = {EXPORT_STATE: Configurable.__dict__[EXPORT_STATE]}
+Configurable._subclass_registry['Configurable'] = Configurable
@@ -26,3 +26,93 @@ def recursive_update(d1, d2, copy=False):
 
     # just for convenience, the input dict is actually mutated
     return d1
+
+
+_MISSING = object()
+
+
+class NestedChainMap(Mapping):
+    '''
+    Read-only, nested view of several mappings, like ``collections.ChainMap``.
+
+    Keys are looked up in ``maps`` in order, so the first mapping containing
+    a key takes precedence. If the value of a key is a mapping, it is
+    overlaid with the values of that key in the following maps,
+    down to the first layer where it is not a mapping, e.g.
+
+    >>> config = NestedChainMap({'a': {'b': 1}}, {'a': {'b': 0, 'c': 2}, 'd': 3})
+    >>> config['a']['b'], config['a']['c'], config['d']
+    (1, 2, 3)
+
+    Nothing is copied, nested views are only created for the keys
+    that are accessed. Values that are present in only one layer
+    are returned as is and shared with that layer.
+    Use `to_dict` to get a plain, merged dict.
+    '''
+    __slots__ = ('maps', '_children')
+
+    def __init__(self, *maps):
+        for m in maps:
+            if not isinstance(m, Mapping):
+                raise TypeError('Arguments must be mappings')
+
+        self.maps = tuple(maps)
+        self._children = {}
+
+    def __getitem__(self, key):
+        value = self._children.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        mappings = []
+        for m in self.maps:
+            value = m.get(key, _MISSING)
+            if value is _MISSING:
+                continue
+
+            if not isinstance(value, Mapping):
+                if not mappings:
+                    return value
+                # a non-mapping value shadows everything below it
+                break
+
+            mappings.append(value)
+
+        if not mappings:
+            raise KeyError(key)
+
+        if len(mappings) == 1:
+            value = mappings[0]
+        else:
+            value = NestedChainMap(*mappings)
+
+        self._children[key] = value
+        return value
+
+    def __contains__(self, key):
+        return any(key in m for m in self.maps)
+
+    def __iter__(self):
+        # keys in the order of the lowest layer they appear in, like ChainMap
+        keys = {}
+        for m in reversed(self.maps):
+            keys.update(dict.fromkeys(m))
+        return iter(keys)
+
+    def __len__(self):
+        if len(self.maps) == 1:
+            return len(self.maps[0])
+        return len(set().union(*self.maps))
+
+    def to_dict(self):
+        '''Merge all layers into new, nested dicts, values are not copied'''
+        return _to_dict(self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({", ".join(repr(m) for m in self.maps)})'
+
+
+def _to_dict(value):
+    if isinstance(value, Mapping):
+        return {k: _to_dict(v) for k, v in value.items()}
+    return value
@@ -0,0 +1,129 @@
+'''
+Canonical encoding of config values for stable fingerprints.
+
+`encode` turns a value into bytes that only depend on the value,
+not on the process, dict order or memory addresses,
+so that hashes of it can be used as keys of on-disk caches.
+See `config.Configurable.fingerprint`.
+'''
+from array import array
+from collections.abc import Mapping, Set
+from pathlib import PurePath
+import struct
+import sys
+
+
+__all__ = ['encode']
+
+
+def encode(value):
+    '''
+    Canonical bytes of value.
+
+    Supported are None, bool, int, float, complex, str, bytes, paths,
+    sequences, sets, mappings, `array.array`, numpy arrays, astropy quantities
+    and objects with a ``fingerprint()`` method returning a hex digest,
+    e.g. `~config.Configurable` and `~config.LookupDatabase`.
+    Raises TypeError for other values.
+    '''
+    out = []
+    _encode(value, out)
+    return b''.join(out)
+
+
+def _encode_str(value, out):
+    data = value.encode()
+    out.append(b'%d:' % len(data))
+    out.append(data)
+
+
+def _encode_array(value, out):
+    '''numpy arrays, including astropy quantities'''
+    unit = getattr(value, 'unit', None)
+    if unit is not None:
+        out.append(b'q')
+        _encode_str(unit.to_string(), out)
+        value = value.value
+
+    if value.dtype.hasobject:
+        out.append(b'O%d:' % value.ndim)
+        out.append(repr(value.shape).encode())
+        for element in value.ravel():
+            _encode(element, out)
+        return
+
+    dtype = value.dtype
+    if dtype.byteorder == '>' or (dtype.byteorder == '=' and sys.byteorder == 'big'):
+        value = value.astype(dtype.newbyteorder('<'))
+
+    # shape and type independent of endianness and memory layout
+    out.append(b'n')
+    _encode_str(value.dtype.newbyteorder('<').str, out)
+    _encode_str(repr(value.shape), out)
+    out.append(value.tobytes(order='C'))
+
+
+def _encode(value, out):
+    value_type = type(value)
+
+    if value is None:
+        out.append(b'N')
+    elif value_type is bool:
+        out.append(b'T' if value else b'F')
+    elif value_type is int:
+        out.append(b'i%d;' % value)
+    elif value_type is float:
+        out.append(b'f' + struct.pack('<d', value))
+    elif value_type is str:
+        out.append(b's')
+        _encode_str(value, out)
+    elif isinstance(value, bool):
+        out.append(b'T' if value else b'F')
+    elif isinstance(value, int):
+        out.append(b'i%d;' % value)
+    elif isinstance(value, float):
+        out.append(b'f' + struct.pack('<d', value))
+    elif isinstance(value, complex):
+        out.append(b'c' + struct.pack('<dd', value.real, value.imag))
+    elif isinstance(value, str):
+        out.append(b's')
+        _encode_str(value, out)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(b'b%d:' % len(value))
+        out.append(bytes(value))
+    elif isinstance(value, PurePath):
+        out.append(b'p')
+        _encode_str(str(value), out)
+    elif isinstance(value, array):
+        if sys.byteorder == 'big':
+            value = array(value.typecode, value)
+            value.byteswap()
+        out.append(b'a' + value.typecode.encode() + b'%d:' % len(value))
+        out.append(value.tobytes())
+    elif isinstance(value, (list, tuple)):
+        out.append(b'l%d:' % len(value))
+        for element in value:
+            _encode(element, out)
+    elif isinstance(value, Mapping):
+        # sorted by the encoded keys, independent of insertion order
+        items = sorted((encode(k), v) for k, v in value.items())
+        out.append(b'd%d:' % len(items))
+        for key, element in items:
+            out.append(key)
+            _encode(element, out)
+    elif isinstance(value, Set):
+        elements = sorted(encode(v) for v in value)
+        out.append(b'S%d:' % len(elements))
+        out.extend(elements)
+    elif hasattr(value, 'dtype') and hasattr(value, 'tobytes'):
+        if getattr(value, 'ndim', None) == 0 and getattr(value, 'unit', None) is None:
+            # numpy scalars
+            _encode(value.item(), out)
+        else:
+            _encode_array(value, out)
+    elif callable(getattr(value, 'fingerprint', None)):
+        out.append(b'F')
+        _encode_str(f'{value_type.__module__}.{value_type.__qualname__}', out)
+        out.append(bytes.fromhex(value.fingerprint()))
+    else:
+        raise TypeError(f'Cannot fingerprint value of type {value_type}')
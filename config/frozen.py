@@ -0,0 +1,146 @@
+from array import array
+from collections.abc import Mapping, Set
+from pathlib import PurePath
+
+
+__all__ = [
+    'FrozenDict',
+    'freeze',
+    'is_immutable',
+    'thaw',
+]
+
+
+class FrozenDict(Mapping):
+    '''
+    An immutable, hashable dict.
+
+    Values are frozen using `freeze`, so a FrozenDict is always deeply immutable.
+    Compares equal to dicts with the same items.
+    '''
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, *args, **kwargs):
+        data = dict(*args, **kwargs)
+        self._data = {k: freeze(v) for k, v in data.items()}
+        self._hash = None
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (self._data, ))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._data!r})'
+
+
+#: types of which all instances are immutable
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range, PurePath, FrozenDict)
+
+
+def _is_readonly_array(value):
+    '''Whether value is a numpy array owning read-only, non-object data'''
+    flags = getattr(value, 'flags', None)
+    dtype = getattr(value, 'dtype', None)
+    return (
+        flags is not None and dtype is not None
+        and getattr(value, 'base', True) is None
+        and flags.writeable is False
+        and not dtype.hasobject
+    )
+
+
+def is_immutable(value):
+    '''
+    Whether ``value`` is known to be deeply immutable, i.e. it is safe
+    to share it between instances.
+
+    >>> is_immutable((1, 'a', frozenset({2.0})))
+    True
+    >>> is_immutable((1, [2]))
+    False
+    '''
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(v) for v in value)
+
+    return _is_readonly_array(value)
+
+
+def freeze(value):
+    '''
+    Return a deeply immutable snapshot of value.
+
+    Mappings become `FrozenDict`, lists and tuples become tuples,
+    sets become frozensets, `array.array` becomes a tuple and numpy arrays
+    become read-only copies. Already immutable values are returned as is.
+    Raises TypeError for other values.
+
+    >>> freeze({'a': [1, 2], 'b': {3}})
+    FrozenDict({'a': (1, 2), 'b': frozenset({3})})
+    '''
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+
+    if isinstance(value, Mapping):
+        return FrozenDict(value)
+
+    if isinstance(value, (list, tuple, array)):
+        return tuple(freeze(v) for v in value)
+
+    if isinstance(value, Set):
+        return frozenset(freeze(v) for v in value)
+
+    if _is_readonly_array(value):
+        return value
+
+    dtype = getattr(value, 'dtype', None)
+    if hasattr(value, 'setflags') and dtype is not None and not dtype.hasobject:
+        frozen = value.copy()
+        frozen.setflags(write=False)
+        return frozen
+
+    raise TypeError(f'Cannot freeze value of type {type(value)}')
+
+
+def thaw(value):
+    '''
+    Inverse of `freeze` for configs: FrozenDicts become dicts, tuples become
+    lists and frozensets become sets, recursively. Other values are returned as is.
+
+    >>> thaw(freeze({'a': [1, 2]}))
+    {'a': [1, 2]}
+    '''
+    if isinstance(value, FrozenDict):
+        return {k: thaw(v) for k, v in value.items()}
+
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+
+    if isinstance(value, frozenset):
+        return {thaw(v) for v in value}
+
+    return value
@@ -1,7 +1,15 @@
 from abc import ABCMeta, abstractmethod
+from copy import deepcopy
 import weakref
 
 from .exceptions import ConfigError
+from .fingerprint import encode
+from . import profiling
+
+
+#: key of the export bookkeeping in the ``__dict__`` of configurable instances,
+#: see ``config.configurable.ExportState``
+EXPORT_STATE = '__config_export__'
 
 
 class Item(metaclass=ABCMeta):
@@ -11,21 +19,100 @@ class Item(metaclass=ABCMeta):
     This is a descriptor for class members.
     Each Item describes one configurable member variable
     of the instances.
+
+    Items use ``__slots__``, as large schemas have thousands of them.
+    Subclasses should define ``__slots__`` for their attributes as well,
+    otherwise their instances get a ``__dict__``.
     '''
+    __slots__ = ('help', '_allow_none', '_validator', 'configurable', 'name')
+
+    #: numpy dtype for arrays of values of this item, None if not numeric
+    dtype = None
+
     def __init__(self, help='', allow_none=True):
-        self.help = help
-        self.allow_none = allow_none
         self.configurable = None
         self.name = None
+        self.help = help
+        self.allow_none = allow_none
+
+    @property
+    def allow_none(self):
+        return self._allow_none
+
+    @allow_none.setter
+    def allow_none(self, allow_none):
+        self._allow_none = allow_none
+        # compiled validators depend on allow_none
+        self._validator = None
+        self._update_plans()
+
+    def _update_plans(self):
+        '''Rebuild the instantiation plans of the classes using this item'''
+        if self.configurable is None:
+            return
+
+        # to avoid circular import
+        from .configurable import update_plans
+        update_plans(self)
 
     def __set_name__(self, owner, name):
         # avoid circular reference
         self.configurable = weakref.ref(owner)
         self.name = name
 
+    def __reduce_ex__(self, protocol):
+        # items of a class are pickled by reference, like the class itself
+        if self.configurable is not None:
+            return getattr, (self.configurable(), self.name)
+        return super().__reduce_ex__(protocol)
+
+    def __copy__(self):
+        # copies are independent items, unlike pickling by reference
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__setstate__(deepcopy(self.__getstate__(), memo))
+        return new
+
+    def __getstate__(self):
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get('__slots__', ())
+            if hasattr(self, name)
+        }
+        # subclasses without __slots__
+        state.update(getattr(self, '__dict__', {}))
+        # compiled validators are closures, which cannot be pickled
+        state['_validator'] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __set__(self, instance, value):
-        value = self.validate(value)
-        instance.__dict__[self.name] = value
+        validate = self._validator
+        if validate is None:
+            validate = self._validator = self.compile_validator()
+
+        profiler = profiling._active
+        if profiler is not None:
+            value = profiler.call(self.name, 'validate', validate, value)
+        else:
+            value = validate(value)
+
+        values = instance.__dict__
+        values[self.name] = value
+
+        # invalidate the cached config of instance and its parents
+        state = values.get(EXPORT_STATE)
+        if state is not None:
+            state.invalidate()
 
     def validate(self, value):
         '''Validate value, raises ValueError for invalid values'''
@@ -33,6 +120,22 @@ class Item(metaclass=ABCMeta):
             raise ConfigError(self, value, 'must not be None')
         return value
 
+    def compile_validator(self):
+        '''
+        Return a function validating a single value, equivalent to `validate`.
+
+        Subclasses can return a closure specialized on the item's settings,
+        it is compiled on first use and again after ``allow_none`` changed.
+        '''
+        return self.validate
+
+    def validate_many(self, values):
+        '''Validate all values, returns a sequence of the validated values'''
+        validate = self._validator
+        if validate is None:
+            validate = self._validator = self.compile_validator()
+        return [validate(value) for value in values]
+
     @abstractmethod
     def from_config(self, config):
         '''Create the value from its config representation'''
@@ -48,10 +151,24 @@ class Item(metaclass=ABCMeta):
         '''Return the default configuration'''
         pass
 
+    def export_config(self, value):
+        '''Return the config representation of value'''
+        return value
+
+    def encode_value(self, value):
+        '''
+        Canonical bytes of value, used for `config.Configurable.fingerprint`.
+
+        Subclasses with values not supported by `config.fingerprint.encode`
+        need to override this.
+        '''
+        return encode(value)
+
     def __repr__(self):
         if self.configurable is None:
             part1 = f'{self.__class__.__name__}'
         else:
             part1 = f'{self.configurable()}.{self.name}[{self.__class__.__name__}]'
 
-        return f'{part1}(default={self.get_default()}, allow_none={self.allow_none})'
+        # not get_default(), creating the default might fail and end up here again
+        return f'{part1}(default={self.get_default_config()}, allow_none={self.allow_none})'
@@ -2,6 +2,7 @@ from .configurable import ConfigurableInstance
 from .basic import Object, Int, Float, String
 from .path import Path
 from .lookup import Lookup, LookupDatabase
+from .containers import List, Set, Dict
 
 
 __all__ = [
@@ -13,4 +14,7 @@ __all__ = [
     'String',
     'Lookup',
     'LookupDatabase',
+    'List',
+    'Set',
+    'Dict',
 ]
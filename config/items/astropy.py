@@ -1,46 +1,109 @@
-try:
-    import astropy.units as u
-except ImportError:
-    raise ImportError(
-        'You need ``astropy`` to uses the config items from this module'
-    ) from None
-
 from collections.abc import Mapping
+from functools import lru_cache
 
 from .basic import Object
 from ..exceptions import ConfigError
 
 
+# astropy.units is slow to import, so it is only imported on first use
+_units = None
+
+# value for ``copy`` that only copies if needed, None since numpy 2.0
+_COPY_IF_NEEDED = False
+
+
+def _import_units():
+    global _units, _COPY_IF_NEEDED
+    if _units is None:
+        try:
+            import astropy.units
+        except ImportError:
+            raise ImportError(
+                'You need ``astropy`` to use the config items from this module'
+            ) from None
+
+        # astropy depends on numpy, so this import is always fine
+        import numpy as np
+        if np.lib.NumpyVersion(np.__version__) >= '2.0.0':
+            _COPY_IF_NEEDED = None
+
+        _units = astropy.units
+    return _units
+
+
+@lru_cache(maxsize=256)
+def _conversion_scale(from_unit, to_unit):
+    '''Factor to convert values in ``from_unit`` to ``to_unit``'''
+    return from_unit.to(to_unit)
+
+
+def __getattr__(name):
+    # astropy.units used to be available as ``u`` in this module
+    if name == 'u':
+        return _import_units()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 class QuantityItem(Object):
+    __slots__ = ('unit', )
 
     def __init__(self, unit=None, **kwargs):
+        # validate needs unit to be already set, the default is validated with the unit as given
         self.unit = unit
-        # validate needs unit to be already set
         super().__init__(**kwargs)
+        # parsed once, not on each validation
+        self.unit = self._parse_unit(unit)
+
+    def _parse_unit(self, unit):
+        if unit is None:
+            return None
+
+        u = _import_units()
+        if isinstance(unit, u.UnitBase):
+            return unit
+
+        try:
+            return u.Unit(unit)
+        except (ValueError, TypeError):
+            raise ConfigError(self, unit, 'must be a valid unit') from None
 
     def validate(self, value):
         value = super().validate(value)
         if value is None:
             return
 
-        try:
-            value = u.Quantity(value, copy=False)
-        except ValueError:
-            raise ConfigError(self, value, "must be a valid input to Quantity")
+        u = _import_units()
+        if type(value) is not u.Quantity:
+            try:
+                value = u.Quantity(value, copy=_COPY_IF_NEEDED)
+            except (ValueError, TypeError):
+                raise ConfigError(self, value, "must be a valid input to Quantity")
 
         # verify unit if one is required
-        if self.unit is not None:
-            try:
-                value = value.to(self.unit, copy=False)
-            except ValueError:
-                raise ConfigError(self, value, f"must be convertible to {self.unit}")
+        unit = self.unit
+        if unit is None or value.unit is unit:
+            return value
+
+        if not isinstance(unit, u.UnitBase):
+            # while the default is validated in __init__ or if unit was reassigned
+            unit = self._parse_unit(unit)
+            if value.unit is unit:
+                return value
+
+        try:
+            scale = _conversion_scale(value.unit, unit)
+        except ValueError:
+            raise ConfigError(self, value, f"must be convertible to {unit}")
 
-        return value
+        # equivalent units, e.g. composite units, only need a new unit, not a copy
+        data = value.value if scale == 1.0 else value.value * scale
+        return u.Quantity(data, unit, copy=_COPY_IF_NEEDED)
 
     def from_config(self, config_value):
+        u = _import_units()
         try:
             if isinstance(config_value, Mapping):
-                config_value = u.Quantity(**config_value, copy=False)
+                config_value = u.Quantity(**config_value, copy=_COPY_IF_NEEDED)
             return self.validate(config_value)
         except Exception:
             raise ConfigError(
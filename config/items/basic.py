@@ -1,26 +1,129 @@
+from array import array
 from copy import deepcopy
 from operator import index
 
 from ..item import Item
+from ..frozen import freeze, is_immutable, thaw
 from ..exceptions import ConfigError
 
 
+# buffer formats that can be copied into an array of the given typecode as is
+_BUFFER_FORMATS = {
+    'd': {'d'},
+    'q': {'q', 'l'},
+}
+
+
+def _from_buffer(values, typecode):
+    '''
+    Copy a one dimensional buffer (e.g. a numpy array) with matching
+    format into an array, returns None if not possible.
+    '''
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+
+    if view.ndim != 1 or view.format not in _BUFFER_FORMATS[typecode]:
+        return None
+
+    result = array(typecode)
+    if view.itemsize != result.itemsize:
+        return None
+
+    result.frombytes(view.cast('B') if view.c_contiguous else view.tobytes())
+    return result
+
+
+def _validate_array(item, values, typecode):
+    '''
+    Validate numeric values in bulk into an array.array,
+    falls back to a list if not all values fit into the array.
+    '''
+    if isinstance(values, array) and values.typecode == typecode:
+        return array(typecode, values)
+
+    result = _from_buffer(values, typecode)
+    if result is not None:
+        return result
+
+    # values might be an iterator, which can only be consumed once
+    if not isinstance(values, (list, tuple)):
+        values = list(values)
+
+    try:
+        return array(typecode, values)
+    except (TypeError, OverflowError):
+        pass
+
+    # not all values have the exact type, e.g. None or integer floats
+    validated = Item.validate_many(item, values)
+    try:
+        return array(typecode, validated)
+    except (TypeError, OverflowError):
+        return validated
+
+
+def _identity(value):
+    return value
+
+
 class Object(Item):
     '''
     A config item consisting of a single python object.
 
     No nested configuration supported.
+
+    Parameters
+    ----------
+    default:
+        The default value
+    allow_none: bool
+        Whether None is a valid value
+    copy_default: bool
+        If True, each instance gets a deep copy of the default.
+        Immutable defaults are never copied.
+    freeze_default: bool
+        If True, the default is stored as immutable snapshot, see
+        `config.frozen.freeze`, and shared by all instances without copying.
+        Instances that need a different value get it assigned.
+        The snapshot must be valid for the item, e.g. not for ``type = dict``,
+        and frozen values are exported as plain dicts and lists.
+        Containers keep frozen values frozen.
     '''
+    __slots__ = ('copy_default', 'freeze_default', '_default', '_default_immutable')
+
     type = object
 
-    def __init__(self, default=None, allow_none=True, copy_default=False, **kwargs):
+    def __init__(self, default=None, allow_none=True, copy_default=False, freeze_default=False, **kwargs):
         super().__init__(**kwargs)
 
         self.allow_none = allow_none
         self.copy_default = copy_default
+        self.freeze_default = freeze_default
         self.default = default
         self.default = self.validate(default)
 
+        if freeze_default:
+            frozen = freeze(self.default)
+            try:
+                self.default = self.validate(frozen)
+            except ConfigError:
+                raise ConfigError(
+                    self, frozen, 'freeze_default needs a frozen default valid for the item'
+                ) from None
+
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, default):
+        self._default = default
+        # immutable defaults can be shared, even if copy_default is set
+        self._default_immutable = is_immutable(default)
+        self._update_plans()
+
     def validate(self, value):
         value = super().validate(value)
         if value is None:
@@ -31,25 +134,66 @@ class Object(Item):
 
         return value
 
+    def compile_validator(self):
+        # subclasses overriding validate might check more than the type
+        if type(self).validate is not Object.validate:
+            return super().compile_validator()
+
+        item = self
+        item_type = self.type
+        allow_none = self.allow_none
+
+        if item_type is object and allow_none is not False:
+            return _identity
+
+        def validate(value):
+            if type(value) is item_type:
+                return value
+
+            if value is None:
+                if allow_none is False:
+                    raise ConfigError(item, value, 'must not be None')
+                return None
+
+            if not isinstance(value, item_type):
+                raise ConfigError(item, value, f"must be an instance of {item_type}")
+
+            return value
+
+        return validate
+
     def get_default(self):
-        if self.copy_default:
-            return deepcopy(self.default)
+        if self.copy_default and not self._default_immutable:
+            return deepcopy(self._default)
         else:
-            return self.default
+            return self._default
 
     def from_config(self, config):
         return config
 
+    def export_config(self, value):
+        # so that the config can be serialized and used to create an instance
+        if self.freeze_default:
+            return thaw(value)
+        return value
+
     def get_default_config(self):
-        return self.get_default()
+        return self.export_config(self.get_default())
 
 
 class String(Object):
+    __slots__ = ()
+
     type = str
 
 
 class Int(Object):
+    __slots__ = ()
+
     type = int
+    dtype = 'int64'
+    #: array.array typecode used by validate_many
+    typecode = 'q'
 
     def validate(self, value):
 
@@ -64,9 +208,53 @@ class Int(Object):
 
         return super().validate(value)
 
+    def compile_validator(self):
+        if type(self).validate is not Int.validate:
+            return super().compile_validator()
+
+        item = self
+        item_type = self.type
+        allow_none = self.allow_none
+
+        def validate(value):
+            if type(value) is item_type:
+                return value
+
+            if value is None:
+                if allow_none is False:
+                    raise ConfigError(item, value, 'must not be None')
+                return None
+
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+
+            if hasattr(value, '__index__'):
+                value = index(value)
+
+            if not isinstance(value, item_type):
+                raise ConfigError(item, value, f"must be an instance of {item_type}")
+
+            return value
+
+        return validate
+
+    def validate_many(self, values):
+        '''
+        Validate all values, returns an array.array of int64
+        or a list if not all values fit into one.
+        '''
+        if type(self).validate is not Int.validate or self.type is not int:
+            return super().validate_many(values)
+        return _validate_array(self, values, self.typecode)
+
 
 class Float(Object):
+    __slots__ = ()
+
     type = float
+    dtype = 'float64'
+    #: array.array typecode used by validate_many
+    typecode = 'd'
 
     def validate(self, value):
         # special casing for things explicitly advertising convertible to float
@@ -74,3 +262,39 @@ class Float(Object):
             value = float(value)
 
         return super().validate(value)
+
+    def compile_validator(self):
+        if type(self).validate is not Float.validate:
+            return super().compile_validator()
+
+        item = self
+        item_type = self.type
+        allow_none = self.allow_none
+
+        def validate(value):
+            if type(value) is item_type:
+                return value
+
+            if value is None:
+                if allow_none is False:
+                    raise ConfigError(item, value, 'must not be None')
+                return None
+
+            if hasattr(value, '__float__'):
+                value = float(value)
+
+            if not isinstance(value, item_type):
+                raise ConfigError(item, value, f"must be an instance of {item_type}")
+
+            return value
+
+        return validate
+
+    def validate_many(self, values):
+        '''
+        Validate all values, returns an array.array of float64
+        or a list if not all values fit into one, e.g. because of None.
+        '''
+        if type(self).validate is not Float.validate or self.type is not float:
+            return super().validate_many(values)
+        return _validate_array(self, values, self.typecode)
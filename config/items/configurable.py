@@ -1,13 +1,94 @@
-from ..item import Item
+from ..item import Item, EXPORT_STATE
 from ..configurable import Configurable
 from ..exceptions import ConfigError
+from ..fingerprint import encode
+
+
+class DeferredInstance:
+    '''
+    Placeholder for a lazily created member, see ``ConfigurableInstance(lazy=True)``.
+
+    Holds the class, the config it will be created from and the values
+    validated from that config, see `ConfigurableInstance.defer`.
+    '''
+    __slots__ = ('cls', 'config', 'values', '_fingerprint')
+
+    def __init__(self, cls, config, values=None):
+        self.cls = cls
+        self.config = config
+        self.values = {} if values is None else values
+        self._fingerprint = None
+
+    def create(self):
+        # members are created from their config, the other values are already validated
+        config = {k: v for k, v in self.config.items() if k not in self.values}
+        values = {
+            k: v for k, v in self.values.items()
+            if not isinstance(v, DeferredInstance)
+        }
+        for k, v in self.values.items():
+            if isinstance(v, DeferredInstance):
+                config[k] = self.config[k]
+        return self.cls(config=config, **values)
+
+    def _fingerprint_digest(self):
+        '''Fingerprint digest of the instance, computed on a temporary instance'''
+        if self._fingerprint is None:
+            self._fingerprint = self.create()._fingerprint_digest()
+        return self._fingerprint
+
+    def get_config(self):
+        '''
+        The config the instance would report after being created.
+
+        Items not given in ``config`` are filled with their default config.
+        '''
+        config = {}
+        for k, item in self.cls.__config__.items():
+            if k in self.values:
+                config[k] = item.export_config(self.values[k])
+            elif isinstance(item, ConfigurableInstance):
+                config[k] = item.export_config(item.defer())
+            else:
+                config[k] = item.get_default_config()
+        return config
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(cls={self.cls.__name__}, config={self.config})'
 
 
 class ConfigurableInstance(Item):
     '''
     A config item that is itself configurable
+
+    Parameters
+    ----------
+    cls: type
+        Subclass of ``Configurable``, values must be instances of it
+    default_config: dict
+        Overrides of the defaults of ``cls``, may contain ``cls``
+        to select a subclass
+    allow_subclasses: bool
+        If False, values must be instances of exactly ``cls``
+    lazy: bool
+        If True, the member is only created on first attribute access
+        on instances of the owning class. Until then, ``get_config``
+        reports the config it will be created from.
     '''
-    def __init__(self, cls, default_config=None, allow_subclasses=True, **kwargs):
+    __slots__ = ('cls', '_default_config', '_default_template', 'allow_subclasses', 'lazy')
+
+    def __new__(item_cls, *args, lazy=False, **kwargs):
+        if lazy and not issubclass(item_cls, LazyConfigurableInstance):
+            if item_cls is not ConfigurableInstance:
+                # the placeholders are only replaced by LazyConfigurableInstance.__get__
+                raise TypeError(
+                    f'{item_cls.__name__} does not support lazy=True,'
+                    ' subclass LazyConfigurableInstance instead'
+                )
+            item_cls = LazyConfigurableInstance
+        return super().__new__(item_cls)
+
+    def __init__(self, cls, default_config=None, allow_subclasses=True, lazy=False, **kwargs):
         if not issubclass(cls, Configurable):
             raise TypeError('cls must be a subclass of ``Configurable``')
 
@@ -15,6 +96,16 @@ class ConfigurableInstance(Item):
         self.cls = cls
         self.default_config = {} if default_config is None else default_config
         self.allow_subclasses = allow_subclasses
+        self.lazy = lazy
+
+    @property
+    def default_config(self):
+        return self._default_config
+
+    @default_config.setter
+    def default_config(self, default_config):
+        self._default_config = default_config
+        self._default_template = None
 
     def validate(self, value):
         if not isinstance(value, self.cls):
@@ -25,13 +116,22 @@ class ConfigurableInstance(Item):
         return value
 
     def from_config(self, config):
+        cls, config = self._split_config(config)
+        return cls(config=config)
+
+    def _split_config(self, config):
+        '''Class to instantiate and the config without the ``cls`` entry'''
         if 'cls' not in config:
-            return self.cls(config=config)
+            return self.cls, config
 
-        # we don't want to modify the config object, but we need it without cls
-        config = config.copy()
-        cls = config.pop('cls')
+        # we don't want to modify the config object, but we need it without cls.
+        # config might be any mapping, e.g. a read-only NestedChainMap
+        cls = self._resolve_cls(config['cls'])
+        config = {k: v for k, v in config.items() if k != 'cls'}
+        return cls, config
 
+    def _resolve_cls(self, cls):
+        '''Get the class to instantiate from the value of a ``cls`` config entry'''
         if isinstance(cls, str):
             try:
                 cls = self.cls.get_nonabstract_subclass(cls)
@@ -41,13 +141,141 @@ class ConfigurableInstance(Item):
         if not issubclass(cls, self.cls):
             raise ConfigError(self, cls, f"must be a subclass of {self.cls}")
 
-        return cls(config=config)
+        return cls
 
     def get_default(self):
-        return self.from_config(self.get_default_config())
+        cls, config = self._get_default_args()
+        return cls(config=config)
+
+    def _get_default_args(self):
+        cls, config, shadowed = self._get_default_template()
+
+        if shadowed:
+            # keep the defaults of self.cls for items redefined by the subclass,
+            # as the merged default config would do
+            config = dict(config)
+            for k in shadowed:
+                config[k] = self.cls.__config__[k].get_default_config()
+
+        return cls, config
+
+    def defer(self, config=None):
+        '''
+        Placeholder for the instance created from ``config``,
+        or from the default if ``config`` is None.
+
+        The class, the config keys and the values are validated right away,
+        members of the instance are deferred as well.
+        Only the instance itself is created on first access.
+        '''
+        if config is None:
+            cls, config = self._get_default_args()
+        else:
+            cls, config = self._split_config(config)
+
+        items = cls.__config__
+        values = {}
+        for k, v in config.items():
+            item = items.get(k)
+            if item is None:
+                raise ValueError(f'Unknown config key "{k}"')
+
+            if isinstance(item, ConfigurableInstance):
+                values[k] = item.defer(v)
+            else:
+                values[k] = item.validate(item.from_config(v))
+
+        return DeferredInstance(cls, config, values)
+
+    def export_config(self, value):
+        '''
+        Config of a value of this item, including the name of the class
+        if it is a subclass of ``cls``.
+        '''
+        if isinstance(value, DeferredInstance):
+            cls = value.cls
+        else:
+            cls = value.__class__
+
+        config = value.get_config()
+        # if the value is actually a subclass, we need include the name
+        if cls is not self.cls:
+            config['cls'] = cls.__name__
+        return config
+
+    def encode_value(self, value):
+        # the fingerprint of the member includes its class,
+        # deferred members hash the same as when created
+        if value is None:
+            return encode(None)
+        return b'c' + value._fingerprint_digest()
+
+    def _get_default_template(self):
+        '''
+        The class and config to create the default instance.
+
+        Equivalent to ``from_config(get_default_config())``, but without
+        building the default config of the complete subtree: the items
+        not overridden in ``default_config`` are set from their own defaults
+        when the instance is created.
+
+        Cached until ``default_config`` is reassigned or a new
+        ``Configurable`` subclass is defined, which might change
+        the resolution of ``cls`` names.
+        '''
+        template = self._default_template
+        if template is not None and template[0] == Configurable._generation:
+            return template[1]
+
+        config = self.default_config
+        cls = self.cls
+        shadowed = ()
+        if 'cls' in config:
+            cls, config = self._split_config(config)
+            shadowed = tuple(
+                k for k, item in self.cls.__config__.items()
+                if k not in config and cls.__config__.get(k) is not item
+            )
+
+        self._default_template = (Configurable._generation, (cls, config, shadowed))
+        return cls, config, shadowed
 
     def get_default_config(self):
         config = self.cls.get_default_config()
         # local default overrides cls defaults
         config.update(self.default_config)
         return config
+
+
+class LazyConfigurableInstance(ConfigurableInstance):
+    '''
+    A ConfigurableInstance that is created on first attribute access.
+
+    Created by ``ConfigurableInstance(..., lazy=True)``.
+    Subclasses of ConfigurableInstance need to derive from this class
+    to support ``lazy=True``.
+    '''
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(
+                f'{type(instance).__name__!r} object has no attribute {self.name!r}'
+            ) from None
+
+        if value.__class__ is DeferredInstance:
+            value = value.create()
+            values = instance.__dict__
+            values[self.name] = value
+
+            # the created member is not yet linked to the cached config
+            state = values.get(EXPORT_STATE)
+            if state is not None:
+                state.invalidate()
+
+        return value
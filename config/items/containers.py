@@ -0,0 +1,156 @@
+from array import array
+from collections.abc import Iterable, Mapping
+
+from .basic import Object, String
+from ..item import Item
+from ..exceptions import ConfigError
+from ..frozen import FrozenDict, freeze, is_immutable
+
+
+def _elements_from_config(item, config):
+    '''Values of item created from their configs, plain values are passed as is'''
+    if type(item).from_config is Object.from_config:
+        return config
+    return [item.from_config(element) for element in config]
+
+
+def _export_elements(item, values):
+    '''Configs of values of item, a list'''
+    if type(item).export_config is Item.export_config:
+        return list(values)
+    return [item.export_config(value) for value in values]
+
+
+class Container(Object):
+    '''
+    Base class for config items holding several values of another item.
+
+    Numeric elements, e.g. ``List(Float())``, are validated in bulk.
+    Elements are created from their configs and exported through ``item``,
+    e.g. for ``List(ConfigurableInstance(Cleaning))``.
+    With ``freeze_default``, frozen values, i.e. tuples, frozensets and
+    `~config.frozen.FrozenDict`, stay frozen after validation,
+    so that the default is shared by all instances.
+    '''
+    __slots__ = ('item', )
+
+    def __init__(self, item, default=None, copy_default=True, **kwargs):
+        self.item = item
+        super().__init__(default=default, copy_default=copy_default, **kwargs)
+
+    def from_config(self, config):
+        if config is None:
+            return None
+        self._check_iterable(config)
+        return _elements_from_config(self.item, config)
+
+    def export_config(self, value):
+        if value is None:
+            return None
+        # plain values instead of frozen ones
+        return self._export_values(super().export_config(value))
+
+    def _export_values(self, value):
+        return _export_elements(self.item, value)
+
+    def _keep_frozen(self, value):
+        '''Whether value is a frozen value that validation keeps frozen'''
+        return self.freeze_default and is_immutable(value)
+
+    def get_default_config(self):
+        return self.export_config(self.default)
+
+    def _check_iterable(self, value):
+        if isinstance(value, (str, bytes, Mapping)) or not isinstance(value, Iterable):
+            raise ConfigError(self, value, 'must be a non-string iterable')
+
+
+class List(Container):
+    '''
+    A list of values of ``item``, e.g. ``List(Float())``.
+
+    Numeric values are stored as `array.array`, others as list.
+    '''
+    __slots__ = ()
+
+    type = (list, array)
+
+    def validate(self, value):
+        if value is None:
+            return super().validate(value)
+
+        self._check_iterable(value)
+        validated = self.item.validate_many(value)
+        if self._keep_frozen(value):
+            return freeze(validated)
+        return super().validate(validated)
+
+
+class Set(Container):
+    '''
+    A set of values of ``item``, e.g. ``Set(String())``.
+    '''
+    __slots__ = ()
+
+    type = set
+
+    def validate(self, value):
+        if value is None:
+            return super().validate(value)
+
+        self._check_iterable(value)
+        validated = self.item.validate_many(value)
+        if self._keep_frozen(value):
+            return freeze(set(validated))
+        return super().validate(set(validated))
+
+    def _export_values(self, value):
+        config = _export_elements(self.item, value)
+        try:
+            return sorted(config)
+        except TypeError:
+            return config
+
+
+class Dict(Container):
+    '''
+    A dict with values of ``item`` and string keys,
+    e.g. ``Dict(Float())``.
+
+    Use ``key`` to validate the keys with another item.
+    '''
+    __slots__ = ('key', )
+
+    type = dict
+
+    def __init__(self, item, key=None, **kwargs):
+        self.key = String(default='', allow_none=False) if key is None else key
+        super().__init__(item, **kwargs)
+
+    def validate(self, value):
+        if value is None:
+            return super().validate(value)
+
+        if not isinstance(value, Mapping):
+            raise ConfigError(self, value, 'must be a mapping')
+
+        keys = self.key.validate_many(value.keys())
+        values = self.item.validate_many(value.values())
+        if self._keep_frozen(value):
+            return FrozenDict(zip(keys, values))
+        return super().validate(dict(zip(keys, values)))
+
+    def from_config(self, config):
+        if config is None:
+            return None
+        if not isinstance(config, Mapping):
+            raise ConfigError(self, config, 'must be a mapping')
+
+        keys = _elements_from_config(self.key, config.keys())
+        values = _elements_from_config(self.item, config.values())
+        return dict(zip(keys, values))
+
+    def _export_values(self, value):
+        keys = _export_elements(self.key, value.keys())
+        values = _export_elements(self.item, value.values())
+        return dict(zip(keys, values))
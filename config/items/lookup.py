@@ -1,23 +1,128 @@
-try:
-    # performance improvement for python >= 3.9
-    from functools import cache
-except ImportError:
-    from functools import lru_cache
-    def cache(f):
-        return lru_cache(maxsize=None)(f)
+from array import array
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+import hashlib
 
 from ..item import Item
 from ..exceptions import ConfigError
+from ..fingerprint import encode
 from .configurable import ConfigurableInstance
 
 
 __all__ = ['LookupDatabase', 'Lookup']
 
 
-class LookupDatabase:
+_MISSING = object()
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            'You need ``numpy`` to use batch lookups'
+        ) from None
+    return np
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    '''
+    A small least-recently-used memo owned by a single object.
+
+    Unlike ``functools.lru_cache`` on a method, the entries live and die
+    with the owner and do not keep it alive.
+
+    The cache can be shared between threads without locking, every
+    operation is a single call on the underlying OrderedDict.
+    Races between threads, e.g. an entry being evicted while another thread
+    marks it as recently used, are tolerated and at worst cost a miss.
+    The hits and misses counters are approximate under concurrency.
+
+    Attributes
+    ----------
+    maxsize: int or None
+        Maximum number of entries, None means unbounded, 0 disables caching.
+    '''
+    __slots__ = ('maxsize', 'hits', 'misses', '_data')
+
+    def __init__(self, maxsize=128):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f'maxsize must be None or >= 0, got {maxsize}')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            # evicted by another thread in the meantime
+            pass
+        return value
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+
+        self._data[key] = value
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                # emptied by another thread in the meantime
+                pass
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
 
-    def __init__(self, item, hierarchy, default=None, lookups=None):
+
+class LookupDatabase:
+    '''
+    Resolve values of an item by a hierarchy of keys.
+
+    Parameters
+    ----------
+    item: Item
+        The item used to validate the default and the looked up values
+    hierarchy: str or tuple[str]
+        The keys of the lookup, from coarsest to finest
+    default:
+        Value returned if no rule matches, defaults to the item's default
+    lookups: list of (key, value of key, value)
+        The lookup rules
+    cache_size: int or None
+        Number of resolved lookups memoized per database,
+        None means unbounded, 0 disables the memo.
+    '''
+    __slots__ = (
+        'item', 'hierarchy', 'default',
+        '_cache', '_indexed_hierarchy', '_expected', '_index', '_batch_index', '_fingerprint',
+        # the rules as columns instead of a list of tuples, see ``lookups``
+        '_rule_levels', '_rule_key_values', '_rule_values',
+        '__weakref__',
+    )
+
+    def __init__(self, item, hierarchy, default=None, lookups=None, cache_size=1024):
         self.item = item
+        self._cache = LRUCache(cache_size)
 
         if not isinstance(item, Item):
             raise TypeError('item must be an Item')
@@ -27,21 +132,31 @@ class LookupDatabase:
         else:
             self.hierarchy = tuple(hierarchy)
 
-        self._indexed_hierarchy = list(enumerate(hierarchy))[::-1]
+        self._indexed_hierarchy = list(enumerate(self.hierarchy))[::-1]
         self._expected = '(' + ', '.join(f'<{key} value>' for key in self.hierarchy) + ')'
 
-        if isinstance(self.item, ConfigurableInstance) and isinstance(default, dict):
+        if isinstance(self.item, ConfigurableInstance) and isinstance(default, Mapping):
             self.default = self.item.from_config(default)
         elif default is None:
             self.default = self.item.get_default()
         else:
             self.default = self.item.validate(default)
 
-        self.lookups = []
+        # per hierarchy level mapping of key value to value,
+        # so that a lookup is a single dict probe per level
+        self._index = {key: {} for key in self.hierarchy}
+        # value table and sorted rule keys for lookup_many, created on first use
+        self._batch_index = None
+        self._fingerprint = None
+
+        self._rule_levels = array('B' if len(self.hierarchy) < 256 else 'L')
+        self._rule_key_values = ()
+        self._rule_values = ()
 
         if lookups is None:
             return
 
+        rules = []
         for lookup_config in lookups:
             lookup_config = tuple(lookup_config)
 
@@ -52,15 +167,45 @@ class LookupDatabase:
             if key not in self.hierarchy:
                 raise ValueError(f'Key {key} not in hierarchy: {self.hierarchy}')
 
-
-            if isinstance(self.item, ConfigurableInstance) and isinstance(value, dict):
+            if isinstance(self.item, ConfigurableInstance) and isinstance(value, Mapping):
                 value = self.item.from_config(value)
 
-            value = self.item.validate(value)
-            self.lookups.append((key, key_value, value))
+            rules.append((key, key_value, value))
+
+        # validate all values at once, numeric items do this in bulk
+        values = self.item.validate_many([rule[2] for rule in rules])
+        levels = {key: level for level, key in enumerate(self.hierarchy)}
+
+        for (key, key_value, _), value in zip(rules, values):
+            try:
+                # the first matching rule of a level wins
+                self._index[key].setdefault(key_value, value)
+            except TypeError:
+                raise ValueError(f'Key value must be hashable, got {key_value!r}') from None
+
+        self._rule_levels.extend(levels[rule[0]] for rule in rules)
+        self._rule_key_values = tuple(rule[1] for rule in rules)
+        # numeric items return an array.array, which is kept as is
+        self._rule_values = values if isinstance(values, array) else tuple(values)
+
+    @property
+    def lookups(self):
+        '''The lookup rules as list of (key, value of key, value)'''
+        hierarchy = self.hierarchy
+        return [
+            (hierarchy[level], key_value, value)
+            for level, key_value, value
+            in zip(self._rule_levels, self._rule_key_values, self._rule_values)
+        ]
 
-    @cache
     def __getitem__(self, lookup):
+        value = self._cache.get(lookup, _MISSING)
+        if value is _MISSING:
+            value = self._resolve(lookup)
+            self._cache.put(lookup, value)
+        return value
+
+    def _resolve(self, lookup):
         # support a single value for len(hierarchy) == 1
         if not isinstance(lookup, tuple):
             lookup = (lookup, )
@@ -68,25 +213,181 @@ class LookupDatabase:
         if len(lookup) != len(self.hierarchy):
             raise IndexError(f"Lookup must be a tuple of form {self._expected}")
 
+        # finer levels are checked first and take precedence
         for index, key in self._indexed_hierarchy:
-
-            for (lookup_key, key_value, value) in self.lookups:
-                if key != lookup_key:
-                    continue
-
-                if key_value == lookup[index]:
-                    return value
+            value = self._index[key].get(lookup[index], _MISSING)
+            if value is not _MISSING:
+                return value
 
         return self.default
 
+    def lookup_many(self, *keys):
+        '''
+        Resolve many lookups at once, with the same precedence as ``__getitem__``.
+
+        Parameters
+        ----------
+        *keys: array-like
+            One array of key values per hierarchy level, e.g.
+            ``database.lookup_many(types, tel_ids)``.
+            The arrays are broadcast against each other.
+
+        Returns
+        -------
+        values: numpy.ndarray
+            The resolved values with the broadcast shape of ``keys``.
+            For items with a numeric ``dtype`` (e.g. ``Int`` and ``Float``)
+            this is an array of that dtype, otherwise of dtype object.
+        '''
+        np = _import_numpy()
+
+        if len(keys) != len(self.hierarchy):
+            raise IndexError(f"Batch lookup needs one array per key of {self._expected}")
+
+        keys = np.broadcast_arrays(*(np.asarray(k) for k in keys))
+        shape = keys[0].shape
+
+        # built once, concurrent first calls might both build it, which is harmless
+        batch_index = self._batch_index
+        if batch_index is None:
+            batch_index = self._batch_index = self._build_batch_index(np)
+        table, levels = batch_index
+
+        selected = np.zeros(keys[0].size, dtype=np.intp)
+
+        # coarse to fine, so finer levels overwrite coarser matches
+        for key_values, (level, offset, sorted_level) in zip(keys, levels):
+            if not level:
+                continue
+
+            codes = _match_level(np, level, sorted_level, key_values.ravel())
+            selected = np.where(codes >= 0, codes + offset, selected)
+
+        return table[selected].reshape(shape)
+
+    def _build_batch_index(self, np):
+        '''
+        Table of the default followed by the values of all levels
+        and per level the offset into that table and the sorted rule keys.
+        '''
+        values = [self.default]
+        levels = []
+        for key in self.hierarchy:
+            level = self._index[key]
+            levels.append((level, len(values), _sorted_level(np, level)))
+            values.extend(level.values())
+
+        return _value_table(np, values, self.item.dtype), levels
+
+    def fingerprint(self):
+        '''
+        sha256 hex digest of the hierarchy, default and rules,
+        values are encoded by ``item.encode_value``.
+        '''
+        if self._fingerprint is None:
+            encode_value = self.item.encode_value
+            digest = hashlib.sha256()
+            digest.update(encode(self.hierarchy))
+            digest.update(encode_value(self.default))
+            # rule order matters, the first matching rule of a level wins
+            for key, key_value, value in self.lookups:
+                digest.update(encode((key, key_value)))
+                digest.update(encode_value(value))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def cache_info(self):
+        '''Hits, misses, maximum and current size of the lookup memo'''
+        return self._cache.info()
+
+    def cache_clear(self):
+        '''Remove all entries and statistics from the lookup memo'''
+        self._cache.clear()
+
     def __repr__(self):
         return f'{self.__class__.__name__}(hierarchy={self.hierarchy}, item={self.item})'
 
 
+def _sorted_level(np, level):
+    '''
+    Sorted array of the rule keys of one level, the sorting order and the
+    dtype kind of key values it can be searched with.
+    None if the keys are not all strings, all ints or all floats:
+    mixed ints and floats would be compared as floats, which is not
+    exact for large ints.
+    '''
+    rule_keys = list(level)
+    key_types = {type(k) for k in rule_keys}
+    if key_types not in ({str}, {int}, {float}):
+        return None
+
+    rule_keys = np.array(rule_keys)
+    # e.g. ints not fitting into int64
+    if rule_keys.dtype.kind not in 'Uif':
+        return None
+
+    order = np.argsort(rule_keys, kind='stable')
+    return rule_keys[order], order, rule_keys.dtype.kind
+
+
+def _match_level(np, level, sorted_level, key_values):
+    '''
+    Position of the matching rule in ``level`` for each key value, -1 if none.
+    '''
+    if sorted_level is not None and key_values.dtype.kind in sorted_level[2]:
+        sorted_keys, order, _ = sorted_level
+        pos = np.searchsorted(sorted_keys, key_values).clip(max=len(sorted_keys) - 1)
+        return np.where(sorted_keys[pos] == key_values, order[pos], -1)
+
+    # generic case, one dict probe per distinct key value
+    positions = {k: i for i, k in enumerate(level)}
+    unique, inverse = _factorize(np, key_values)
+    codes = np.fromiter(
+        (positions.get(k, -1) for k in unique), dtype=np.intp, count=len(unique),
+    )
+    return codes[inverse]
+
+
+def _factorize(np, values):
+    '''
+    Unique values as python objects and the index of each value into them
+    '''
+    if values.dtype != object:
+        unique, inverse = np.unique(values, return_inverse=True)
+        return unique.tolist(), inverse.ravel()
+
+    # object arrays might not be sortable, so factorize using a dict
+    positions = {}
+    inverse = np.fromiter(
+        (positions.setdefault(v, len(positions)) for v in values.tolist()),
+        dtype=np.intp,
+        count=len(values),
+    )
+    return list(positions), inverse
+
+
+def _value_table(np, values, dtype):
+    '''Array of the given values, typed if possible, else dtype object'''
+    if dtype is not None and None not in values:
+        try:
+            return np.array(values, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    table = np.empty(len(values), dtype=object)
+    # assign one by one, numpy would try to broadcast sequence values
+    for i, value in enumerate(values):
+        table[i] = value
+    return table
+
+
 class Lookup(Item):
-    def __init__(self, item, hierarchy, default_lookups=None, **kwargs):
+    __slots__ = ('item', 'cache_size', 'hierarchy', 'default_lookups')
+
+    def __init__(self, item, hierarchy, default_lookups=None, cache_size=1024, **kwargs):
         super().__init__(**kwargs)
         self.item = item
+        self.cache_size = cache_size
 
         if isinstance(hierarchy, str):
             self.hierarchy = (hierarchy, )
@@ -98,13 +399,14 @@ class Lookup(Item):
 
 
     def from_config(self, config):
-        if not isinstance(config, dict):
+        if not isinstance(config, Mapping):
             config = {"default": config}
 
         try:
             return LookupDatabase(
                 item=self.item,
                 hierarchy=self.hierarchy,
+                cache_size=self.cache_size,
                 **config
             )
         except:
@@ -112,7 +414,12 @@ class Lookup(Item):
 
 
     def get_default(self):
-        return LookupDatabase(self.item, self.hierarchy, lookups=self.default_lookups)
+        return LookupDatabase(
+            self.item,
+            self.hierarchy,
+            lookups=self.default_lookups,
+            cache_size=self.cache_size,
+        )
 
     def get_default_config(self):
         if self.default_lookups is None:
@@ -123,7 +430,12 @@ class Lookup(Item):
         if not isinstance(value, LookupDatabase):
             # assume a list is a list of lookups
             if isinstance(value, list):
-                return LookupDatabase(item=self.item, hierarchy=self.hierarchy, lookups=value)
+                return LookupDatabase(
+                    item=self.item,
+                    hierarchy=self.hierarchy,
+                    lookups=value,
+                    cache_size=self.cache_size,
+                )
 
             # see if it's a single value matching our item
             try:
@@ -131,7 +443,12 @@ class Lookup(Item):
             except ConfigError:
                 raise ConfigError(self, value, f'Single value must be valid for {self.item}')
 
-            return LookupDatabase(item=self.item, hierarchy=self.hierarchy, default=value)
+            return LookupDatabase(
+                item=self.item,
+                hierarchy=self.hierarchy,
+                default=value,
+                cache_size=self.cache_size,
+            )
 
         if value.hierarchy != self.hierarchy:
             raise ConfigError(
@@ -1,8 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+import errno
+import os
 import pathlib
+import stat
+
 from ..item import Item
 from ..exceptions import ConfigError
 
 
+# errors meaning "does not exist", same as ignored by pathlib.Path.exists
+_NOT_FOUND_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP}
+
+_active_cache = ContextVar('path_stat_cache', default=None)
+
+
+def _resolve(value):
+    return pathlib.Path(value).expanduser().resolve().absolute()
+
+
+def _stat(path):
+    '''``os.stat`` of path, None if it does not exist'''
+    try:
+        return os.stat(path)
+    except OSError as e:
+        if e.errno in _NOT_FOUND_ERRNOS:
+            return None
+        raise
+
+
+class StatCache:
+    '''
+    Resolved paths and their ``os.stat`` results, see `stat_cache`.
+    '''
+    def __init__(self):
+        self._resolved = {}
+        self._stats = {}
+
+    def resolve(self, value):
+        try:
+            return self._resolved[value]
+        except KeyError:
+            path = self._resolved[value] = _resolve(value)
+            return path
+
+    def stat(self, path):
+        try:
+            return self._stats[path]
+        except KeyError:
+            result = self._stats[path] = _stat(path)
+            return result
+
+    def prefetch(self, values, max_workers=None):
+        '''
+        Resolve and stat many paths concurrently in a thread pool.
+
+        Invalid values are skipped, they raise when they are validated.
+        '''
+        def fetch(value):
+            try:
+                self.stat(self.resolve(value))
+            except (OSError, ValueError, TypeError):
+                pass
+
+        values = [v for v in values if v is not None]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # consume the iterator to wait for all tasks
+            for _ in pool.map(fetch, values):
+                pass
+
+
+@contextmanager
+def stat_cache():
+    '''
+    Cache path resolution and ``os.stat`` calls of `Path` items.
+
+    Meant to be used around building a configuration, e.g.::
+
+        with stat_cache():
+            processor = ImageProcessor(config=config)
+
+    Inside the block, each path is resolved and stat'ed only once.
+    Changes to the filesystem during the block are not noticed.
+    Nested blocks share the cache of the outermost block.
+    '''
+    cache = _active_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = StatCache()
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
 class Path(Item):
     '''
     A `~pathlib.Path` item, that can optionally validate the given path.
@@ -17,6 +112,10 @@ class Path(Item):
     dir_okay: bool
         If False and path exists, the path must not be a directory
     '''
+    __slots__ = ('exists', 'file_okay', 'dir_okay', 'default')
+
+    #: minimum number of values validate_many checks in a thread pool
+    parallel_threshold = 64
 
     def __init__(self, default=None, exists=None, file_okay=True, dir_okay=True, **kwargs):
         super().__init__(**kwargs)
@@ -31,12 +130,19 @@ class Path(Item):
         if value is None:
             return None
 
+        cache = _active_cache.get()
+
         try:
-            value = pathlib.Path(value).expanduser().resolve().absolute()
+            value = _resolve(value) if cache is None else cache.resolve(value)
         except ValueError:
             raise ConfigError(self, value, "must be a valid input for pathlib.Path")
 
-        exists = value.exists()
+        # one stat call instead of separate exists / is_file / is_dir calls
+        if self.exists is None and self.file_okay and self.dir_okay:
+            return value
+
+        result = _stat(value) if cache is None else cache.stat(value)
+        exists = result is not None
         if exists and self.exists is False:
             raise ConfigError(self, value, "must not exist")
 
@@ -44,14 +150,29 @@ class Path(Item):
             raise ConfigError(self, value, "must exist")
 
         if exists:
-            if self.file_okay is False and value.is_file():
+            if self.file_okay is False and stat.S_ISREG(result.st_mode):
                 raise ConfigError(self, value, "must not be a file")
 
-            if self.dir_okay is False and value.is_dir():
+            if self.dir_okay is False and stat.S_ISDIR(result.st_mode):
                 raise ConfigError(self, value, "must not be a directory")
 
         return value
 
+    def validate_many(self, values, max_workers=None):
+        '''
+        Validate many values, resolving and stat'ing the paths
+        concurrently in a thread pool with ``max_workers`` threads.
+
+        The thread pool is only used if ``max_workers`` is given or
+        there are at least ``parallel_threshold`` values, fewer values
+        are validated one after the other.
+        '''
+        values = list(values)
+        with stat_cache() as cache:
+            if max_workers is not None or len(values) >= self.parallel_threshold:
+                cache.prefetch(values, max_workers=max_workers)
+            return [self.validate(value) for value in values]
+
     def get_default_config(self):
         return self.default
 
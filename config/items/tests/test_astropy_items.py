@@ -42,6 +42,58 @@ def test_quantity_unit():
         t.q = 5
 
 
+def test_quantity_conversion():
+    u = pytest.importorskip('astropy.units')
+    np = pytest.importorskip('numpy')
+
+    from config.items.astropy import QuantityItem
+
+    item = QuantityItem(unit=u.m)
+
+    # already in the target unit, no copy
+    q = np.arange(5.0) * u.m
+    assert item.validate(q) is q
+
+    values = np.arange(5.0)
+    validated = QuantityItem().validate(values)
+    assert np.shares_memory(validated.value, values)
+
+    # converted
+    converted = item.validate(q.to(u.km))
+    assert converted.unit is u.m
+    assert np.allclose(converted.value, q.value)
+
+    # equivalent unit, only the unit changes
+    equivalent = item.validate(q.value * u.km / u.mm * u.mm / u.km * u.m)
+    assert equivalent.unit is u.m
+
+    with pytest.raises(ConfigError):
+        item.validate(5 * u.s)
+
+    # unit given as string
+    item = QuantityItem(unit='m')
+    assert item.unit is u.m
+    assert item.validate(1 * u.km) == 1000 * u.m
+
+
+def test_quantity_invalid_unit():
+    u = pytest.importorskip('astropy.units')
+
+    from config.items.astropy import QuantityItem
+
+    with pytest.raises(ConfigError, match='valid unit'):
+        QuantityItem(unit='nope')
+
+    with pytest.raises(ConfigError, match='valid unit'):
+        QuantityItem(default=1 * u.m, unit='nope')
+
+    # validate does not change the item
+    item = QuantityItem(unit=u.m)
+    item.unit = 'km'
+    assert item.validate(1 * u.m) == 0.001 * u.km
+    assert item.unit == 'km'
+
+
 def test_quantity_allow_none():
     u = pytest.importorskip('astropy.units')
 
@@ -54,3 +106,34 @@ def test_quantity_allow_none():
     t = Test()
     with pytest.raises(ConfigError):
         t.q = None
+
+
+def test_astropy_imported_lazily():
+    import subprocess
+    import sys
+
+    # -X importtime reports every imported module on stderr
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import config.items.astropy'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = [line.rpartition('|')[2].strip() for line in result.stderr.splitlines()]
+    assert 'config.items.astropy' in imported
+    assert not any(name.startswith('astropy') for name in imported)
+
+
+def test_astropy_missing(monkeypatch):
+    import sys
+    import config.items.astropy
+    from config.items.astropy import QuantityItem
+
+    monkeypatch.setattr(config.items.astropy, '_units', None)
+    monkeypatch.setitem(sys.modules, 'astropy.units', None)
+
+    # no astropy needed as long as no quantity is validated
+    item = QuantityItem()
+
+    with pytest.raises(ImportError, match='You need ``astropy``'):
+        item.validate(5)
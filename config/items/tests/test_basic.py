@@ -115,3 +115,129 @@ def test_string_default_config():
 
     item = String(default='foo')
     assert item.get_default_config() == 'foo'
+
+
+@pytest.mark.parametrize('allow_none', [True, False])
+def test_compiled_validator(allow_none):
+    from fractions import Fraction
+    from config import Object, Int, Float, String
+
+    values = [None, True, 1, 1.0, 1.5, 2**70, Fraction(3, 1), Fraction(1, 2), 'a', b'a', [1]]
+
+    for cls in (Object, Int, Float, String):
+        item = cls(allow_none=allow_none, default=cls.type())
+        validate = item.compile_validator()
+
+        for value in values:
+            try:
+                expected = item.validate(value)
+            except ConfigError:
+                with pytest.raises(ConfigError):
+                    validate(value)
+            else:
+                result = validate(value)
+                assert type(result) is type(expected)
+                assert result == expected
+
+
+def test_compiled_validator_allow_none():
+    from config import Configurable, Float
+
+    class Test(Configurable):
+        value = Float(1.0)
+
+    t = Test()
+    t.value = None
+
+    Test.value.allow_none = False
+    with pytest.raises(ConfigError):
+        t.value = None
+
+
+def test_compiled_validator_subclass():
+    from config import Configurable, Float
+
+    class Positive(Float):
+        def validate(self, value):
+            value = super().validate(value)
+            if value is not None and value <= 0:
+                raise ConfigError(self, value, 'must be positive')
+            return value
+
+    class Test(Configurable):
+        value = Positive(1.0)
+
+    t = Test()
+    with pytest.raises(ConfigError):
+        t.value = -1.0
+
+    assert Positive().validate_many([1, 2]) == [1.0, 2.0]
+    with pytest.raises(ConfigError):
+        Positive().validate_many([1, -2])
+
+
+def test_validate_many():
+    from array import array
+    from config import Int, Float, String
+
+    values = Float().validate_many([1, 2.5])
+    assert values == array('d', [1.0, 2.5])
+
+    values = Int().validate_many(iter([1, 2.0]))
+    assert values == array('q', [1, 2])
+
+    assert Float().validate_many([1.0, None]) == [1.0, None]
+    assert String().validate_many(['a', 'b']) == ['a', 'b']
+
+    with pytest.raises(ConfigError):
+        Int().validate_many([1, 1.5])
+
+    with pytest.raises(ConfigError):
+        Float(allow_none=False).validate_many([None])
+
+
+def test_slots():
+    from copy import deepcopy
+    import pickle
+    from config import Int, Float, Path, List, Dict, Lookup, Configurable, ConfigurableInstance
+
+    items = [Int(1), Float(2.0, allow_none=False), Path('a'), List(Int()), Dict(Float()), Lookup(Int(1), 'type')]
+    for item in items + [ConfigurableInstance(Configurable, lazy=True)]:
+        assert not hasattr(item, '__dict__')
+
+    for item in items:
+        loaded = pickle.loads(pickle.dumps(item))
+        assert repr(loaded) == repr(item)
+        assert loaded.allow_none == item.allow_none
+
+    # subclasses without __slots__ still work
+    class Positive(Float):
+        def validate(self, value):
+            value = super().validate(value)
+            if value < 0:
+                raise ConfigError(self, value, 'must be positive')
+            return value
+
+    item = Positive(1.0)
+    item.extra = 1
+    copied = deepcopy(item)
+    assert copied.extra == 1 and copied.default == 1.0
+
+
+def test_copy_bound_item():
+    from copy import copy, deepcopy
+    from config import Configurable, List, Int
+
+    class Test(Configurable):
+        values = List(Int(), default=[1, 2])
+
+    copied = copy(Test.values)
+    assert copied is not Test.values
+    copied.allow_none = False
+    assert Test.values.allow_none is True
+
+    deep = deepcopy(Test.values)
+    assert deep.item is not Test.values.item
+    deep.default.append(3)
+    assert list(Test.values.default) == [1, 2]
+    assert list(Test().values) == [1, 2]
@@ -204,3 +204,204 @@ def test_subclasses():
 
     with pytest.raises(ConfigError):
         RootNoSubclasses(node=SubNode1())
+
+
+def test_get_default_does_not_build_default_config(monkeypatch):
+    from config import Configurable, ConfigurableInstance, Int
+
+    class Foo(Configurable):
+        val = Int(default=1)
+
+    class Bar(Configurable):
+        foo = ConfigurableInstance(cls=Foo, default_config={'val': 2})
+
+    class Baz(Configurable):
+        bar = ConfigurableInstance(cls=Bar, default_config={'foo': {'val': 3}})
+        bar2 = ConfigurableInstance(cls=Bar)
+
+    def fail(cls):
+        raise AssertionError('default config tree should not be built')
+
+    monkeypatch.setattr(Configurable, 'get_default_config', classmethod(fail))
+
+    baz = Baz()
+    assert baz.bar.foo.val == 3
+    assert baz.bar2.foo.val == 2
+
+
+def test_default_template_invalidation():
+    from config import Configurable, ConfigurableInstance, Int
+
+    class Foo(Configurable):
+        val = Int(default=1)
+
+    class Bar(Configurable):
+        foo = ConfigurableInstance(cls=Foo, default_config={'cls': 'Foo', 'val': 2})
+
+    assert type(Bar().foo) is Foo
+    assert Bar().foo.val == 2
+
+    Bar.foo.default_config = {'val': 3}
+    assert Bar().foo.val == 3
+
+    # a newly defined subclass can be selected by name
+    Bar.foo.default_config = {'cls': 'NewFoo'}
+    with pytest.raises(ConfigError):
+        Bar()
+
+    class NewFoo(Foo):
+        pass
+
+    assert type(Bar().foo) is NewFoo
+
+
+def test_default_subclass_shadowed_item():
+    from config import Configurable, ConfigurableInstance, Int
+
+    class Foo(Configurable):
+        val = Int(default=1)
+        other = Int(default=2)
+
+    class Sub(Foo):
+        val = Int(default=5)
+
+    class Bar(Configurable):
+        foo = ConfigurableInstance(cls=Foo, default_config={'cls': Sub})
+
+    # same result as creating the instance from the merged default config
+    expected = Bar.foo.from_config(Bar.foo.get_default_config())
+    foo = Bar().foo
+    assert type(foo) is Sub
+    assert foo.get_config() == expected.get_config() == {'val': 1, 'other': 2}
+
+
+def test_lazy():
+    from config import Configurable, ConfigurableInstance, Int
+    from config.items.configurable import DeferredInstance
+
+    created = []
+
+    class Foo(Configurable):
+        val = Int(default=1)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    class SubFoo(Foo):
+        other = Int(default=5)
+
+    class Bar(Configurable):
+        foo = ConfigurableInstance(Foo, default_config={'val': 2}, lazy=True)
+        sub = ConfigurableInstance(Foo, default_config={'cls': 'SubFoo'}, lazy=True)
+
+    assert Bar.foo.lazy
+
+    bar = Bar()
+    assert created == []
+    assert isinstance(bar.__dict__['foo'], DeferredInstance)
+
+    # full config without creating the members
+    assert bar.get_config() == {
+        'foo': {'val': 2},
+        'sub': {'val': 1, 'other': 5, 'cls': 'SubFoo'},
+    }
+    assert created == []
+
+    # created on first access, only once
+    assert bar.foo.val == 2
+    assert bar.foo is created[0]
+    assert len(created) == 1
+    assert type(bar.sub) is SubFoo
+    assert len(created) == 2
+    assert bar.get_config() == {
+        'foo': {'val': 2},
+        'sub': {'val': 1, 'other': 5, 'cls': 'SubFoo'},
+    }
+
+    bar = Bar(config={'foo': {'cls': 'SubFoo', 'other': 3}})
+    assert bar.get_config()['foo'] == {'val': 1, 'other': 3, 'cls': 'SubFoo'}
+    assert type(bar.foo) is SubFoo
+    assert bar.foo.other == 3
+
+    # invalid class, unknown keys and values are found right away
+    with pytest.raises(ConfigError):
+        Bar(config={'foo': {'cls': 'Nope'}})
+
+    with pytest.raises(ValueError):
+        Bar(config={'foo': {'nope': 1}})
+
+    with pytest.raises(ConfigError):
+        Bar(config={'foo': {'val': 'nope'}})
+
+    # assigning instances works as usual
+    foo = Foo(val=10)
+    bar = Bar(foo=foo)
+    assert bar.foo is foo
+    bar.foo = Foo(val=5)
+    assert bar.foo.val == 5
+
+    with pytest.raises(ConfigError):
+        bar.foo = 1
+
+
+def test_lazy_nested():
+    from config import Configurable, ConfigurableInstance, Int
+
+    class Foo(Configurable):
+        val = Int(default=1)
+
+    class Bar(Configurable):
+        foo = ConfigurableInstance(Foo, lazy=True)
+
+    class Baz(Configurable):
+        bar = ConfigurableInstance(Bar, default_config={'foo': {'val': 3}}, lazy=True)
+
+    baz = Baz()
+    assert baz.get_config() == {'bar': {'foo': {'val': 3}}}
+    assert baz.bar.get_config() == {'foo': {'val': 3}}
+    assert baz.bar.foo.val == 3
+
+
+def test_lazy_config_validated():
+    from config import Configurable, ConfigurableInstance, Int, Lookup, Float
+
+    class Child(Configurable):
+        n = Int(1)
+        lvl = Lookup(Float(5.0), ('type', ))
+
+    class Parent(Configurable):
+        child = ConfigurableInstance(Child, lazy=True)
+
+    parent = Parent(config={'child': {'n': 3.0, 'lvl': {}}})
+    before = parent.get_config()
+    assert before['child']['n'] == 3
+    assert type(before['child']['n']) is int
+
+    assert parent.child.n == 3
+    after = parent.get_config()
+    assert type(after['child']['n']) is int
+    assert after['child']['lvl'] == before['child']['lvl']
+    assert after == before
+
+
+def test_lazy_subclass():
+    from config import Configurable, ConfigurableInstance, Int
+    from config.items.configurable import LazyConfigurableInstance
+
+    class Foo(Configurable):
+        val = Int(1)
+
+    class Custom(ConfigurableInstance):
+        __slots__ = ()
+
+    with pytest.raises(TypeError, match='LazyConfigurableInstance'):
+        Custom(Foo, lazy=True)
+
+    class LazyCustom(LazyConfigurableInstance):
+        __slots__ = ()
+
+    class Bar(Configurable):
+        foo = LazyCustom(Foo, lazy=True)
+
+    assert Bar(config={'foo': {'val': 2}}).foo.val == 2
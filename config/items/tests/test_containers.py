@@ -0,0 +1,180 @@
+from array import array
+
+import pytest
+from config.exceptions import ConfigError
+
+
+def test_list_float():
+    from config import List, Float
+
+    item = List(Float())
+    value = item.validate([1, 2.5, 3])
+    assert isinstance(value, array)
+    assert value.typecode == 'd'
+    assert list(value) == [1.0, 2.5, 3.0]
+
+    assert item.validate(None) is None
+
+    with pytest.raises(ConfigError):
+        item.validate(['a', 1.0])
+
+    with pytest.raises(ConfigError):
+        item.validate('abc')
+
+    with pytest.raises(ConfigError):
+        item.validate(5.0)
+
+
+def test_list_int():
+    from config import List, Int
+
+    item = List(Int())
+    value = item.validate([1, 2.0, 3])
+    assert value.typecode == 'q'
+    assert list(value) == [1, 2, 3]
+
+    with pytest.raises(ConfigError):
+        item.validate([1, 2.5])
+
+    # does not fit into int64, stored as list
+    assert item.validate([2**70]) == [2**70]
+
+
+def test_list_none_elements():
+    from config import List, Float
+
+    assert List(Float()).validate([1.0, None]) == [1.0, None]
+
+    with pytest.raises(ConfigError):
+        List(Float(allow_none=False)).validate([1.0, None])
+
+
+def test_list_numpy():
+    from config import List, Float, Int
+    np = pytest.importorskip('numpy')
+
+    value = List(Float()).validate(np.arange(10.0)[::2])
+    assert isinstance(value, array)
+    assert list(value) == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+    value = List(Int()).validate(np.arange(5))
+    assert value.typecode == 'q'
+    assert list(value) == [0, 1, 2, 3, 4]
+
+    value = List(Int()).validate(np.arange(5, dtype=np.int16))
+    assert list(value) == [0, 1, 2, 3, 4]
+
+
+def test_list_string():
+    from config import List, String
+
+    item = List(String(), default=['a', 'b'])
+    assert item.validate(('c', )) == ['c']
+    assert item.get_default() == ['a', 'b']
+    assert item.get_default() is not item.default
+
+    with pytest.raises(ConfigError):
+        item.validate([1])
+
+
+def test_list_custom_validate():
+    from config import List, Float
+
+    class Positive(Float):
+        def validate(self, value):
+            value = super().validate(value)
+            if value is not None and value <= 0:
+                raise ConfigError(self, value, 'must be positive')
+            return value
+
+    item = List(Positive())
+    assert item.validate([1, 2]) == [1.0, 2.0]
+    with pytest.raises(ConfigError):
+        item.validate([1.0, -1.0])
+
+
+def test_set():
+    from config import Set, Int, String
+
+    assert Set(String()).validate(['a', 'b', 'a']) == {'a', 'b'}
+    assert Set(Int()).validate([1, 2.0, 1]) == {1, 2}
+
+    item = Set(String(), default={'b', 'a'})
+    assert item.get_default_config() == ['a', 'b']
+
+
+def test_dict():
+    from config import Dict, Float, Int
+
+    item = Dict(Float())
+    assert item.validate({'a': 1, 'b': 2.5}) == {'a': 1.0, 'b': 2.5}
+
+    with pytest.raises(ConfigError):
+        item.validate({1: 1.0})
+
+    with pytest.raises(ConfigError):
+        item.validate({'a': 'b'})
+
+    with pytest.raises(ConfigError):
+        item.validate([1.0])
+
+    item = Dict(Float(), key=Int())
+    assert item.validate({1: 1}) == {1: 1.0}
+
+
+def test_container_config():
+    from config import Configurable, List, Float
+
+    class Test(Configurable):
+        values = List(Float(), default=[1.0, 2.0])
+
+    t = Test()
+    assert list(t.values) == [1.0, 2.0]
+    assert Test.get_default_config() == {'values': [1.0, 2.0]}
+
+    t = Test(config={'values': [3, 4]})
+    assert isinstance(t.values, array)
+    assert t.get_config() == {'values': [3.0, 4.0]}
+
+    # defaults are not shared between instances
+    t.values.append(5.0)
+    assert list(Test().values) == [1.0, 2.0]
+
+
+def test_container_element_config():
+    from config import Configurable, ConfigurableInstance, Dict, Int, List, Set, Path
+
+    class Foo(Configurable):
+        val = Int(1)
+
+    class Test(Configurable):
+        foos = List(ConfigurableInstance(Foo), default=[])
+        by_name = Dict(ConfigurableInstance(Foo), default={})
+        paths = Set(Path(), default=set())
+
+    t = Test(config={
+        'foos': [{'val': 2}, {}],
+        'by_name': {'a': {'val': 3}},
+        'paths': ['b.txt', 'a.txt'],
+    })
+    assert [foo.val for foo in t.foos] == [2, 1]
+    assert t.by_name['a'].val == 3
+    assert t.get_config() == {
+        'foos': [{'val': 2}, {'val': 1}],
+        'by_name': {'a': {'val': 3}},
+        'paths': sorted(t.paths),
+    }
+    assert Test(config=t.get_config()).get_config() == t.get_config()
+
+    with pytest.raises(ConfigError):
+        Test(config={'by_name': [1]})
+
+
+def test_container_quantity():
+    u = pytest.importorskip('astropy.units')
+    from config import List
+    from config.items.astropy import QuantityItem
+
+    item = List(QuantityItem(unit='m'))
+    values = item.validate(item.from_config([{'value': 1, 'unit': 'km'}, 2 * u.m]))
+    assert values == [1000 * u.m, 2 * u.m]
@@ -49,6 +49,55 @@ def test_two_keys():
     assert lookup["SST", 3] == 1
 
 
+def test_precedence():
+    from config.items.lookup import LookupDatabase
+    from config import Int
+
+    lookup = LookupDatabase(
+        item=Int(1),
+        hierarchy=("type", "id"),
+        lookups=[
+            ("id", 5, 4),
+            ("type", "LST", 2),
+            ("type", "LST", 3),
+            ("id", 5, 6),
+        ],
+    )
+
+    # first matching rule of a level wins
+    assert lookup["LST", 1] == 2
+    assert lookup["SST", 5] == 4
+
+    # finer level wins, regardless of the order of the rules
+    assert lookup["LST", 5] == 4
+
+
+def test_lookups_columns():
+    from array import array
+    from config.items.lookup import LookupDatabase
+    from config import Float, Object
+
+    rules = [("id", 5, 4.0), ("type", "LST", 2.0), ("type", "LST", 3.0)]
+    lookup = LookupDatabase(Float(1.0), ("type", "id"), lookups=rules)
+    assert lookup.lookups == rules
+    assert lookup._rule_values == array("d", [4.0, 2.0, 3.0])
+    assert not hasattr(lookup, "__dict__")
+
+    lookup = LookupDatabase(Object(), "type", lookups=[("type", "LST", [1])])
+    assert lookup.lookups == [("type", "LST", [1])]
+    assert LookupDatabase(Float(1.0), "type").lookups == []
+
+
+def test_string_hierarchy():
+    from config.items.lookup import LookupDatabase
+    from config import Int
+
+    lookup = LookupDatabase(Int(1), "type", lookups=[("type", "LST", 2)])
+    assert lookup.hierarchy == ("type", )
+    assert lookup["LST"] == 2
+    assert lookup["MST"] == 1
+
+
 def test_lookup_invalid():
     from config.items.lookup import LookupDatabase
     from config import Int
@@ -88,6 +137,16 @@ def test_lookup_invalid():
         )
 
 
+    # unhashable key value
+    with pytest.raises(ValueError):
+        LookupDatabase(
+            item=Int(1),
+            hierarchy=("type", "id"),
+            lookups=[
+                ("type", ["LST"], 2),
+            ],
+        )
+
     lookup = LookupDatabase(
         item=Int(1),
         hierarchy=("type", "id"),
@@ -258,3 +317,147 @@ def test_configurable_instance_lookup_config():
     assert processor.cleaning['LST'].time['LST', 1] == 3.0
     assert processor.cleaning['LST'].time['LST', 2] == 4.0
     assert processor.cleaning['SST'].level['SST', 40] == 7.5
+
+
+def test_cache():
+    from config.items.lookup import LookupDatabase
+    from config import Int
+
+    lookup = LookupDatabase(
+        item=Int(1),
+        hierarchy=("type", "id"),
+        lookups=[("type", "LST", 2), ("id", 5, 4)],
+        cache_size=2,
+    )
+
+    assert lookup["LST", 1] == 2
+    assert lookup["LST", 1] == 2
+    info = lookup.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.maxsize == 2
+    assert info.currsize == 1
+
+    # least recently used entry is evicted
+    assert lookup["MST", 5] == 4
+    assert lookup["LST", 1] == 2
+    assert lookup["SST", 3] == 1
+    assert lookup.cache_info().currsize == 2
+    assert lookup["MST", 5] == 4
+    assert lookup.cache_info().misses == 4
+
+    lookup.cache_clear()
+    assert lookup.cache_info() == (0, 0, 2, 0)
+
+    # disabled cache
+    lookup = LookupDatabase(Int(1), "type", cache_size=0)
+    assert lookup["LST"] == 1
+    assert lookup["LST"] == 1
+    assert lookup.cache_info() == (0, 2, 0, 0)
+
+
+def test_cache_does_not_keep_database_alive():
+    import gc
+    import weakref
+    from config.items.lookup import LookupDatabase
+    from config import Int
+
+    lookup = LookupDatabase(Int(1), ("type", "id"))
+    assert lookup["LST", 1] == 1
+
+    ref = weakref.ref(lookup)
+    del lookup
+    gc.collect()
+    assert ref() is None
+
+
+def test_item_cache_size():
+    from config import Configurable, Float, Lookup
+
+    class Cleaning(Configurable):
+        level = Lookup(Float(5.0), hierarchy=("type", "id"), cache_size=10)
+
+    cleaning = Cleaning()
+    assert cleaning.level.cache_info().maxsize == 10
+
+    cleaning = Cleaning(config={"level": {"lookups": [("type", "LST", 1.0)]}})
+    assert cleaning.level.cache_info().maxsize == 10
+    assert cleaning.level["LST", 1] == 1.0
+
+
+def test_lookup_many():
+    np = pytest.importorskip("numpy")
+    from config.items.lookup import LookupDatabase
+    from config import Float, Int
+
+    lookup = LookupDatabase(
+        item=Float(1.0),
+        hierarchy=("type", "id"),
+        lookups=[
+            ("type", "LST", 2.0),
+            ("type", "MST", 3.0),
+            ("id", 5, 4.0),
+            ("id", 30, 5.0),
+            ("type", "LST", 6.0),
+        ],
+    )
+
+    types = np.array(["LST", "MST", "LST", "SST", "SST", "LST"])
+    tel_ids = np.array([1, 2, 5, 30, 3, 4])
+
+    values = lookup.lookup_many(types, tel_ids)
+    assert values.dtype == np.float64
+    assert values.flags.c_contiguous
+    np.testing.assert_array_equal(values, [2.0, 3.0, 4.0, 5.0, 1.0, 2.0])
+    assert values.tolist() == [lookup[t, i] for t, i in zip(types.tolist(), tel_ids.tolist())]
+
+    # broadcasting and multi-dimensional input
+    values = lookup.lookup_many("MST", tel_ids.reshape(2, 3))
+    assert values.shape == (2, 3)
+    np.testing.assert_array_equal(values, [[3.0, 3.0, 4.0], [5.0, 3.0, 3.0]])
+
+    # plain lists work as well
+    values = LookupDatabase(Int(1), "type", lookups=[("type", "LST", 2)]).lookup_many(["LST", "MST"])
+    assert values.dtype == np.int64
+    np.testing.assert_array_equal(values, [2, 1])
+
+    with pytest.raises(IndexError):
+        lookup.lookup_many(types)
+
+
+def test_lookup_many_object():
+    np = pytest.importorskip("numpy")
+    from config.items.lookup import LookupDatabase
+    from config import Float, Object
+
+    # None can't be stored in a float array
+    lookup = LookupDatabase(Float(), "type", lookups=[("type", "LST", 2.0)])
+    values = lookup.lookup_many(["LST", "MST"])
+    assert values.dtype == object
+    assert values.tolist() == [2.0, None]
+
+    # sequence values are stored as objects, object keys are supported
+    lookup = LookupDatabase(Object([1, 2]), "type", lookups=[("type", ("LST", 1), [3])])
+    keys = np.empty(2, dtype=object)
+    keys[:] = [("LST", 1), ("LST", 2)]
+    values = lookup.lookup_many(keys)
+    assert values.dtype == object
+    assert values.tolist() == [[3], [1, 2]]
+
+
+def test_lookup_many_mixed_numbers():
+    np = pytest.importorskip("numpy")
+    from config.items.lookup import LookupDatabase
+    from config import Float
+
+    # 2**53 + 1 can't be represented as float64
+    big = 2**53 + 1
+    lookup = LookupDatabase(Float(0.0), "id", lookups=[("id", 2**53, 1.0), ("id", 0.5, 2.0)])
+    keys = np.array([big, 2**53])
+    assert lookup.lookup_many(keys).tolist() == [lookup[big], lookup[2**53]] == [0.0, 1.0]
+
+    # ints are not searched with floats
+    lookup = LookupDatabase(Float(0.0), "id", lookups=[("id", 1, 1.0), ("id", big, 3.0)])
+    keys = np.array([1.0, 2.0])
+    assert lookup.lookup_many(keys).tolist() == [lookup[1.0], lookup[2.0]] == [1.0, 0.0]
+    assert lookup.lookup_many(np.array([big, 1])).tolist() == [3.0, 1.0]
@@ -76,3 +76,111 @@ def test_path_resolution():
 
     expected = pathlib.Path(os.environ['HOME']) / 'bar'
     assert path.validate('~/foo/../bar') == expected
+
+
+def test_path_single_stat(tmp_path, monkeypatch):
+    from config import Path
+    import config.items.path
+
+    calls = []
+    real_stat = config.items.path._stat
+
+    def stat(path):
+        calls.append(path)
+        return real_stat(path)
+
+    monkeypatch.setattr(config.items.path, '_stat', stat)
+
+    item = Path(exists=True, file_okay=False)
+    assert item.validate(tmp_path) == tmp_path
+    assert calls == [tmp_path]
+
+    # no check requested, no stat needed
+    calls.clear()
+    Path().validate(tmp_path)
+    assert calls == []
+
+
+def test_stat_cache(tmp_path, monkeypatch):
+    from config import Configurable, Path
+    from config.items.path import stat_cache
+    import config.items.path
+
+    existing_file = tmp_path / 'yes'
+    existing_file.touch()
+
+    calls = []
+    real_stat = config.items.path._stat
+
+    def stat(path):
+        calls.append(path)
+        return real_stat(path)
+
+    monkeypatch.setattr(config.items.path, '_stat', stat)
+
+    class Foo(Configurable):
+        a = Path(exists=True)
+        b = Path(dir_okay=False)
+
+    with stat_cache() as cache:
+        with stat_cache() as inner:
+            assert inner is cache
+
+        for _ in range(3):
+            foo = Foo(a=existing_file, b=existing_file)
+
+        assert foo.a == foo.b == existing_file
+        assert calls == [existing_file]
+
+        with pytest.raises(ConfigError):
+            Foo(a=existing_file, b=tmp_path)
+
+        # results are kept for the whole block
+        existing_file.unlink()
+        Foo(a=existing_file)
+
+    # outside the block, the filesystem is checked again
+    with pytest.raises(ConfigError):
+        Foo(a=existing_file)
+
+
+def test_path_validate_many(tmp_path):
+    from config import Path
+
+    paths = [tmp_path / f'{i}.txt' for i in range(20)]
+    for path in paths[::2]:
+        path.touch()
+
+    item = Path()
+    assert item.validate_many([str(p) for p in paths] + [None], max_workers=4) == paths + [None]
+
+    item = Path(exists=True)
+    with pytest.raises(ConfigError):
+        item.validate_many(paths, max_workers=4)
+
+    assert item.validate_many(paths[::2]) == paths[::2]
+
+
+def test_path_validate_many_sequential(tmp_path, monkeypatch):
+    from config import Path
+    from config.items.path import StatCache
+
+    prefetched = []
+    original = StatCache.prefetch
+
+    def prefetch(self, values, max_workers=None):
+        prefetched.append(len(values))
+        return original(self, values, max_workers=max_workers)
+
+    monkeypatch.setattr(StatCache, 'prefetch', prefetch)
+
+    item = Path(exists=False)
+    paths = [tmp_path / f'{i}.txt' for i in range(item.parallel_threshold)]
+
+    # small inputs do not start a thread pool
+    assert item.validate_many(iter(paths[:3])) == paths[:3]
+    assert prefetched == []
+
+    assert item.validate_many(paths[:3], max_workers=2) == paths[:3]
+    assert item.validate_many(paths) == paths
+    assert prefetched == [3, len(paths)]
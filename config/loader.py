@@ -0,0 +1,275 @@
+'''
+Loading configuration from files, environment variables and other sources.
+
+Sources are layered, later sources take precedence over earlier ones, e.g.::
+
+    loader = ConfigLoader(
+        defaults,
+        FileSource('/etc/myapp/config.toml', optional=True),
+        FileSource('~/.config/myapp/config.yaml', optional=True),
+        EnvSource('MYAPP_'),
+        cli_config,
+    )
+    processor = ImageProcessor(config=loader.load())
+
+The parsers are only imported when a file of their format is loaded.
+'''
+from collections.abc import Mapping
+import json
+import os
+import pathlib
+
+from .dict_handling import NestedChainMap
+
+
+__all__ = [
+    'ConfigLoader',
+    'EnvSource',
+    'FileSource',
+    'load_config',
+    'merge',
+]
+
+
+def _parse_json(stream):
+    return json.load(stream)
+
+
+def _parse_toml(stream):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError(
+                'You need ``tomli`` to load toml files with python < 3.11'
+            ) from None
+
+    return tomllib.load(stream)
+
+
+def _parse_yaml(stream):
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError('You need ``pyyaml`` to load yaml files') from None
+
+    return yaml.safe_load(stream)
+
+
+#: format name -> function parsing a binary stream
+PARSERS = {
+    'json': _parse_json,
+    'toml': _parse_toml,
+    'yaml': _parse_yaml,
+}
+
+#: file suffix -> format name
+SUFFIXES = {
+    '.json': 'json',
+    '.toml': 'toml',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+}
+
+
+def merge(base, override):
+    '''
+    Merge two configs, values in ``override`` take precedence.
+
+    Unlike ``recursive_update``, no input is modified and nothing is copied
+    besides the dicts on the paths where both configs have a mapping.
+    All other subtrees are shared with the inputs,
+    so the result must be treated as read-only.
+    A mapping in ``override`` replaces a non-mapping value in ``base``
+    and vice versa.
+
+    >>> merge({'a': {'b': 1, 'c': 2}, 'd': 3}, {'a': {'b': 5}})
+    {'a': {'b': 5, 'c': 2}, 'd': 3}
+    '''
+    if not isinstance(base, Mapping) or not isinstance(override, Mapping):
+        raise TypeError('Arguments must be mappings')
+
+    if not override:
+        return base
+
+    if not base:
+        return override
+
+    merged = dict(base)
+    for k, v in override.items():
+        old = merged.get(k)
+        if isinstance(v, Mapping) and isinstance(old, Mapping):
+            merged[k] = merge(old, v)
+        else:
+            merged[k] = v
+    return merged
+
+
+class FileSource:
+    '''
+    A config file in json, toml or yaml format.
+
+    The file is parsed once, it is only parsed again if its
+    modification time or size changed.
+
+    Attributes
+    ----------
+    path: pathlib.Path
+        Path of the file, ``~`` is expanded
+    format: str
+        One of the keys of ``PARSERS``, determined from the suffix if not given
+    optional: bool
+        If True, a missing file is treated as an empty config
+    '''
+
+    def __init__(self, path, format=None, optional=False):
+        self.path = pathlib.Path(path).expanduser()
+
+        if format is None:
+            format = SUFFIXES.get(self.path.suffix.lower())
+            if format is None:
+                raise ValueError(
+                    f'Could not determine format of {self.path}'
+                    f', known suffixes are {list(SUFFIXES)}'
+                )
+
+        if format not in PARSERS:
+            raise ValueError(f'Unknown format {format!r}, known formats are {list(PARSERS)}')
+
+        self.format = format
+        self.optional = optional
+        self._parsed = None
+        self._stat_key = None
+
+    def load(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self.optional:
+                return {}
+            raise
+
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if stat_key != self._stat_key:
+            with open(self.path, 'rb') as f:
+                config = PARSERS[self.format](f)
+
+            if config is None:
+                # e.g. an empty yaml file
+                config = {}
+
+            if not isinstance(config, Mapping):
+                raise ValueError(f'Config file {self.path} must contain a mapping at the top level')
+
+            self._parsed = config
+            self._stat_key = stat_key
+
+        return self._parsed
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({str(self.path)!r}, format={self.format!r})'
+
+
+class EnvSource:
+    '''
+    Config from environment variables.
+
+    A variable ``<prefix><key><separator><subkey>`` sets ``config[key][subkey]``,
+    keys are converted to lower case.
+    Values are parsed as json if possible, else used as strings,
+    e.g. ``MYAPP_CLEANING__LEVEL=5.0`` gives ``{'cleaning': {'level': 5.0}}``.
+
+    Attributes
+    ----------
+    prefix: str
+        Only variables starting with prefix are used
+    separator: str
+        Separator of the nested keys
+    environ: Mapping or None
+        The variables, defaults to ``os.environ`` at the time of loading
+    '''
+    def __init__(self, prefix, separator='__', environ=None):
+        if not prefix:
+            raise ValueError('prefix must not be empty')
+
+        self.prefix = prefix
+        self.separator = separator
+        self.environ = environ
+
+    def load(self):
+        environ = os.environ if self.environ is None else self.environ
+
+        config = {}
+        for name, value in environ.items():
+            if not name.startswith(self.prefix):
+                continue
+
+            keys = name[len(self.prefix):].lower().split(self.separator)
+            node = config
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+                if not isinstance(node, dict):
+                    raise ValueError(f'Environment variable {name} conflicts with another variable')
+
+            node[keys[-1]] = _parse_env_value(value)
+
+        return config
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.prefix!r}, separator={self.separator!r})'
+
+
+def _parse_env_value(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _as_source(source):
+    if isinstance(source, (str, os.PathLike)):
+        return FileSource(source)
+    return source
+
+
+class ConfigLoader:
+    '''
+    Layered config from several sources, later sources take precedence.
+
+    Sources can be mappings, paths of config files or any object
+    with a ``load()`` method returning a mapping, e.g. `FileSource`
+    and `EnvSource`.
+    '''
+    def __init__(self, *sources):
+        self.sources = [_as_source(source) for source in sources]
+
+    def load(self):
+        '''
+        The merged config of all sources, see `merge`.
+        '''
+        config = {}
+        for layer in self._load_layers():
+            config = merge(config, layer)
+        return config
+
+    def view(self):
+        '''
+        A read-only `~config.dict_handling.NestedChainMap` over all sources.
+
+        Unlike `load`, nothing is merged up front, only the parts
+        of the config that are actually read are resolved.
+        '''
+        return NestedChainMap(*reversed(self._load_layers()))
+
+    def _load_layers(self):
+        return [
+            source if isinstance(source, Mapping) else source.load()
+            for source in self.sources
+        ]
+
+
+def load_config(*sources):
+    '''Load and merge the config of all sources, see `ConfigLoader`'''
+    return ConfigLoader(*sources).load()
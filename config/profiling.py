@@ -0,0 +1,175 @@
+'''
+Opt-in timing of config builds.
+
+While a `Profiler` is active, the time spent creating instances is
+recorded per item path, for each of
+
+* ``__init__``: `Configurable.__init__`, including all its members
+* ``from_config``: creating a value from its config
+* ``get_default``: creating the default value
+* ``validate``: validating a value when it is assigned
+
+::
+
+    with Profiler() as profiler:
+        processor = ImageProcessor(config=config)
+
+    print(profiler.table())
+    profiler.write_chrome_trace('build.json')  # open in chrome://tracing or perfetto
+
+Paths start with the name of the outermost class created, e.g.
+``ImageProcessor.cleaning.level``. Times are inclusive of nested calls.
+When no profiler is active, the hooks only check a module global.
+'''
+from collections import namedtuple
+import json
+import os
+import threading
+from time import perf_counter_ns
+
+
+__all__ = [
+    'Profiler',
+    'ProfileEntry',
+]
+
+
+#: the active profiler, checked by the hooks in the hot paths
+_active = None
+
+
+#: Accumulated timing of one kind of call for one item path, times in seconds
+ProfileEntry = namedtuple('ProfileEntry', ['path', 'kind', 'calls', 'total', 'mean'])
+
+_SORT_KEYS = {
+    'path': lambda e: (e.path, e.kind),
+    'calls': lambda e: -e.calls,
+    'total': lambda e: -e.total,
+    'mean': lambda e: -e.mean,
+}
+
+
+class Profiler:
+    '''
+    Records the time spent in config builds while active.
+
+    Use as context manager, only one profiler can be active at a time.
+    Calls from all threads are recorded.
+    '''
+    def __init__(self):
+        self._stats = {}
+        self._events = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError('Another profiler is already active')
+        _active = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        _active = None
+
+    def call(self, segment, kind, func, *args):
+        '''
+        Call ``func(*args)`` and record its duration.
+
+        segment is appended to the current item path for the duration
+        of the call, None keeps the current path.
+        '''
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        if segment is not None:
+            stack.append(segment)
+
+        start = perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            duration = perf_counter_ns() - start
+            key = ('.'.join(stack), kind)
+            if segment is not None:
+                stack.pop()
+
+            with self._lock:
+                stat = self._stats.get(key)
+                if stat is None:
+                    self._stats[key] = [1, duration]
+                else:
+                    stat[0] += 1
+                    stat[1] += duration
+                self._events.append((key, start, duration, threading.get_ident()))
+
+    @property
+    def depth(self):
+        '''Number of path segments of the current thread'''
+        return len(getattr(self._local, 'stack', ()))
+
+    def entries(self, sort='total'):
+        '''
+        The recorded timings as list of `ProfileEntry`.
+
+        Parameters
+        ----------
+        sort: str
+            One of 'total', 'mean', 'calls' (descending) or 'path'
+        '''
+        if sort not in _SORT_KEYS:
+            raise ValueError(f'sort must be one of {list(_SORT_KEYS)}, got {sort!r}')
+
+        with self._lock:
+            stats = list(self._stats.items())
+
+        entries = [
+            ProfileEntry(path, kind, calls, total / 1e9, total / calls / 1e9)
+            for (path, kind), (calls, total) in stats
+        ]
+        entries.sort(key=_SORT_KEYS[sort])
+        return entries
+
+    def table(self, sort='total', limit=None):
+        '''The recorded timings as text table, see `entries`'''
+        entries = self.entries(sort)[:limit]
+
+        width = max([len(e.path) for e in entries] + [4])
+        lines = [f'{"path":<{width}}  {"kind":<11}  {"calls":>8}  {"total [ms]":>11}  {"mean [µs]":>10}']
+        for e in entries:
+            lines.append(
+                f'{e.path:<{width}}  {e.kind:<11}  {e.calls:>8}'
+                f'  {e.total * 1e3:>11.3f}  {e.mean * 1e6:>10.2f}'
+            )
+        return '\n'.join(lines)
+
+    def chrome_trace(self):
+        '''
+        The recorded calls in the Chrome trace event format,
+        as used by chrome://tracing and https://ui.perfetto.dev
+        '''
+        with self._lock:
+            events = list(self._events)
+
+        pid = os.getpid()
+        return {
+            'traceEvents': [
+                {
+                    'name': path,
+                    'cat': kind,
+                    'ph': 'X',
+                    'ts': start / 1e3,
+                    'dur': duration / 1e3,
+                    'pid': pid,
+                    'tid': tid,
+                }
+                for (path, kind), start, duration, tid in events
+            ],
+            'displayTimeUnit': 'ms',
+        }
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
@@ -0,0 +1,253 @@
+'''
+Opt-in storage of item values in ``__slots__``.
+
+Configurable instances store their values in a per instance ``__dict__``.
+For classes with very many small instances, decorating them with `slotted`
+stores the values in fixed slots instead, saving the dict::
+
+    @slotted
+    class Telescope(Configurable):
+        tel_id = Int(1)
+        focal_length = Float(28.0)
+
+Subclasses of slotted classes must be decorated as well.
+For the bookkeeping of `Configurable`, ``instance.__dict__`` returns a
+mapping view on the slots. Assigning ``__dict__``, as done by
+`Configurable.reconfigure`, sets the slots one by one, so concurrent readers
+might see only part of the changes of a slotted instance.
+'''
+from collections.abc import MutableMapping
+
+from .configurable import Configurable, InstantiationPlan
+from .item import Item, EXPORT_STATE
+from . import profiling
+
+
+__all__ = ['slotted']
+
+
+class SlotItem:
+    '''
+    Data descriptor storing the values of ``item`` in the slot ``member``.
+
+    Accessed on the class, it returns the item, like for other classes.
+    '''
+    __slots__ = ('item', 'member', 'state', '_read', '_custom_set')
+
+    def __init__(self, item):
+        self.item = item
+        self.member = None
+        self._read = None
+        # slot of the export state
+        self.state = None
+        self._custom_set = type(item).__set__ is not Item.__set__
+
+    def bind(self, member, state):
+        self.member = member
+        self._read = member.__get__
+        self.state = state
+
+    def __set_name__(self, owner, name):
+        self.item.__set_name__(owner, name)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.item
+        return self._read(instance)
+
+    def __set__(self, instance, value):
+        item = self.item
+        if self._custom_set:
+            # stores the value through SlotValues
+            item.__set__(instance, value)
+            return
+
+        # same as Item.__set__, without going through SlotValues
+        validate = item._validator
+        if validate is None:
+            validate = item._validator = item.compile_validator()
+
+        profiler = profiling._active
+        if profiler is not None:
+            value = profiler.call(item.name, 'validate', validate, value)
+        else:
+            value = validate(value)
+
+        self.member.__set__(instance, value)
+
+        # set to None on creation, see slotted
+        state = self.state.__get__(instance)
+        if state is not None:
+            state.invalidate()
+
+
+class LazySlotItem(SlotItem):
+    '''SlotItem for items creating the value on access, i.e. lazy members'''
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.item
+        return self.item.__get__(instance, owner)
+
+
+class SlotValues(MutableMapping):
+    '''The values stored in the slots of an instance, as mapping'''
+    __slots__ = ('_instance', '_members')
+
+    def __init__(self, instance):
+        self._instance = instance
+        self._members = type(instance)._slot_members
+
+    def _member(self, key):
+        member = self._members.get(key)
+        if member is None:
+            raise KeyError(key)
+        return member
+
+    def __getitem__(self, key):
+        try:
+            return self._member(key).__get__(self._instance)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        self._member(key).__set__(self._instance, value)
+
+    def update(self, *args, **kwargs):
+        # faster than MutableMapping.update, used for the defaults in Configurable.__init__
+        instance = self._instance
+        members = self._members
+        for key, value in dict(*args, **kwargs).items():
+            member = members.get(key)
+            if member is None:
+                raise KeyError(key)
+            member.__set__(instance, value)
+
+    def __delitem__(self, key):
+        try:
+            self._member(key).__delete__(self._instance)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        instance = self._instance
+        for key, member in self._members.items():
+            try:
+                member.__get__(instance)
+            except AttributeError:
+                continue
+            yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self)})'
+
+
+def _assign_values(instance, values):
+    slots = SlotValues(instance)
+    values = dict(values)
+    for key in list(slots):
+        if key not in values:
+            del slots[key]
+    slots.update(values)
+
+
+def _new(cls, *args, **kwargs):
+    instance = object.__new__(cls)
+    # so that assignments can check for an export state without catching AttributeError
+    cls._slot_members[EXPORT_STATE].__set__(instance, None)
+    return instance
+
+
+def _slot_name(name):
+    return f'_slot_{name}'
+
+
+def _replace_class_cell(value, old, new):
+    '''Point the ``__class__`` cell of methods using ``super()`` to the new class'''
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    if isinstance(value, property):
+        for func in (value.fget, value.fset, value.fdel):
+            _replace_class_cell(func, old, new)
+        return
+
+    for cell in getattr(value, '__closure__', None) or ():
+        try:
+            if cell.cell_contents is old:
+                cell.cell_contents = new
+        except ValueError:
+            # empty cell
+            pass
+
+
+def slotted(cls):
+    '''
+    Class decorator storing the item values of instances of ``cls`` in ``__slots__``.
+
+    Returns a new class created from the namespace of ``cls``, with a slot per
+    item and ``__weakref__``. The cached config uses the slot of `Configurable`.
+    All configurable bases must be slotted as well.
+    Other attributes of instances need to be declared in ``__slots__`` of ``cls``,
+    as slotted instances have no ``__dict__``.
+    '''
+    if not (isinstance(cls, type) and issubclass(cls, Configurable)):
+        raise TypeError(f'slotted can only be used on Configurable subclasses, got {cls!r}')
+
+    for base in cls.__mro__[1:-1]:
+        if '__slots__' not in base.__dict__:
+            raise TypeError(f'Base {base.__name__} of {cls.__name__} must be slotted as well')
+
+    members = {}
+    for base in reversed(cls.__mro__[1:]):
+        members.update(base.__dict__.get('_slot_members', {}))
+
+    extra_slots = cls.__dict__.get('__slots__', ())
+    if isinstance(extra_slots, str):
+        extra_slots = (extra_slots, )
+
+    excluded = {'__dict__', '__weakref__', '__config__', '__plan__', '_subclass_registry'}
+    excluded.update(extra_slots)
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in excluded}
+    namespace['__qualname__'] = cls.__qualname__
+
+    # the export state is stored in the slot of Configurable
+    first = not any(
+        b is not Configurable and '_slot_members' in b.__dict__ for b in cls.__mro__[1:]
+    )
+    slots = {}
+    if first:
+        namespace['__dict__'] = property(SlotValues, _assign_values)
+        if '__new__' not in namespace:
+            namespace['__new__'] = _new
+
+    wrappers = {}
+    for name, value in cls.__dict__.items():
+        if isinstance(value, Item):
+            # items redefined in a subclass reuse the slot of the base
+            if name not in members:
+                slots[name] = _slot_name(name)
+            wrapper_cls = LazySlotItem if hasattr(type(value), '__get__') else SlotItem
+            namespace[name] = wrappers[name] = wrapper_cls(value)
+
+    namespace['__slots__'] = (
+        tuple(slots.values()) + tuple(extra_slots) + (('__weakref__', ) if first else ())
+    )
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    for name, slot in slots.items():
+        members[name] = new_cls.__dict__[slot]
+    new_cls._slot_members = members
+    # not created by __init_subclass__, as the class has no __dict__
+    new_cls.__plan__ = InstantiationPlan(new_cls.__config__)
+
+    for name, wrapper in wrappers.items():
+        wrapper.bind(members[name], members[EXPORT_STATE])
+
+    for value in namespace.values():
+        _replace_class_cell(value, cls, new_cls)
+
+    return new_cls
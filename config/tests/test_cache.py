@@ -0,0 +1,147 @@
+import json
+import pickle
+
+import pytest
+
+from config import Configurable, ConfigurableInstance, Float, Int, Lookup, Path
+
+
+class Cleaning(Configurable):
+    level = Lookup(Float(5.0), ('type', 'id'))
+
+
+class TailcutsCleaning(Cleaning):
+    picture = Float(10.0)
+
+
+class Processor(Configurable):
+    cleaning = ConfigurableInstance(Cleaning)
+    lazy_cleaning = ConfigurableInstance(Cleaning, lazy=True)
+    n_pixels = Int(1855)
+    output = Path('out.h5')
+
+
+def test_pickle_tree():
+    processor = Processor(config={
+        'cleaning': {'cls': 'TailcutsCleaning', 'level': {'lookups': [('type', 'LST', 3.0)]}},
+    })
+    processor.n_pixels = 10
+    # creates the export cache, which is not pickled
+    assert processor.get_config()['n_pixels'] == 10
+
+    loaded = pickle.loads(pickle.dumps(processor))
+    assert isinstance(loaded.cleaning, TailcutsCleaning)
+    assert loaded.cleaning.level['LST', 1] == 3.0
+    assert loaded.n_pixels == 10
+    assert loaded.output == processor.output
+
+    # items are pickled by reference
+    assert loaded.cleaning.level.item is not None
+    assert pickle.loads(pickle.dumps(Processor.n_pixels)) is Processor.n_pixels
+
+    # still validates after unpickling
+    loaded.n_pixels = 5.0
+    assert loaded.n_pixels == 5
+
+    # and tracks changes of members
+    assert loaded.get_config()['cleaning']['picture'] == 10.0
+    loaded.cleaning.picture = 3.0
+    assert loaded.get_config()['cleaning']['picture'] == 3.0
+
+
+def test_resolved_config_cache(tmp_path, monkeypatch):
+    from config.cache import ResolvedConfigCache
+
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'n_pixels': 5, 'cleaning': {'level': 2.0}}))
+
+    cache = ResolvedConfigCache(tmp_path / 'cache')
+    processor = cache.load(Processor, config_path, {'n_pixels': 10})
+    assert processor.n_pixels == 10
+    assert processor.cleaning.level['LST', 1] == 2.0
+    assert len(list(cache.directory.glob('*.pickle'))) == 1
+
+    # the second load comes from the snapshot, no instance is created
+    def fail(*args, **kwargs):
+        raise AssertionError('Instance created')
+
+    with monkeypatch.context() as m:
+        m.setattr(Processor, '__init__', fail)
+        cached = cache.load(Processor, config_path, {'n_pixels': 10})
+
+    assert cached is not processor
+    assert cached.n_pixels == 10
+    assert cached.cleaning.level['LST', 1] == 2.0
+
+    # changed sources create a new snapshot
+    config_path.write_text(json.dumps({'n_pixels': 5, 'cleaning': {'level': 3.0}}))
+    processor = cache.load(Processor, config_path)
+    assert processor.cleaning.level['LST', 1] == 3.0
+    assert len(list(cache.directory.glob('*.pickle'))) == 2
+
+    # broken snapshots are replaced
+    key = cache.key(Processor, config_path)
+    cache.path(key).write_bytes(b'foo')
+    assert cache.load(Processor, config_path).n_pixels == 5
+
+    cache.clear()
+    assert list(cache.directory.glob('*.pickle')) == []
+
+
+def test_schema_hash():
+    from config.cache import schema_hash
+
+    def make_class(default):
+        class Test(Configurable):
+            value = Int(default)
+        return Test
+
+    assert schema_hash(make_class(1)) == schema_hash(make_class(1))
+    assert schema_hash(make_class(1)) != schema_hash(make_class(2))
+
+    # subclasses of members are part of the schema
+    before = schema_hash(Processor)
+    assert before == schema_hash(Processor)
+
+    class OtherCleaning(Cleaning):
+        pass
+
+    assert schema_hash(Processor) != before
+
+
+def test_unpicklable(tmp_path):
+    from config.cache import ResolvedConfigCache
+
+    class Local(Configurable):
+        value = Int(1)
+
+    cache = ResolvedConfigCache(tmp_path)
+    with pytest.warns(UserWarning, match='Could not cache'):
+        assert cache.load(Local, {'value': 2}).value == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_schema_hash_stable_across_processes():
+    import os
+    import subprocess
+    import sys
+
+    code = '\n'.join([
+        'from config import Configurable, Object, Set, String',
+        'from config.cache import schema_hash',
+        'class Test(Configurable):',
+        '    names = Set(String(), default={"a", "b", "c", "d", "e", "f"})',
+        '    frozen = Object(frozenset({"x", "y", "z", "w"}))',
+        'print(schema_hash(Test))',
+    ])
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    hashes = set()
+    for seed in ('1', '2', '3'):
+        env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=root)
+        result = subprocess.run(
+            [sys.executable, '-c', code], env=env, check=True, capture_output=True, text=True,
+        )
+        hashes.add(result.stdout.strip())
+
+    assert len(hashes) == 1
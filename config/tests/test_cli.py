@@ -0,0 +1,149 @@
+import gc
+import json
+
+import pytest
+
+
+def make_classes():
+    '''
+    Name to class of all test classes.
+
+    The subclass registry only holds weak references,
+    so the tests keep the returned dict alive while running.
+    '''
+    from config import Configurable, ConfigurableInstance, Float, Int, List, String, Lookup
+
+    class Cleaning(Configurable):
+        pass
+
+    class BasicCleaning(Cleaning):
+        level = Lookup(Float(5.0), ('type', 'id'), help='The cleaning level')
+
+    class BetterCleaning(Cleaning):
+        level = Lookup(Float(5.0), ('type', 'id'), help='The cleaning level')
+        ids = List(Int(), default=[1, 2])
+        method = String('tailcuts')
+
+    class ImageProcessor(Configurable):
+        cleaning = ConfigurableInstance(Cleaning, default_config=dict(cls=BasicCleaning))
+        n_pixels = Int(1855)
+
+    return {
+        cls.__name__: cls
+        for cls in (Cleaning, BasicCleaning, BetterCleaning, ImageProcessor)
+    }
+
+
+def test_parse_config():
+    from config.cli import parse_config
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    assert parse_config(ImageProcessor, []) == {}
+    assert parse_config(ImageProcessor, ['--n_pixels', '10']) == {'n_pixels': 10}
+
+    config = parse_config(ImageProcessor, [
+        '--cleaning.cls=BetterCleaning',
+        '--cleaning.level=3',
+        '--cleaning.ids', '3', '4',
+        '--cleaning.method', '5',
+    ])
+    assert config == {'cleaning': {
+        'cls': 'BetterCleaning', 'level': 3, 'ids': [3, 4], 'method': '5',
+    }}
+
+    processor = ImageProcessor(config=config)
+    assert processor.cleaning.__class__.__name__ == 'BetterCleaning'
+    assert processor.cleaning.level['LST', 1] == 3.0
+    assert list(processor.cleaning.ids) == [3, 4]
+
+
+def test_unknown_option(capsys):
+    from config.cli import parse_config
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    # items of not selected classes are not available
+    with pytest.raises(SystemExit):
+        parse_config(ImageProcessor, ['--cleaning.ids', '1'])
+    assert 'unrecognized arguments' in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        parse_config(ImageProcessor, ['--cleaning.cls', 'Foo'])
+    assert 'invalid choice' in capsys.readouterr().err
+
+
+def test_help(capsys):
+    from config.cli import parse_config
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    with pytest.raises(SystemExit):
+        parse_config(ImageProcessor, ['--help'])
+    out = capsys.readouterr().out
+    assert '--n_pixels' in out
+    assert '--cleaning.level' in out
+    assert '--cleaning.ids' not in out
+    assert 'BetterCleaning' in out
+
+    with pytest.raises(SystemExit):
+        parse_config(ImageProcessor, ['--cleaning.cls=BetterCleaning', '-h'])
+    out = capsys.readouterr().out
+    assert '--cleaning.ids' in out
+
+
+def test_lazy_options():
+    from config.cli import build_parser
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    parser = build_parser(ImageProcessor, ['--n_pixels=5'])
+    options = {o for action in parser._actions for o in action.option_strings}
+    assert options == {'-h', '--help', '--config-file', '--n_pixels'}
+
+
+def test_config_file(tmp_path):
+    from config.cli import parse_config
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'n_pixels': 5, 'cleaning': {'level': 1.0}}))
+
+    config = parse_config(ImageProcessor, ['--config-file', str(path), '--n_pixels=10'])
+    assert config == {'n_pixels': 10, 'cleaning': {'level': 1.0}}
+
+
+def test_config_file_cls(tmp_path, capsys):
+    from config.cli import build_parser, parse_config
+
+    classes = make_classes()
+    ImageProcessor = classes['ImageProcessor']
+    gc.collect()
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'cleaning': {'cls': 'BetterCleaning'}}))
+
+    # the options of the class selected in the config file are available
+    config = parse_config(ImageProcessor, ['--config-file', str(path), '--cleaning.ids', '3'])
+    assert config == {'cleaning': {'cls': 'BetterCleaning', 'ids': [3]}}
+
+    help_text = build_parser(ImageProcessor, [f'--config-file={path}', '--help']).format_help()
+    assert 'cleaning options (BetterCleaning)' in help_text
+    assert '--cleaning.method' in help_text
+
+    # options take precedence over the config file
+    config = parse_config(ImageProcessor, [
+        '--config-file', str(path), '--cleaning.cls=BasicCleaning', '--cleaning.level=2',
+    ])
+    assert config == {'cleaning': {'cls': 'BasicCleaning', 'level': 2}}
@@ -140,3 +140,309 @@ def test_get_nonabstract_subclasses():
     assert Foo.get_nonabstract_subclasses() == {
         'Foo': Foo, 'Baz': Baz, 'Quuz': Quuz
     }
+
+
+def test_instantiation_plan():
+    from config import Configurable, Int, Float, Object, Path, ConfigurableInstance
+
+    class Sub(Configurable):
+        pass
+
+    class Test(Configurable):
+        val = Int(1)
+        mutable = Object([1, 2])
+        copied = Object((1, 2), copy_default=True)
+        path = Path('foo')
+        sub = ConfigurableInstance(Sub)
+        x = Float(2.0)
+
+    plan = Test.__plan__
+    assert plan.order == ('val', 'mutable', 'copied', 'path', 'sub', 'x')
+    # immutable defaults are shared, even with copy_default
+    assert plan.defaults == {'val': 1, 'copied': (1, 2), 'x': 2.0}
+    assert plan.generic == ('mutable', 'path', 'sub')
+
+    t = Test()
+    assert t.val == 1
+    assert t.x == 2.0
+    assert t.path.is_absolute()
+    assert isinstance(t.sub, Sub)
+
+    t = Test(config={'x': 3.0}, val=5)
+    assert t.val == 5
+    assert t.x == 3.0
+    assert t.mutable == [1, 2]
+
+    # subclasses get their own plan
+    class Test2(Test):
+        y = Int(3)
+
+    assert Test2.__plan__.order[-1] == 'y'
+    assert Test2.__plan__.defaults == {'val': 1, 'copied': (1, 2), 'x': 2.0, 'y': 3}
+
+
+def test_unknown_config_key():
+    from config import Configurable, Int
+
+    class Test(Configurable):
+        val = Int()
+
+    with pytest.raises(ValueError):
+        Test(config={'foo': 1})
+
+    with pytest.raises(TypeError):
+        Test(config=[('val', 1)])
+
+
+def test_subclass_registry():
+    import gc
+    from config import Configurable
+
+    class Foo(Configurable):
+        pass
+
+    class Bar(Foo):
+        pass
+
+    assert Foo.get_nonabstract_subclass('Foo') is Foo
+    assert Foo.get_nonabstract_subclass('Bar') is Bar
+    assert Bar.get_nonabstract_subclass('Bar') is Bar
+    assert Configurable.get_nonabstract_subclass('Bar') is Bar
+
+    # only subclasses are known
+    with pytest.raises(TypeError):
+        Bar.get_nonabstract_subclass('Foo')
+
+    # new subclasses are added when they are defined
+    with pytest.raises(TypeError):
+        Foo.get_nonabstract_subclass('Baz')
+
+    class Baz(Bar):
+        pass
+
+    assert Foo.get_nonabstract_subclass('Baz') is Baz
+    assert Foo.get_nonabstract_subclasses() == {'Foo': Foo, 'Bar': Bar, 'Baz': Baz}
+
+    # the registry does not keep classes alive
+    del Baz
+    gc.collect()
+    with pytest.raises(TypeError):
+        Foo.get_nonabstract_subclass('Baz')
+    assert Foo.get_nonabstract_subclasses() == {'Foo': Foo, 'Bar': Bar}
+
+
+def test_abstract_subclass_not_resolved():
+    from config import Configurable
+    from abc import ABCMeta, abstractmethod
+
+    class Foo(Configurable, metaclass=ABCMeta):
+        @abstractmethod
+        def test(self):
+            pass
+
+    class Bar(Foo):
+        def test(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Foo.get_nonabstract_subclass('Foo')
+
+    assert Foo.get_nonabstract_subclass('Bar') is Bar
+
+
+def test_reconfigure():
+    from config import Configurable, ConfigurableInstance, Int, Float, ConfigError
+
+    class Cleaning(Configurable):
+        level = Float(5.0)
+
+    class BetterCleaning(Cleaning):
+        iterations = Int(3)
+
+    class Processor(Configurable):
+        cleaning = ConfigurableInstance(Cleaning)
+        n_pixels = Int(1855)
+
+    processor = Processor()
+    cleaning = processor.cleaning
+
+    report = processor.reconfigure({'n_pixels': 1855, 'cleaning': {'level': 3}})
+    assert report.changed == ('cleaning.level', )
+    assert report.rebuilt == ()
+    assert report.duration >= 0
+    assert processor.cleaning is cleaning
+    assert cleaning.level == 3.0
+
+    # nothing changed
+    assert processor.reconfigure(processor.get_config()).changed == ()
+
+    report = processor.reconfigure({'cleaning': {'cls': 'BetterCleaning', 'iterations': 5}})
+    assert report.rebuilt == ('cleaning', )
+    assert isinstance(processor.cleaning, BetterCleaning)
+    assert processor.cleaning.iterations == 5
+    # rebuilt subtrees get their config, not the old values
+    assert processor.cleaning.level == 5.0
+
+    # nothing is applied if any value is invalid
+    with pytest.raises(ConfigError):
+        processor.reconfigure({'n_pixels': 5, 'cleaning': {'level': 'foo'}})
+    assert processor.n_pixels == 1855
+
+    with pytest.raises(ValueError):
+        processor.reconfigure({'cleaning': {'foo': 5}})
+
+
+def test_reconfigure_validates_once(tmp_path):
+    from config import Configurable, Path
+
+    validated = []
+
+    class CountingPath(Path):
+        __slots__ = ()
+
+        def validate(self, value):
+            validated.append(value)
+            return super().validate(value)
+
+    class Output(Configurable):
+        path = CountingPath(str(tmp_path))
+
+    output = Output()
+
+    # the config differs from the exported value, but the path is the same
+    validated.clear()
+    assert output.reconfigure({'path': str(tmp_path)}).changed == ()
+
+    validated.clear()
+    assert output.reconfigure({'path': str(tmp_path / 'a')}).changed == ('path', )
+    assert output.path == tmp_path / 'a'
+    assert validated == [str(tmp_path / 'a')]
+
+
+def test_reconfigure_lazy():
+    from config import Configurable, ConfigurableInstance, Int
+
+    class Child(Configurable):
+        value = Int(1)
+
+    class Parent(Configurable):
+        child = ConfigurableInstance(Child, lazy=True)
+
+    parent = Parent()
+    report = parent.reconfigure({'child': {'value': 5}})
+    assert report.changed == ('child.value', )
+    assert 'child' in parent.__dict__
+    assert parent.get_config() == {'child': {'value': 5}}
+    assert parent.child.value == 5
+
+
+def test_get_config_cached(monkeypatch):
+    from config import Configurable, ConfigurableInstance, Int, List
+
+    class Leaf(Configurable):
+        value = Int(1)
+        values = List(Int(), default=[1, 2])
+
+    class Middle(Configurable):
+        leaf = ConfigurableInstance(Leaf)
+        value = Int(2)
+
+    class Root(Configurable):
+        a = ConfigurableInstance(Middle)
+        b = ConfigurableInstance(Middle)
+        lazy = ConfigurableInstance(Leaf, lazy=True)
+
+    exported = []
+    export_config = Configurable._export_config
+
+    def counting_export(self):
+        exported.append(self)
+        return export_config(self)
+
+    monkeypatch.setattr(Configurable, '_export_config', counting_export)
+
+    root = Root()
+    config = root.get_config()
+    assert len(exported) == 5
+
+    # cached, but each call returns a copy
+    exported.clear()
+    config['a']['leaf']['values'].append(3)
+    config2 = root.get_config()
+    assert exported == []
+    assert config2['a']['leaf']['values'] == [1, 2]
+    assert config2['a'] is not config['a']
+
+    # only the changed path is exported again
+    root.a.leaf.value = 5
+    config = root.get_config()
+    assert config['a']['leaf']['value'] == 5
+    assert exported == [root, root.a, root.a.leaf]
+
+    # lazy members created after the export
+    root.lazy.value = 10
+    assert root.get_config()['lazy']['value'] == 10
+
+    # replaced members
+    exported.clear()
+    old = root.b
+    root.b = Middle(value=3)
+    assert root.get_config()['b']['value'] == 3
+    assert exported == [root, root.b, root.b.leaf]
+
+    # changes of the old member do not matter anymore, but are harmless
+    old.value = 7
+    assert root.get_config()['b']['value'] == 3
+
+    # reconfigure
+    root.reconfigure({'a': {'leaf': {'value': 6}}})
+    assert root.get_config()['a']['leaf']['value'] == 6
+
+    # changes in place are not tracked, assigning the value again updates the config
+    root.a.leaf.values.append(3)
+    assert root.get_config()['a']['leaf']['values'] == [1, 2]
+    root.a.leaf.values = root.a.leaf.values
+    assert root.get_config()['a']['leaf']['values'] == [1, 2, 3]
+
+
+def test_base_class_instance():
+    import pickle
+    from config import Configurable, ConfigurableInstance
+
+    base = Configurable()
+    assert base.get_config() == {}
+    assert repr(base) == 'Configurable()'
+    assert type(pickle.loads(pickle.dumps(base))) is Configurable
+
+    class Test(Configurable):
+        member = ConfigurableInstance(Configurable)
+
+    test = Test()
+    assert type(test.member) is Configurable
+    assert test.get_config() == {'member': {}}
+    assert test.fingerprint() == Test().fingerprint()
+
+    # subclasses still have a real __dict__
+    assert type(vars(test)) is dict
+
+
+def test_plan_item_changes():
+    from config import Configurable, ConfigError, Int
+
+    class A(Configurable):
+        x = Int(1)
+
+    class B(A):
+        pass
+
+    A.x.default = 5
+    assert A().x == 5
+    assert B().x == 5
+
+    class C(Configurable):
+        x = Int(None)
+
+    assert C().x is None
+    C.x.allow_none = False
+    with pytest.raises(ConfigError):
+        C()
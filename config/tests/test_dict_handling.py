@@ -36,3 +36,82 @@ def test_recursive_merge_wrong_args():
     with pytest.raises(TypeError):
         # a is a simple value in first dict, but a subdict in the second
         recursive_update({'a': 5}, {'a': {'b': 'c'}})
+
+
+def test_nested_chain_map():
+    from config.dict_handling import NestedChainMap
+
+    high = {'a': {'b': 1}, 'c': 2}
+    low = {'a': {'b': 0, 'd': {'e': 3}}, 'c': 0, 'f': {'g': 4}}
+    config = NestedChainMap(high, low)
+
+    assert config['c'] == 2
+    assert config['a']['b'] == 1
+    assert config['a']['d'] == {'e': 3}
+    assert 'f' in config
+    assert 'x' not in config
+    assert list(config) == ['a', 'c', 'f']
+    assert len(config) == 3
+
+    # single layer values are shared, not copied
+    assert config['f'] is low['f']
+    assert config['a']['d'] is low['a']['d']
+
+    # nested views are created once
+    assert isinstance(config['a'], NestedChainMap)
+    assert config['a'] is config['a']
+
+    with pytest.raises(KeyError):
+        config['x']
+
+    assert config.get('x') is None
+    assert config == {'a': {'b': 1, 'd': {'e': 3}}, 'c': 2, 'f': {'g': 4}}
+    assert config.to_dict() == {'a': {'b': 1, 'd': {'e': 3}}, 'c': 2, 'f': {'g': 4}}
+    assert type(config.to_dict()['a']) is dict
+
+    # a non-mapping value shadows lower layers
+    config = NestedChainMap({'a': 5}, {'a': {'b': 1}})
+    assert config['a'] == 5
+    config = NestedChainMap({'a': {'b': 1}}, {'a': 5}, {'a': {'c': 2}})
+    assert config['a'] == {'b': 1}
+
+    # inputs are not modified
+    assert high == {'a': {'b': 1}, 'c': 2}
+
+    with pytest.raises(TypeError):
+        NestedChainMap({}, [])
+
+
+def test_nested_chain_map_config():
+    from config import Configurable, ConfigurableInstance, Int, Float, Lookup
+    from config.dict_handling import NestedChainMap
+
+    class Cleaning(Configurable):
+        level = Lookup(Float(5.0), ('type', 'id'))
+        min_pixels = Int(3)
+
+    class TimeCleaning(Cleaning):
+        time = Float(2.0)
+
+    class Processor(Configurable):
+        n_jobs = Int(1)
+        cleaning = ConfigurableInstance(Cleaning)
+
+    base = {
+        'n_jobs': 2,
+        'cleaning': {'level': {'default': 6.0, 'lookups': [('type', 'LST', 7.0)]}, 'min_pixels': 4},
+    }
+    overrides = {'cleaning': {'cls': 'TimeCleaning', 'time': 3.0}}
+    config = NestedChainMap(overrides, base)
+
+    processor = Processor(config=config)
+    assert processor.n_jobs == 2
+    assert type(processor.cleaning) is TimeCleaning
+    assert processor.cleaning.time == 3.0
+    assert processor.cleaning.min_pixels == 4
+    assert processor.cleaning.level['LST', 1] == 7.0
+    assert processor.cleaning.level['MST', 1] == 6.0
+
+    cleaning = Processor.cleaning.from_config(config['cleaning'])
+    assert type(cleaning) is TimeCleaning
+    assert cleaning.time == 3.0
@@ -0,0 +1,154 @@
+from array import array
+from pathlib import Path as PathLib
+
+import numpy as np
+import pytest
+
+from config import Configurable, ConfigurableInstance, Float, List, Lookup, Path, String
+
+
+class Cleaning(Configurable):
+    level = Lookup(Float(5.0), ('type', 'id'))
+
+
+class TailcutsCleaning(Cleaning):
+    pass
+
+
+class Processor(Configurable):
+    cleaning = ConfigurableInstance(Cleaning)
+    lazy_cleaning = ConfigurableInstance(Cleaning, lazy=True)
+    scales = List(Float(), default=[1.0, 2.0])
+    output = Path('out.h5')
+    name = String('test')
+
+
+def test_encode():
+    from config.fingerprint import encode
+
+    # type tagged, so equal python values of different type differ
+    assert encode(1) != encode(1.0) != encode('1') != encode(True)
+    assert encode([1, 2]) != encode([[1, 2]])
+    assert encode(['ab']) != encode(['a', 'b'])
+
+    # independent of order of dicts and sets
+    assert encode({'a': 1, 'b': 2}) == encode({'b': 2, 'a': 1})
+    assert encode({3, 'a', 1.0}) == encode({1.0, 'a', 3})
+
+    assert encode(PathLib('a/b')) != encode('a/b')
+    assert encode(array('d', [1, 2])) != encode(array('q', [1, 2]))
+
+    # independent of memory layout and byte order
+    a = np.arange(6, dtype=np.float64).reshape(2, 3)
+    assert encode(a) == encode(np.asfortranarray(a))
+    assert encode(a) == encode(a.astype('>f8'))
+    assert encode(a) != encode(a.reshape(3, 2))
+    assert encode(a) != encode(a.astype(np.float32))
+
+    with pytest.raises(TypeError):
+        encode(object())
+
+
+def test_fingerprint():
+    p1 = Processor()
+    p2 = Processor(config={'lazy_cleaning': {}})
+    assert p1.fingerprint() == p2.fingerprint()
+    assert len(p1.fingerprint()) == 64
+
+    p2.name = 'other'
+    assert p1.fingerprint() != p2.fingerprint()
+    p2.name = 'test'
+    assert p1.fingerprint() == p2.fingerprint()
+
+    p2.output = 'out2.h5'
+    assert p1.fingerprint() != p2.fingerprint()
+
+
+def test_fingerprint_members():
+    p1 = Processor()
+    p2 = Processor(config={'cleaning': {'cls': 'TailcutsCleaning'}})
+    # same values, but a subclass
+    assert p1.fingerprint() != p2.fingerprint()
+
+    p3 = Processor(config={'cleaning': {'level': {'lookups': [('type', 'LST', 3.0)]}}})
+    assert p1.fingerprint() != p3.fingerprint()
+
+    # changes of members change the fingerprint of the parent
+    before = p1.fingerprint()
+    p1.cleaning.level = 3.0
+    assert p1.fingerprint() != before
+
+    # lazy members hash the same before and after creation
+    before = p1.fingerprint()
+    assert p1.lazy_cleaning.level['LST', 1] == 5.0
+    assert p1.fingerprint() == before
+    p1.lazy_cleaning.level = 1.0
+    assert p1.fingerprint() != before
+
+
+def test_fingerprint_lookup():
+    item = Float(1.0)
+
+    from config import LookupDatabase
+    db = LookupDatabase(item, ('type', 'id'), lookups=[('type', 'LST', 2.0), ('id', 1, 3.0)])
+    same = LookupDatabase(item, ('type', 'id'), lookups=[('type', 'LST', 2.0), ('id', 1, 3.0)])
+    assert db.fingerprint() == same.fingerprint()
+
+    # the first rule of a level wins, so the order matters
+    swapped = LookupDatabase(item, ('type', 'id'), lookups=[('type', 'LST', 2.0), ('type', 'LST', 3.0)])
+    reordered = LookupDatabase(item, ('type', 'id'), lookups=[('type', 'LST', 3.0), ('type', 'LST', 2.0)])
+    assert swapped.fingerprint() != reordered.fingerprint()
+    assert db.fingerprint() != LookupDatabase(item, ('type', 'id'), default=2.0).fingerprint()
+
+
+def test_fingerprint_arrays():
+    from config import Object
+
+    class Calibration(Configurable):
+        gains = Object(np.ones(3))
+
+    a = Calibration()
+    b = Calibration()
+    assert a.fingerprint() == b.fingerprint()
+    b.gains = np.array([1.0, 1.0, 2.0])
+    assert a.fingerprint() != b.fingerprint()
+
+
+def test_fingerprint_cached(monkeypatch):
+    p = Processor()
+    p.fingerprint()
+
+    hashed = []
+    original = Configurable._compute_fingerprint
+
+    def compute(self):
+        hashed.append(type(self).__name__)
+        return original(self)
+
+    monkeypatch.setattr(Configurable, '_compute_fingerprint', compute)
+
+    before = p.fingerprint()
+    assert hashed == []
+
+    # only the changed path is hashed again, not the unchanged member
+    p.name = 'changed'
+    assert p.fingerprint() != before
+    assert hashed == ['Processor']
+
+    hashed.clear()
+    p.cleaning.level = 3.0
+    p.fingerprint()
+    assert hashed == ['Processor', 'Cleaning']
+
+
+def test_fingerprint_in_place_changes():
+    p = Processor()
+    before = p.fingerprint()
+
+    # not tracked, the cached fingerprint is kept
+    p.scales.append(3.0)
+    assert p.fingerprint() == before
+
+    p.scales = p.scales
+    assert p.fingerprint() != before
+    assert p.fingerprint() == Processor(scales=[1.0, 2.0, 3.0]).fingerprint()
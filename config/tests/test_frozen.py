@@ -0,0 +1,117 @@
+from array import array
+from copy import deepcopy
+
+import pytest
+
+
+def test_freeze():
+    from config.frozen import freeze, FrozenDict, is_immutable
+
+    value = {'a': [1, 2], 'b': {'c': {3}}, 'd': array('d', [1.0])}
+    frozen = freeze(value)
+
+    assert isinstance(frozen, FrozenDict)
+    assert frozen == {'a': (1, 2), 'b': {'c': frozenset({3})}, 'd': (1.0, )}
+    assert is_immutable(frozen)
+    assert hash(frozen) == hash(freeze(value))
+
+    # original is not affected
+    assert value['a'] == [1, 2]
+
+    with pytest.raises(TypeError):
+        frozen['a'] = 5
+
+    assert freeze(frozen) is frozen
+    assert deepcopy(frozen) is frozen
+
+    with pytest.raises(TypeError):
+        freeze(object())
+
+
+def test_freeze_numpy():
+    from config.frozen import freeze, is_immutable
+    np = pytest.importorskip('numpy')
+
+    value = np.arange(5)
+    assert not is_immutable(value)
+
+    frozen = freeze(value)
+    assert is_immutable(frozen)
+    assert not np.shares_memory(frozen, value)
+    with pytest.raises(ValueError):
+        frozen[0] = 1
+
+    # a read-only view is not immutable, its base can still change
+    view = value[:]
+    view.setflags(write=False)
+    assert not is_immutable(view)
+
+
+def test_frozen_default():
+    from config import Configurable, Object
+
+    coefficients = {'gain': [1.0] * 100, 'pedestal': {'low': 1, 'high': 2}}
+
+    class Test(Configurable):
+        copied = Object(coefficients, copy_default=True)
+        frozen = Object(coefficients, freeze_default=True)
+
+    t1 = Test()
+    t2 = Test()
+
+    assert t1.copied == coefficients
+    assert t1.copied is not t2.copied
+
+    assert t1.frozen['gain'] == tuple(coefficients['gain'])
+    assert t1.frozen['pedestal'] == coefficients['pedestal']
+    assert t1.frozen is t2.frozen
+    assert 'frozen' in Test.__plan__.defaults
+
+
+def test_frozen_default_config():
+    import json
+    from config import Configurable, ConfigError, Object
+
+    class Test(Configurable):
+        frozen = Object({'gain': [1.0, 2.0], 'pedestal': {'low': 1}}, freeze_default=True)
+
+    t = Test()
+    config = t.get_config()
+    assert config['frozen'] == {'gain': [1.0, 2.0], 'pedestal': {'low': 1}}
+    assert json.loads(json.dumps(config)) == config
+    assert Test(config=config).get_config() == config
+
+    class Dict(Object):
+        __slots__ = ()
+        type = dict
+
+    with pytest.raises(ConfigError, match='freeze_default'):
+        Dict({'a': 1}, freeze_default=True)
+
+
+def test_frozen_default_containers():
+    import json
+    from config import Configurable, Dict, Float, List, Set, String
+
+    class Test(Configurable):
+        gains = List(Float(), default=[1.0, 2.0], freeze_default=True)
+        names = Set(String(), default={'a', 'b'}, freeze_default=True)
+        pedestals = Dict(List(Float()), default={'low': [1.0]}, freeze_default=True)
+
+    t1 = Test()
+    t2 = Test()
+    for name in ('gains', 'names', 'pedestals'):
+        assert getattr(t1, name) is getattr(t2, name)
+        assert name in Test.__plan__.defaults
+
+    assert t1.gains == (1.0, 2.0)
+    assert t1.pedestals['low'] == (1.0, )
+
+    config = t1.get_config()
+    assert config == {'gains': [1.0, 2.0], 'names': ['a', 'b'], 'pedestals': {'low': [1.0]}}
+    assert json.loads(json.dumps(config)) == config
+
+    # values from a config are mutable as usual
+    t3 = Test(config=config)
+    t3.gains.append(3.0)
+    assert t1.gains == (1.0, 2.0)
@@ -0,0 +1,147 @@
+import json
+import pytest
+
+
+def test_merge():
+    from config.loader import merge
+
+    assert merge({}, {}) == {}
+    assert merge({'a': 1}, {'a': 2, 'b': 3}) == {'a': 2, 'b': 3}
+
+    base = {'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': 3}}
+    override = {'a': {'b': 5}}
+    merged = merge(base, override)
+    assert merged == {'a': {'b': 5, 'c': {'d': 2}}, 'e': {'f': 3}}
+
+    # inputs are not modified, untouched subtrees are shared
+    assert base == {'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': 3}}
+    assert override == {'a': {'b': 5}}
+    assert merged['e'] is base['e']
+    assert merged['a']['c'] is base['a']['c']
+
+    # mappings and other values replace each other
+    assert merge({'a': 5}, {'a': {'b': 1}}) == {'a': {'b': 1}}
+    assert merge({'a': {'b': 1}}, {'a': 5}) == {'a': 5}
+
+    with pytest.raises(TypeError):
+        merge({}, [])
+
+
+def test_file_source(tmp_path):
+    from config.loader import FileSource
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'a': {'b': 1}}))
+
+    source = FileSource(path)
+    assert source.format == 'json'
+    config = source.load()
+    assert config == {'a': {'b': 1}}
+
+    # parsed only once
+    assert source.load() is config
+
+    # but again after the file changed
+    path.write_text(json.dumps({'a': {'b': 20}}))
+    assert source.load() == {'a': {'b': 20}}
+
+    with pytest.raises(FileNotFoundError):
+        FileSource(tmp_path / 'missing.json').load()
+
+    assert FileSource(tmp_path / 'missing.json', optional=True).load() == {}
+
+    with pytest.raises(ValueError):
+        FileSource(tmp_path / 'config.ini')
+
+    path = tmp_path / 'list.json'
+    path.write_text('[1, 2]')
+    with pytest.raises(ValueError):
+        FileSource(path).load()
+
+
+def test_file_formats(tmp_path):
+    from config.loader import FileSource
+
+    pytest.importorskip('yaml')
+    for name in ('config.yaml', 'config.yml'):
+        path = tmp_path / name
+        path.write_text('a:\n  b: 1\n')
+        assert FileSource(path).load() == {'a': {'b': 1}}
+
+    path = tmp_path / 'empty.yaml'
+    path.write_text('')
+    assert FileSource(path).load() == {}
+
+    path = tmp_path / 'config.toml'
+    path.write_text('[a]\nb = 1\n')
+    try:
+        assert FileSource(path).load() == {'a': {'b': 1}}
+    except ImportError:
+        pytest.skip('No toml parser available')
+
+
+def test_env_source():
+    from config.loader import EnvSource
+
+    environ = {
+        'MYAPP_CLEANING__LEVEL': '5.0',
+        'MYAPP_CLEANING__CLS': 'TailCutsCleaning',
+        'MYAPP_N_JOBS': '4',
+        'OTHER': '1',
+    }
+    assert EnvSource('MYAPP_', environ=environ).load() == {
+        'cleaning': {'level': 5.0, 'cls': 'TailCutsCleaning'},
+        'n_jobs': 4,
+    }
+
+    with pytest.raises(ValueError):
+        EnvSource('MYAPP_', environ={'MYAPP_A': '1', 'MYAPP_A__B': '2'}).load()
+
+
+def test_loader(tmp_path):
+    from config import Configurable, ConfigurableInstance, Int, Float
+    from config.loader import ConfigLoader, EnvSource, FileSource, load_config
+
+    class Cleaning(Configurable):
+        level = Float(5.0)
+        min_pixels = Int(3)
+
+    class Processor(Configurable):
+        n_jobs = Int(1)
+        cleaning = ConfigurableInstance(Cleaning)
+
+    system = tmp_path / 'system.json'
+    system.write_text(json.dumps({'n_jobs': 2, 'cleaning': {'level': 6.0, 'min_pixels': 4}}))
+    user = tmp_path / 'user.json'
+    user.write_text(json.dumps({'cleaning': {'level': 7.0}}))
+
+    loader = ConfigLoader(
+        {'n_jobs': 8},
+        str(system),
+        FileSource(user),
+        FileSource(tmp_path / 'missing.json', optional=True),
+        EnvSource('MYAPP_', environ={'MYAPP_CLEANING__MIN_PIXELS': '10'}),
+        {'n_jobs': 16},
+    )
+    config = loader.load()
+    assert config == {'n_jobs': 16, 'cleaning': {'level': 7.0, 'min_pixels': 10}}
+
+    processor = Processor(config=config)
+    assert processor.n_jobs == 16
+    assert processor.cleaning.level == 7.0
+    assert processor.cleaning.min_pixels == 10
+
+    assert load_config({'a': 1}, {'b': 2}) == {'a': 1, 'b': 2}
+
+
+def test_loader_view(tmp_path):
+    from config.dict_handling import NestedChainMap
+    from config.loader import ConfigLoader
+
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'a': {'b': 1, 'c': 2}}))
+
+    loader = ConfigLoader({'a': {'b': 0}, 'd': 4}, path, {'a': {'c': 3}})
+    view = loader.view()
+    assert isinstance(view, NestedChainMap)
+    assert view == loader.load() == {'a': {'b': 1, 'c': 3}, 'd': 4}
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+
+def make_classes():
+    from config import Configurable, ConfigurableInstance, Float, Int, List
+
+    class Cleaning(Configurable):
+        level = Float(5.0)
+        ids = List(Int(), default=[1, 2])
+
+    class Processor(Configurable):
+        cleaning = ConfigurableInstance(Cleaning)
+        n_pixels = Int(1855)
+
+    return Processor
+
+
+def test_profiler():
+    from config import profiling
+    from config.profiling import Profiler
+
+    Processor = make_classes()
+
+    with Profiler() as profiler:
+        assert profiling._active is profiler
+        Processor(config={'n_pixels': 10})
+        Processor(config={'cleaning': {'level': 3.0}})
+
+    assert profiling._active is None
+
+    stats = {(e.path, e.kind): e.calls for e in profiler.entries()}
+    assert stats[('Processor', '__init__')] == 2
+    assert stats[('Processor.n_pixels', 'from_config')] == 1
+    # shared immutable defaults are stored without any call
+    assert ('Processor.n_pixels', 'get_default') not in stats
+    assert stats[('Processor.n_pixels', 'validate')] == 1
+    assert stats[('Processor.cleaning', 'from_config')] == 1
+    assert stats[('Processor.cleaning', 'get_default')] == 1
+    assert stats[('Processor.cleaning', '__init__')] == 2
+    assert stats[('Processor.cleaning.level', 'validate')] == 1
+    assert stats[('Processor.cleaning.ids', 'get_default')] == 2
+
+    # nothing recorded after the profiler is disabled
+    Processor()
+    assert {(e.path, e.kind): e.calls for e in profiler.entries()} == stats
+
+    entries = profiler.entries(sort='total')
+    assert entries[0].path == 'Processor'
+    assert [e.total for e in entries] == sorted((e.total for e in entries), reverse=True)
+
+    table = profiler.table(limit=3)
+    assert len(table.splitlines()) == 4
+    assert 'Processor' in table
+
+    with pytest.raises(ValueError):
+        profiler.entries(sort='foo')
+
+
+def test_profiler_nested_activation():
+    from config.profiling import Profiler
+
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            with Profiler():
+                pass
+
+
+def test_chrome_trace(tmp_path):
+    from config.profiling import Profiler
+
+    Processor = make_classes()
+    with Profiler() as profiler:
+        Processor()
+
+    path = tmp_path / 'trace.json'
+    profiler.write_chrome_trace(path)
+    trace = json.loads(path.read_text())
+
+    events = trace['traceEvents']
+    assert {e['ph'] for e in events} == {'X'}
+    root = [e for e in events if e['name'] == 'Processor'][0]
+    assert root['cat'] == '__init__'
+
+    # all other calls happen during the outer __init__
+    for event in events:
+        assert root['ts'] <= event['ts']
+        assert event['ts'] + event['dur'] <= root['ts'] + root['dur'] + 1e-3
@@ -0,0 +1,138 @@
+import pickle
+
+import pytest
+
+from config import (
+    Configurable, ConfigurableInstance, ConfigError, Float, Int, Lookup, slotted,
+)
+
+
+@slotted
+class Cleaning(Configurable):
+    level = Lookup(Float(5.0), ('type', 'id'))
+
+
+@slotted
+class TailcutsCleaning(Cleaning):
+    picture = Float(10.0)
+
+
+@slotted
+class Telescope(Configurable):
+    # __init__ sets an attribute that is not an item
+    __slots__ = ('initialized', )
+
+    tel_id = Int(1)
+    focal_length = Float(28.0)
+    cleaning = ConfigurableInstance(Cleaning)
+    lazy_cleaning = ConfigurableInstance(Cleaning, lazy=True)
+
+    def __init__(self, config=None, **kwargs):
+        super().__init__(config=config, **kwargs)
+        self.initialized = True
+
+
+def test_slotted():
+    telescope = Telescope(config={'tel_id': 5, 'cleaning': {'cls': 'TailcutsCleaning'}})
+    assert not isinstance(vars(telescope), dict)
+    assert telescope.initialized
+    assert telescope.tel_id == 5
+    assert telescope.focal_length == 28.0
+    assert isinstance(telescope.cleaning, TailcutsCleaning)
+
+    # items are still accessible on the class
+    assert isinstance(Telescope.tel_id, Int)
+    assert Telescope.tel_id.configurable() is Telescope
+    assert list(TailcutsCleaning.__config__) == ['level', 'picture']
+    assert Cleaning.get_nonabstract_subclass('TailcutsCleaning') is TailcutsCleaning
+
+    with pytest.raises(ConfigError):
+        telescope.tel_id = 'foo'
+    with pytest.raises(AttributeError):
+        telescope.foo = 1
+
+    assert repr(telescope).startswith('Telescope(tel_id=5, focal_length=28.0')
+
+
+def test_slotted_get_config():
+    telescope = Telescope()
+    config = telescope.get_config()
+    assert config['tel_id'] == 1
+    assert config['lazy_cleaning'].keys() == {'level'}
+
+    telescope.cleaning.level = 2.0
+    assert telescope.get_config()['cleaning']['level'] is telescope.cleaning.level
+
+    # lazy members are created on access
+    assert telescope.lazy_cleaning.level['LST', 1] == 5.0
+    assert isinstance(vars(telescope)['lazy_cleaning'], Cleaning)
+
+    report = telescope.reconfigure({'tel_id': 3, 'cleaning': {'cls': 'TailcutsCleaning'}})
+    assert report.changed == ('tel_id', )
+    assert telescope.tel_id == 3
+    assert isinstance(telescope.cleaning, TailcutsCleaning)
+
+    assert telescope.fingerprint() == Telescope(
+        tel_id=3, cleaning=TailcutsCleaning(), lazy_cleaning=Cleaning(),
+    ).fingerprint()
+
+
+def test_slotted_pickle():
+    telescope = Telescope(tel_id=2)
+    telescope.get_config()
+    loaded = pickle.loads(pickle.dumps(telescope))
+    assert type(loaded) is Telescope
+    assert loaded.tel_id == 2
+    assert loaded.fingerprint() == telescope.fingerprint()
+    assert loaded.cleaning.level['LST', 1] == 5.0
+
+
+def test_slotted_subclass():
+    class Undecorated(Cleaning):
+        pass
+
+    with pytest.raises(TypeError, match='slotted'):
+        Undecorated()
+
+    class Unslotted(Configurable):
+        value = Int(1)
+
+    with pytest.raises(TypeError, match='must be slotted'):
+        @slotted
+        class Child(Unslotted):
+            pass
+
+    with pytest.raises(TypeError):
+        slotted(int)
+
+    # __slots__ without the decorator leaves no place for the values
+    class Undeclared(Configurable):
+        __slots__ = ()
+        value = Int(1)
+
+    with pytest.raises(TypeError, match='slotted'):
+        Undeclared(value=5)
+
+
+def test_slotted_custom_set():
+    class Recording(Float):
+        def __set__(self, instance, value):
+            instance.recorded.append(value)
+            super().__set__(instance, value)
+
+    @slotted
+    class Test(Configurable):
+        __slots__ = ('recorded', )
+
+        value = Recording(1.0)
+
+        def __init__(self, **kwargs):
+            self.recorded = []
+            super().__init__(**kwargs)
+
+    test = Test(value=2)
+    test.get_config()
+    test.value = 3.0
+    assert test.recorded == [2, 3.0]
+    assert test.get_config() == {'value': 3.0}
+    assert set(vars(test)) == {'__config_export__', 'value'}
@@ -0,0 +1,184 @@
+import sys
+import threading
+
+from config import Configurable, ConfigurableInstance, Float, Int, Lookup
+
+
+class Cleaning(Configurable):
+    level = Lookup(Float(0.0), ('type', 'id'), cache_size=16)
+    picture = Float(0.0)
+    boundary = Float(0.0)
+
+
+class Processor(Configurable):
+    cleaning = ConfigurableInstance(Cleaning)
+    version = Int(0)
+
+
+def make_config(version):
+    return {
+        'version': version,
+        'cleaning': {
+            'level': {'default': float(version), 'lookups': [('type', 'LST', float(version))]},
+            'picture': float(version),
+            'boundary': 2.0 * version,
+        },
+    }
+
+
+def test_lookups_while_reconfiguring():
+    processor = Processor(config=make_config(0))
+    n_versions = 200
+    n_readers = 8
+    errors = []
+    done = threading.Event()
+
+    def read():
+        try:
+            seen = 0
+            while not done.is_set() or seen == 0:
+                cleaning = processor.cleaning
+                # more keys than cache entries, so entries are evicted all the time
+                for tel_id in range(64):
+                    level = cleaning.level['LST' if tel_id % 2 else 'MST', tel_id]
+                    assert 0 <= level < n_versions
+
+                # a single instance is always seen in a consistent state
+                values = vars(cleaning)
+                assert values['boundary'] == 2.0 * values['picture']
+                seen += 1
+        except Exception as e:
+            errors.append(e)
+
+    def write():
+        try:
+            for version in range(1, n_versions):
+                processor.reconfigure(make_config(version))
+        except Exception as e:
+            errors.append(e)
+        finally:
+            done.set()
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=read) for _ in range(n_readers)]
+        threads.append(threading.Thread(target=write))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert processor.version == n_versions - 1
+    assert processor.cleaning.level['LST', 1] == n_versions - 1
+
+
+def test_lru_cache_threads():
+    from config.items.lookup import LRUCache
+
+    cache = LRUCache(8)
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(20000):
+                key = (i + offset) % 32
+                value = cache.get(key)
+                if value is None:
+                    cache.put(key, key)
+                else:
+                    assert value == key
+                if i % 5000 == 0:
+                    cache.clear()
+        except Exception as e:
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=work, args=(i, )) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(cache) <= 8
+
+
+def test_lru_cache_concurrent_eviction():
+    from collections import OrderedDict
+    from config.items.lookup import LRUCache
+
+    class EvictingDict(OrderedDict):
+        '''Simulates another thread evicting entries right after they are read'''
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            self.pop(key, None)
+            return value
+
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache._data = EvictingDict(cache._data)
+    assert cache.get('a') == 1
+    assert cache.get('a') is None
+
+
+def test_reconfigure_publishes_at_once():
+    from config import Float
+
+    instances = []
+    seen = []
+
+    class Recording(Float):
+        def __set__(self, instance, value):
+            # state visible to readers while the change is applied
+            if instances:
+                seen.append(dict(vars(instances[0])))
+            super().__set__(instance, value)
+
+    class Test(Configurable):
+        a = Recording(1.0)
+        b = Recording(2.0)
+
+    instances.append(Test())
+    report = instances[0].reconfigure({'a': 3.0, 'b': 4.0})
+    assert report.changed == ('a', 'b')
+    assert seen == [{'a': 1.0, 'b': 2.0}, {'a': 1.0, 'b': 2.0}]
+    assert vars(instances[0]) == {'a': 3.0, 'b': 4.0}
+
+
+def test_reconfigure_export_while_staging():
+    from config import Float
+
+    readers = []
+
+    class Reading(Float):
+        def __set__(self, instance, value):
+            # a reader exporting the live tree while the change is staged
+            for reader in readers:
+                reader.get_config()
+                reader.fingerprint()
+            super().__set__(instance, value)
+
+    class Child(Configurable):
+        y = Reading(0.0)
+
+    class Parent(Configurable):
+        child = ConfigurableInstance(Child)
+        x = Reading(0.0)
+
+    parent = Parent()
+    readers.extend([parent, parent.child])
+    before = parent.fingerprint()
+
+    parent.reconfigure({'child': {'y': 5.0}, 'x': 2.0})
+    assert parent.child.get_config() == {'y': 5.0}
+    assert parent.get_config() == {'child': {'y': 5.0}, 'x': 2.0}
+    assert parent.fingerprint() == Parent(config={'child': {'y': 5.0}, 'x': 2.0}).fingerprint()
+    assert parent.fingerprint() != before
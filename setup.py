@@ -3,6 +3,9 @@ from setuptools import setup
 
 extras_require = {
     "astropy": ["astropy"],
+    "numpy": ["numpy"],
+    "toml": ['tomli; python_version < "3.11"'],
+    "yaml": ["pyyaml"],
     "tests": ["pytest", "pytest-cov"],
 }
 